@@ -186,14 +186,17 @@ def extractenvironments(output_json_path, project, asset, task, app, envgroup):
               multiple=True)
 @click.option("-g", "--gui", is_flag=True,
               help="Show Publish UI", default=False)
-def publish(paths, targets, gui):
+@click.option("--settings-snapshot",
+              help="Settings snapshot file used instead of querying settings",
+              default=None)
+def publish(paths, targets, gui, settings_snapshot):
     """Start CLI publishing.
 
     Publish collects json from paths provided as an argument.
     More than one path is allowed.
     """
 
-    PypeCommands.publish(list(paths), targets, gui)
+    PypeCommands.publish(list(paths), targets, gui, settings_snapshot)
 
 
 @main.command(context_settings={"ignore_unknown_options": True})
@@ -58,6 +58,16 @@ from .operations import (
     create_project,
 )
 
+from .representation_files import (
+    is_sequence_file_info,
+    get_file_info_frames,
+    get_file_info_paths,
+    get_file_infos_count,
+    expand_file_infos,
+    compact_file_infos,
+    set_file_info_path,
+)
+
 
 __all__ = (
     "OpenPypeMongoConnection",
@@ -111,5 +121,13 @@ __all__ = (
 
     "create_project",
 
+    "is_sequence_file_info",
+    "get_file_info_frames",
+    "get_file_info_paths",
+    "get_file_infos_count",
+    "expand_file_infos",
+    "compact_file_infos",
+    "set_file_info_path",
+
     "get_asset_name_identifier",
 )
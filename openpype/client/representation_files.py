@@ -0,0 +1,244 @@
+"""Helpers for 'files' of representation documents.
+
+File info of representation describes single published file. Frame
+sequences can be stored in compact form as single file info with
+'sequence' key, which contains data needed to compute path of each frame.
+
+Example of compact file info:
+    {
+        "_id": ObjectId("..."),
+        "path": "{root[work]}/.../renderMain.1001.exr",
+        "size": 1234567,
+        "hash": "renderMain,1001,exr|1690000000,0|12345",
+        "sites": [{"name": "studio", "created_dt": ...}],
+        "sequence": {
+            "head": "{root[work]}/.../renderMain.",
+            "tail": ".exr",
+            "padding": 4,
+            "frameStart": 1001,
+            "frameEnd": 1100,
+            "missingFrames": [1050]
+        }
+    }
+
+Key 'path' contains path of first frame, 'size' is size of all frames and
+'hash' is hash of first frame. Functions 'expand_file_infos' and
+'get_file_info_paths' should be used by code which needs path of each file.
+"""
+
+import clique
+
+SEQUENCE_KEY = "sequence"
+
+
+def is_sequence_file_info(file_info):
+    """File info describes frame sequence in compact form.
+
+    Args:
+        file_info (dict[str, Any]): File info from representation document.
+
+    Returns:
+        bool: File info is in compact form.
+    """
+    return bool(file_info.get(SEQUENCE_KEY))
+
+
+def get_file_info_frames(file_info):
+    """Frames stored in compact file info.
+
+    Args:
+        file_info (dict[str, Any]): File info from representation document.
+
+    Returns:
+        list[int]: Frames of sequence. Empty list for file info which is not
+            in compact form.
+    """
+    sequence = file_info.get(SEQUENCE_KEY)
+    if not sequence:
+        return []
+    missing_frames = set(sequence.get("missingFrames") or [])
+    return [
+        frame
+        for frame in range(sequence["frameStart"], sequence["frameEnd"] + 1)
+        if frame not in missing_frames
+    ]
+
+
+def _format_frame_path(sequence, frame):
+    return "{}{:0>{}}{}".format(
+        sequence["head"], frame, sequence["padding"], sequence["tail"]
+    )
+
+
+def get_file_info_paths(file_info):
+    """Paths of all files described by file info.
+
+    Args:
+        file_info (dict[str, Any]): File info from representation document.
+
+    Returns:
+        list[str]: Paths of files. Single path for file info which is not
+            in compact form.
+    """
+    sequence = file_info.get(SEQUENCE_KEY)
+    if not sequence:
+        return [file_info.get("path", "")]
+    return [
+        _format_frame_path(sequence, frame)
+        for frame in get_file_info_frames(file_info)
+    ]
+
+
+def get_file_infos_count(file_infos):
+    """Number of files described by file infos.
+
+    Compact file info is counted as number of its frames.
+
+    Args:
+        file_infos (Iterable[dict[str, Any]]): File infos from representation
+            document.
+
+    Returns:
+        int: Number of files.
+    """
+    count = 0
+    for file_info in file_infos:
+        if is_sequence_file_info(file_info):
+            count += len(get_file_info_frames(file_info))
+        else:
+            count += 1
+    return count
+
+
+def expand_file_infos(file_infos):
+    """Convert compact file infos to file info per frame.
+
+    Expanded file infos share '_id' and 'sites' of the compact file info.
+    Size of sequence is split between frames and only first frame has hash.
+
+    Args:
+        file_infos (Iterable[dict[str, Any]]): File infos from representation
+            document.
+
+    Returns:
+        list[dict[str, Any]]: File infos with file info per frame.
+    """
+    output = []
+    for file_info in file_infos:
+        if not is_sequence_file_info(file_info):
+            output.append(file_info)
+            continue
+
+        paths = get_file_info_paths(file_info)
+        size, remainder = divmod(file_info.get("size") or 0, len(paths))
+        for idx, path in enumerate(paths):
+            new_file_info = {
+                key: value
+                for key, value in file_info.items()
+                if key != SEQUENCE_KEY
+            }
+            new_file_info["path"] = path
+            new_file_info["size"] = size
+            if idx == 0:
+                new_file_info["size"] += remainder
+            else:
+                new_file_info["hash"] = None
+            output.append(new_file_info)
+    return output
+
+
+def compact_file_infos(file_infos, min_frames=2):
+    """Replace file infos of frame sequences with compact file info.
+
+    Only files with '.<frame>.<ext>' pattern in path and same sites are
+    grouped to a sequence.
+
+    Args:
+        file_infos (Iterable[dict[str, Any]]): File infos with file info per
+            file.
+        min_frames (Optional[int]): Minimum number of frames of sequence
+            which is converted to compact form.
+
+    Returns:
+        list[dict[str, Any]]: File infos where sequences are in compact form.
+    """
+    file_infos = list(file_infos)
+    file_infos_by_path = {
+        file_info["path"]: file_info
+        for file_info in file_infos
+        if not is_sequence_file_info(file_info)
+    }
+    collections, _ = clique.assemble(
+        list(file_infos_by_path.keys()),
+        patterns=[clique.PATTERNS["frames"]],
+        minimum_items=max(2, min_frames)
+    )
+
+    compact_by_first_path = {}
+    skipped_paths = set()
+    for collection in collections:
+        frames = sorted(collection.indexes)
+        sequence_infos = [file_infos_by_path[path] for path in collection]
+        first_info = sequence_infos[0]
+        sites = first_info.get("sites")
+        if any(
+            file_info.get("sites") != sites
+            for file_info in sequence_infos
+        ):
+            continue
+
+        all_frames = set(range(frames[0], frames[-1] + 1))
+        compact_info = dict(first_info)
+        compact_info["size"] = sum(
+            file_info.get("size") or 0
+            for file_info in sequence_infos
+        )
+        compact_info[SEQUENCE_KEY] = {
+            "head": collection.head,
+            "tail": collection.tail,
+            "padding": collection.padding,
+            "frameStart": frames[0],
+            "frameEnd": frames[-1],
+            "missingFrames": sorted(all_frames - set(frames)),
+        }
+        compact_by_first_path[first_info["path"]] = compact_info
+        skipped_paths |= {file_info["path"] for file_info in sequence_infos}
+
+    output = []
+    for file_info in file_infos:
+        path = file_info.get("path")
+        if path in compact_by_first_path:
+            output.append(compact_by_first_path[path])
+        elif path not in skipped_paths:
+            output.append(file_info)
+    return output
+
+
+def set_file_info_path(file_info, path):
+    """Change path of file info.
+
+    For compact file info is 'path' path of first frame, and head and tail
+    of sequence are changed to match the new path.
+
+    Args:
+        file_info (dict[str, Any]): File info from representation document.
+        path (str): New path of file or first frame of sequence.
+
+    Raises:
+        ValueError: Path of sequence does not contain first frame.
+    """
+    sequence = file_info.get(SEQUENCE_KEY)
+    if sequence:
+        frame_str = "{:0>{}}".format(
+            sequence["frameStart"], sequence["padding"]
+        )
+        idx = path.rfind(frame_str)
+        if idx < 0:
+            raise ValueError(
+                "Path \"{}\" does not contain frame \"{}\"".format(
+                    path, frame_str
+                )
+            )
+        sequence["head"] = path[:idx]
+        sequence["tail"] = path[idx + len(frame_str):]
+    file_info["path"] = path
@@ -6,6 +6,7 @@ import json
 import six
 
 from openpype.client.operations_base import REMOVED_VALUE
+from openpype.client.representation_files import expand_file_infos
 from openpype.client.mongo.operations import (
     CURRENT_PROJECT_SCHEMA,
     CURRENT_ASSET_DOC_SCHEMA,
@@ -971,7 +972,8 @@ def convert_create_representation_to_v4(representation, con):
         converted_representation["active"] = False
 
     new_files = []
-    for file_item in representation["files"]:
+    # Server does not support compact sequence file infos
+    for file_item in expand_file_infos(representation["files"]):
         new_file_item = {
             key: value
             for key, value in file_item.items()
@@ -1329,6 +1331,7 @@ def convert_update_representation_to_v4(
         new_files = update_data["files"]
         if isinstance(new_files, dict):
             new_files = list(new_files.values())
+        new_files = expand_file_infos(new_files)
 
         for item in new_files:
             for key in tuple(item.keys()):
@@ -1,5 +1,6 @@
 import re
 
+from openpype.client import get_file_infos_count
 from openpype.pipeline import get_representation_path
 from openpype.hosts.aftereffects import api
 from openpype.hosts.aftereffects.api.lib import get_unique_layer_name
@@ -31,7 +32,7 @@ class FileLoader(api.AfterEffectsLoader):
 
         path = self.filepath_from_context(context)
 
-        if len(context["representation"]["files"]) > 1:
+        if get_file_infos_count(context["representation"]["files"]) > 1:
             import_options['sequence'] = True
 
         if not path:
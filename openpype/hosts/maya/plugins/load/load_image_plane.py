@@ -4,6 +4,7 @@ from openpype.client import (
     get_asset_by_id,
     get_subset_by_id,
     get_version_by_id,
+    get_file_infos_count,
 )
 from openpype.pipeline import (
     load,
@@ -189,7 +190,7 @@ class ImagePlaneLoader(load.LoaderPlugin):
             message = (
                 "Hold image sequence on first frame?"
                 "\n{} files available.".format(
-                    len(context["representation"]["files"])
+                    get_file_infos_count(context["representation"]["files"])
                 )
             )
             reply = QtWidgets.QMessageBox.information(
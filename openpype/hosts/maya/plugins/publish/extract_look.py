@@ -3,11 +3,13 @@
 import sys
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
 import json
 import logging
 import os
 import tempfile
+import multiprocessing
 import six
 import attr
 
@@ -68,6 +70,45 @@ def find_paths_by_hash(texture_hash):
     return legacy_io.distinct(key, {"type": "version"})
 
 
+def find_paths_by_hashes(texture_hashes):
+    """Find paths of multiple texture hashes with single query.
+
+    Args:
+        texture_hashes (Iterable[str]): Hashes of textures.
+
+    Returns:
+        dict[str, list[str]]: Paths that originate from each texture hash.
+    """
+    if AYON_SERVER_ENABLED:
+        raise KnownPublishError(
+            "This is a bug. \"find_paths_by_hashes\" is not compatible with "
+            "AYON."
+        )
+
+    output = OrderedDict(
+        (texture_hash, []) for texture_hash in texture_hashes
+    )
+    if not output:
+        return output
+
+    keys = [
+        "data.sourceHashes.{0}".format(texture_hash)
+        for texture_hash in output
+    ]
+    query = {
+        "type": "version",
+        "$or": [{key: {"$exists": True}} for key in keys]
+    }
+    projection = {key: True for key in keys}
+    for version_doc in legacy_io.find(query, projection):
+        source_hashes = version_doc.get("data", {}).get("sourceHashes") or {}
+        for texture_hash, paths in output.items():
+            path = source_hashes.get(texture_hash)
+            if path and path not in paths:
+                paths.append(path)
+    return output
+
+
 @contextlib.contextmanager
 def no_workspace_dir():
     """Force maya to a fake temporary workspace directory.
@@ -353,8 +394,12 @@ class MakeTX(TextureProcessor):
 
         # Ensure folder exists
         resources_dir = os.path.join(staging_dir, "resources")
-        if not os.path.exists(resources_dir):
+        try:
             os.makedirs(resources_dir)
+        except OSError:
+            # Folder may be created by texture processed at the same time
+            if not os.path.isdir(resources_dir):
+                raise
 
         self.log.debug("Generating .tx file for %s .." % source)
 
@@ -428,6 +473,10 @@ class ExtractLook(publish.Extractor):
     order = pyblish.api.ExtractorOrder + 0.2
     scene_type = "ma"
     look_data_type = "json"
+    # Maximum number of textures processed at the same time. Each texture
+    #   is processed by its own subprocess (e.g. 'maketx') so threads are
+    #   only waiting for them. Number of CPUs is used when not set.
+    texture_processing_max_workers = None
 
     def get_maya_scene_type(self, instance):
         """Get Maya scene type from settings.
@@ -638,8 +687,25 @@ class ExtractLook(publish.Extractor):
                 destinations_cache[path] = destination
             return destinations_cache[path]
 
+        # Process all unique files of resources before the resources are
+        #   remapped, the first resource using a file defines its colorspace
+        file_colorspaces = OrderedDict()
+        for resource in resources:
+            for filepath in resource["files"]:
+                filepath = os.path.normpath(filepath)
+                file_colorspaces.setdefault(filepath, resource["color_space"])
+
+        texture_results = self._process_textures(
+            file_colorspaces,
+            processors=processors,
+            staging_dir=staging_dir,
+            force_copy=force_copy,
+            color_management=color_management
+        )
+
         # Process all resource's individual files
         processed_files = {}
+        transferred = set()
         transfers = []
         hardlinks = []
         hashes = {}
@@ -678,14 +744,7 @@ class ExtractLook(publish.Extractor):
                     )
                     continue
 
-                texture_result = self._process_texture(
-                    filepath,
-                    processors=processors,
-                    staging_dir=staging_dir,
-                    force_copy=force_copy,
-                    color_management=color_management,
-                    colorspace=colorspace
-                )
+                texture_result = texture_results[filepath]
 
                 # Set the resulting color space on the resource
                 self._set_resource_result_colorspace(
@@ -699,6 +758,11 @@ class ExtractLook(publish.Extractor):
 
                 source = texture_result.path
                 destination = get_resource_destination_cached(source)
+                if (source, destination) in transferred:
+                    # Multiple files with same source hash share the result
+                    continue
+                transferred.add((source, destination))
+
                 if force_copy or texture_result.transfer_mode == COPY:
                     transfers.append((source, destination))
                     self.log.debug('file will be copied {} -> {}'.format(
@@ -779,12 +843,19 @@ class ExtractLook(publish.Extractor):
             resources_dir, basename + ext
         )
 
-    def _get_existing_hashed_texture(self, texture_hash):
-        """Return the first found filepath from a texture hash"""
+    def _get_existing_hashed_texture(self, texture_hash, existing=None):
+        """Return the first found filepath from a texture hash
+
+        Args:
+            texture_hash (str): Hash of the texture.
+            existing (Optional[list[str]]): Already queried paths of the
+                texture hash. Paths are queried when not passed.
+        """
 
         # If source has been published before with the same settings,
         # then don't reprocess but hardlink from the original
-        existing = find_paths_by_hash(texture_hash)
+        if existing is None:
+            existing = find_paths_by_hash(texture_hash)
         if existing:
             source = next((p for p in existing if os.path.exists(p)), None)
             if source:
@@ -795,13 +866,107 @@ class ExtractLook(publish.Extractor):
                     "skipping hardlink: {}".format(existing)
                 )
 
+    def _process_textures(self,
+                          file_colorspaces,
+                          processors,
+                          staging_dir,
+                          force_copy,
+                          color_management):
+        """Process multiple texture files on disk for publishing.
+
+        Files with the same source hash are processed only once and textures
+        are processed concurrently when a texture processor is used.
+
+        Args:
+            file_colorspaces (dict[str, str]): Source colorspace by file path
+                of textures to process.
+            processors (list): List of TextureProcessor processing the texture
+            staging_dir (str): The staging directory to write to.
+            force_copy (bool): Whether to force a copy even if a file hash
+                might have existed already in the project.
+            color_management (dict): Maya's Color Management settings from
+                `lib.get_color_management_preferences`
+
+        Returns:
+            dict[str, TextureResult]: The texture results by file path.
+        """
+
+        if len(processors) > 1:
+            raise KnownPublishError(
+                "More than one texture processor not supported. "
+                "Current processors enabled: {}".format(processors)
+            )
+
+        # Group the files by their source hash. Files without processing are
+        #   not converted, so each of them still needs its own result.
+        filepaths_by_hash = OrderedDict()
+        for filepath in file_colorspaces:
+            texture_hash = source_hash(filepath)
+            if not processors:
+                texture_hash = (texture_hash, filepath)
+            filepaths_by_hash.setdefault(texture_hash, []).append(filepath)
+
+        # Query published paths of all textures at once
+        existing_by_hash = {}
+        if not force_copy and not processors:
+            existing_by_hash = find_paths_by_hashes({
+                texture_hash
+                for texture_hash, _ in filepaths_by_hash
+            })
+
+        def process_texture(texture_hash):
+            filepath = filepaths_by_hash[texture_hash][0]
+            existing_paths = None
+            if not processors:
+                existing_paths = existing_by_hash.get(texture_hash[0])
+            return self._process_texture(
+                filepath,
+                processors=processors,
+                staging_dir=staging_dir,
+                force_copy=force_copy,
+                color_management=color_management,
+                colorspace=file_colorspaces[filepath],
+                existing_paths=existing_paths
+            )
+
+        texture_hashes = list(filepaths_by_hash.keys())
+        max_workers = self.texture_processing_max_workers
+        if not max_workers:
+            max_workers = multiprocessing.cpu_count()
+        max_workers = min(max_workers, len(texture_hashes))
+
+        if not processors or max_workers < 2:
+            results = [
+                process_texture(texture_hash)
+                for texture_hash in texture_hashes
+            ]
+        else:
+            self.log.debug("Processing {} textures with {} workers".format(
+                len(texture_hashes), max_workers
+            ))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(process_texture, texture_hashes))
+
+        output = {}
+        for texture_hash, texture_result in zip(texture_hashes, results):
+            filepaths = filepaths_by_hash[texture_hash]
+            if len(filepaths) > 1:
+                self.log.debug(
+                    "Files with same source hash were processed once: "
+                    "{}".format(", ".join(filepaths))
+                )
+            for filepath in filepaths:
+                output[filepath] = texture_result
+        return output
+
     def _process_texture(self,
                          filepath,
                          processors,
                          staging_dir,
                          force_copy,
                          color_management,
-                         colorspace):
+                         colorspace,
+                         existing_paths=None):
         """Process a single texture file on disk for publishing.
 
         This will:
@@ -822,6 +987,8 @@ class ExtractLook(publish.Extractor):
                 `lib.get_color_management_preferences`
             colorspace (str): The source colorspace of the resources this
                 texture belongs to.
+            existing_paths (Optional[list[str]]): Already queried paths
+                published from the texture hash.
 
         Returns:
             TextureResult: The texture result information.
@@ -855,7 +1022,9 @@ class ExtractLook(publish.Extractor):
         # No texture processing for this file
         texture_hash = source_hash(filepath)
         if not force_copy:
-            existing = self._get_existing_hashed_texture(filepath)
+            existing = self._get_existing_hashed_texture(
+                texture_hash, existing_paths
+            )
             if existing:
                 self.log.debug("Found hash in database, preparing hardlink..")
                 return TextureResult(
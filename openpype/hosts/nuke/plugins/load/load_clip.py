@@ -6,6 +6,7 @@ from openpype.lib import Logger
 from openpype.client import (
     get_version_by_id,
     get_last_version_by_subset_id,
+    get_file_infos_count,
 )
 from openpype.pipeline import (
     get_current_project_name,
@@ -91,7 +92,7 @@ class LoadClip(plugin.NukeLoader):
         # reset container id so it is always unique for each instance
         self.reset_container_id()
 
-        is_sequence = len(representation["files"]) > 1
+        is_sequence = get_file_infos_count(representation["files"]) > 1
 
         if is_sequence:
             context["representation"] = \
@@ -250,7 +251,7 @@ class LoadClip(plugin.NukeLoader):
 
         """
 
-        is_sequence = len(representation["files"]) > 1
+        is_sequence = get_file_infos_count(representation["files"]) > 1
 
         read_node = container["node"]
 
@@ -5,6 +5,7 @@ import copy
 import qargparse
 from qtpy import QtWidgets, QtCore
 
+from openpype.client import get_file_info_paths
 from openpype.settings import get_current_project_settings
 from openpype.pipeline import (
     LegacyCreator,
@@ -933,6 +934,6 @@ def get_representation_files(representation):
     anatomy = Anatomy()
     files = []
     for file_data in representation["files"]:
-        path = anatomy.fill_root(file_data["path"])
-        files.append(path)
+        for path in get_file_info_paths(file_data):
+            files.append(anatomy.fill_root(path))
     return files
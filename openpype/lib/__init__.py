@@ -88,6 +88,8 @@ from .dateutils import (
 
 from .python_module_tools import (
     import_filepath,
+    import_filepath_cached,
+    clear_cached_modules,
     modules_from_path,
     recursive_bases_from_class,
     classes_from_module,
@@ -97,7 +99,8 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
-    filter_profiles
+    filter_profiles,
+    ProfilesMatcher,
 )
 
 from .transcoding import (
@@ -217,6 +220,8 @@ __all__ = [
     "FileDefItem",
 
     "import_filepath",
+    "import_filepath_cached",
+    "clear_cached_modules",
     "modules_from_path",
     "recursive_bases_from_class",
     "classes_from_module",
@@ -259,6 +264,7 @@ __all__ = [
     "compile_list_of_regexes",
 
     "filter_profiles",
+    "ProfilesMatcher",
 
     "prepare_template_data",
     "source_hash",
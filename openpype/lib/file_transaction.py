@@ -2,8 +2,19 @@ import os
 import logging
 import sys
 import errno
+import shutil
+import hashlib
+import threading
+import collections
+
 import six
 
+try:
+    from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+except ImportError:
+    # Python 2 hosts process transfers sequentially
+    ThreadPoolExecutor = FIRST_EXCEPTION = wait = None
+
 from openpype.lib import create_hard_link
 
 # this is needed until speedcopy for linux is fixed
@@ -28,6 +39,88 @@ if sys.platform == "win32":
 else:
     from shutil import copyfile
 
+# Default buffer size used by `copyfile_chunked` (8 MB)
+DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024
+# Hash function used to compare file contents ('blake2b' is not in py2)
+_hash_func = getattr(hashlib, "blake2b", hashlib.sha1)
+# Errors on which zero-copy system calls fallback to regular buffered copy
+_ZERO_COPY_FALLBACK_ERRNOS = {
+    getattr(errno, name)
+    for name in ("EXDEV", "ENOSYS", "EINVAL", "EOPNOTSUPP", "ENOTSUP", "EBADF")
+    if hasattr(errno, name)
+}
+
+
+def _zero_copy(fsrc, fdst, buffer_size):
+    """Copy file content using kernel calls if available.
+
+    Tries 'os.copy_file_range' first and 'os.sendfile' after that. Both
+    calls are available only on some platforms and filesystems.
+
+    Args:
+        fsrc (io.BufferedReader): Opened source file.
+        fdst (io.BufferedWriter): Opened destination file.
+        buffer_size (int): Maximum amount of bytes copied per call.
+
+    Returns:
+        bool: Content was copied. False means that nothing was written
+            and caller should fallback to other copy method.
+    """
+
+    src_fd = fsrc.fileno()
+    dst_fd = fdst.fileno()
+    funcs = []
+    if hasattr(os, "copy_file_range"):
+        funcs.append(
+            lambda offset: os.copy_file_range(src_fd, dst_fd, buffer_size)
+        )
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        funcs.append(
+            lambda offset: os.sendfile(dst_fd, src_fd, offset, buffer_size)
+        )
+
+    for func in funcs:
+        offset = 0
+        try:
+            while True:
+                sent = func(offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError as exc:
+            # Some data were already written, we can't fallback
+            if offset or exc.errno not in _ZERO_COPY_FALLBACK_ERRNOS:
+                raise
+            continue
+        return True
+    return False
+
+
+def copyfile_chunked(src, dst, buffer_size=None, zero_copy=True):
+    """Copy file content using large buffer.
+
+    Faster alternative of 'copyfile' for large files on network shares.
+    When 'zero_copy' is enabled then 'os.copy_file_range' or 'os.sendfile'
+    are used if platform and filesystem supports them, otherwise the content
+    is copied in chunks of 'buffer_size' bytes.
+
+    Args:
+        src (str): Source path.
+        dst (str): Destination path.
+        buffer_size (Optional[int]): Size of chunk. Default
+            'DEFAULT_BUFFER_SIZE'.
+        zero_copy (Optional[bool]): Allow kernel copy calls.
+    """
+
+    if not buffer_size:
+        buffer_size = DEFAULT_BUFFER_SIZE
+
+    with open(src, "rb") as fsrc:
+        with open(dst, "wb") as fdst:
+            if zero_copy and _zero_copy(fsrc, fdst, buffer_size):
+                return
+            shutil.copyfileobj(fsrc, fdst, buffer_size)
+
 
 class DuplicateDestinationError(ValueError):
     """Error raised when transfer destination already exists in queue.
@@ -65,12 +158,55 @@ class FileTransaction(object):
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Transfers can be processed concurrently when 'max_workers' is higher
+    than 1. Transfers are grouped by destination directory and each group is
+    split into batches of 'batch_size' files that are processed by a worker
+    thread. The backup, rollback and finalize logic is same for both modes.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for output.
+        allow_queue_replacements (Optional[bool]): Allow to replace
+            already queued transfer to same destination.
+        max_workers (Optional[int]): Maximum number of worker threads used
+            to transfer files. Value lower than 2 means that files are
+            transferred one by one in current thread.
+        batch_size (Optional[int]): Maximum number of files of one
+            destination directory processed by a worker in one task.
+        buffer_size (Optional[int]): Copy files with chunked copy using
+            buffer of this size (in bytes). Platform copy function is used
+            when not set.
+        zero_copy (Optional[bool]): Allow 'os.copy_file_range' and
+            'os.sendfile' calls when 'buffer_size' is set.
+        progress_callback (Optional[Callable[[int, int, str], None]]): Called
+            after each transferred file with number of processed files,
+            total number of files to transfer and the destination path.
+        dedup (Optional[bool]): Skip transfers to destinations which are
+            identical to the source and hardlink sources which have
+            identical file already published (see 'add_dedup_candidates').
+            Copied files keep modification time of the source file so
+            following publishes can compare them.
+        compare_hash (Optional[bool]): Compare content hash of files
+            instead of modification time when 'dedup' is enabled. Size of
+            files is always compared first. Hardlinks to other paths are
+            always created only for files with the same content hash.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=None,
+        batch_size=None,
+        buffer_size=None,
+        zero_copy=True,
+        progress_callback=None,
+        dedup=False,
+        compare_hash=False,
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
@@ -88,6 +224,24 @@ class FileTransaction(object):
 
         self._allow_queue_replacements = allow_queue_replacements
 
+        self._max_workers = max_workers or 1
+        self._batch_size = batch_size or 16
+        self._buffer_size = buffer_size
+        self._zero_copy = zero_copy
+        self._progress_callback = progress_callback
+
+        self._lock = threading.Lock()
+        self._processed_count = 0
+
+        self._dedup = dedup
+        self._compare_hash = compare_hash
+        # Existing files that can be used as hardlink source by file size
+        self._dedup_candidates_by_size = collections.defaultdict(set)
+        self._hash_by_path = {}
+        # Destination paths that were skipped because they are identical
+        self._skipped = []
+        self._bytes_saved = 0
+
     def add(self, src, dst, mode=MODE_COPY):
         """Add a new file to transfer queue.
 
@@ -125,12 +279,66 @@ class FileTransaction(object):
 
         self._transfers[dst] = (src, opts)
 
+    def add_dedup_candidates(self, paths):
+        """Add existing files that can be hardlinked to destinations.
+
+        Used only with 'dedup' enabled. Transfer with source identical to one
+        of the candidates is replaced with hardlink to the candidate.
+
+        Args:
+            paths (Iterable[str]): Paths to already published files.
+        """
+
+        for path in paths:
+            path = os.path.normpath(os.path.abspath(path))
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue
+            self._dedup_candidates_by_size[size].add(path)
+
     def process(self):
         # Backup any existing files
-        for dst, (src, _) in self._transfers.items():
+        transfers = []
+        # Transfers hardlinked to destination of other transfer in queue
+        #   which must be processed after all other transfers
+        deferred_transfers = []
+        dst_by_src = {}
+        for dst, (src, opts) in self._transfers.items():
             self.log.debug("Checking file ... {} -> {}".format(src, dst))
             path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
+            if path_same:
+                self.log.debug(
+                    "Source and destination are same files {} -> {}".format(
+                        src, dst))
+                continue
+
+            if (
+                self._dedup
+                and os.path.exists(dst)
+                and self._is_identical(src, dst)
+            ):
+                self.log.debug(
+                    "Skipping identical file ... {} -> {}".format(src, dst))
+                self._skipped.append(dst)
+                self._bytes_saved += os.path.getsize(dst)
+                continue
+
+            if self._dedup and opts["mode"] == self.MODE_COPY:
+                if src in dst_by_src:
+                    # Hardlink to destination of the same source
+                    opts = dict(opts, link_source=dst_by_src[src])
+                    deferred_transfers.append((src, dst, opts))
+                else:
+                    dst_by_src[src] = dst
+                    link_source = self._find_dedup_candidate(src)
+                    if link_source:
+                        opts = dict(opts, link_source=link_source)
+                    transfers.append((src, dst, opts))
+            else:
+                transfers.append((src, dst, opts))
+
+            if not os.path.exists(dst):
                 continue
 
             # Backup original file
@@ -142,25 +350,103 @@ class FileTransaction(object):
             os.rename(dst, backup)
 
         # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
-                self.log.debug(
-                    "Source and destination are same files {} -> {}".format(
-                        src, dst))
+        self._processed_count = 0
+        total = len(transfers) + len(deferred_transfers)
+        for _transfers in (transfers, deferred_transfers):
+            if (
+                self._max_workers > 1
+                and len(_transfers) > 1
+                and ThreadPoolExecutor is not None
+            ):
+                self._process_concurrent(_transfers, total)
                 continue
 
-            self._create_folder_for_file(dst)
+            for src, dst, opts in _transfers:
+                self._create_folder_for_file(dst)
+                self._transfer_file(src, dst, opts, total)
+
+        if self._bytes_saved:
+            self.log.debug(
+                "Deduplication saved {} bytes".format(self._bytes_saved))
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
+    def _process_concurrent(self, transfers, total):
+        """Transfer files using pool of worker threads.
+
+        Args:
+            transfers (List[Tuple[str, str, dict[str, Any]]]): Transfers
+                to process.
+            total (int): Total number of transfers for progress callback.
+        """
+
+        transfers_by_dir = collections.OrderedDict()
+        for transfer in transfers:
+            dirpath = os.path.dirname(transfer[1])
+            transfers_by_dir.setdefault(dirpath, []).append(transfer)
+
+        batches = []
+        for dirpath, dir_transfers in transfers_by_dir.items():
+            # Create the directory only once for all files in it
+            self._create_folder_for_file(dir_transfers[0][1])
+            for idx in range(0, len(dir_transfers), self._batch_size):
+                batches.append(dir_transfers[idx:idx + self._batch_size])
+
+        self.log.debug((
+            "Transferring {} files in {} batches using {} workers"
+        ).format(len(transfers), len(batches), self._max_workers))
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [
+                executor.submit(self._transfer_batch, batch, total)
+                for batch in batches
+            ]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+
+        # Re-raise first error so the caller can rollback
+        for future in futures:
+            if future.cancelled():
+                continue
+            exc = future.exception()
+            if exc is not None:
+                raise exc
+
+    def _transfer_batch(self, batch, total):
+        for src, dst, opts in batch:
+            self._transfer_file(src, dst, opts, total)
+
+    def _transfer_file(self, src, dst, opts, total):
+        mode = opts["mode"]
+        link_source = opts.get("link_source")
+        if link_source and self._link_duplicate(link_source, dst):
+            mode = None
+
+        if mode == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            if self._buffer_size:
+                copyfile_chunked(
+                    src, dst, self._buffer_size, self._zero_copy
+                )
+            else:
                 copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
 
+            if self._dedup:
+                # Keep modification time so next publish can compare it
+                src_stat = os.stat(src)
+                os.utime(dst, (src_stat.st_atime, src_stat.st_mtime))
+
+        elif mode == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
+
+        with self._lock:
             self._transferred.append(dst)
+            self._processed_count += 1
+            processed_count = self._processed_count
+
+        if self._progress_callback is not None:
+            self._progress_callback(processed_count, total, dst)
 
     def finalize(self):
         # Delete any backed up files
@@ -201,6 +487,84 @@ class FileTransaction(object):
                 exc_info=True)
             six.reraise(*sys.exc_info())
 
+    def _link_duplicate(self, link_source, dst):
+        """Hardlink destination to identical already existing file.
+
+        Returns:
+            bool: Hardlink was created, False if copy should be used.
+        """
+
+        self.log.debug("Hardlinking duplicate file ... {} -> {}".format(
+            link_source, dst))
+        try:
+            create_hard_link(link_source, dst)
+        except OSError:
+            # Different drives or filesystem not supporting hardlinks
+            self.log.debug(
+                "Failed to hardlink {}, using copy".format(link_source),
+                exc_info=True)
+            return False
+
+        with self._lock:
+            self._bytes_saved += os.path.getsize(dst)
+        return True
+
+    def _get_file_hash(self, path):
+        file_hash = self._hash_by_path.get(path)
+        if file_hash is None:
+            hash_obj = _hash_func()
+            with open(path, "rb") as stream:
+                for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+                    hash_obj.update(chunk)
+            file_hash = hash_obj.hexdigest()
+            self._hash_by_path[path] = file_hash
+        return file_hash
+
+    def _is_identical(self, src, dst, compare_hash=False):
+        """Compare two files by size and modification time or hash.
+
+        Args:
+            src (str): Source path.
+            dst (str): Destination path.
+            compare_hash (Optional[bool]): Compare content hash even if
+                'compare_hash' of transaction is disabled.
+        """
+
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+        if src_stat.st_size != dst_stat.st_size:
+            return False
+
+        if compare_hash or self._compare_hash:
+            return self._get_file_hash(src) == self._get_file_hash(dst)
+        # Compare only whole seconds as precision differs per filesystem
+        return int(src_stat.st_mtime) == int(dst_stat.st_mtime)
+
+    def _find_dedup_candidate(self, src):
+        if not self._dedup_candidates_by_size:
+            return None
+
+        size = os.path.getsize(src)
+        for path in sorted(self._dedup_candidates_by_size.get(size, [])):
+            # Files in queue may be moved to backup
+            if path in self._transfers:
+                continue
+            # Files of sequence often have the same size and modification
+            #   time so content must be compared before hardlinking
+            if self._is_identical(src, path, compare_hash=True):
+                return path
+        return None
+
+    @property
+    def skipped(self):
+        """Return destination paths skipped as identical to source"""
+        return list(self._skipped)
+
+    @property
+    def bytes_saved(self):
+        """Return amount of bytes that didn't have to be copied"""
+        return self._bytes_saved
+
     @property
     def transferred(self):
         """Return the processed transfers destination paths"""
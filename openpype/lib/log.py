@@ -23,6 +23,7 @@ import time
 import traceback
 import threading
 import copy
+import collections
 
 from openpype import AYON_SERVER_ENABLED
 from openpype.client.mongo import (
@@ -182,6 +183,124 @@ class MongoFormatter(logging.Formatter):
         return document
 
 
+class MongoQueueHandler(logging.Handler):
+    """Log handler storing records to mongo from a background thread.
+
+    Records are converted to documents on emit and added to a queue, so
+    logging does not wait for the database. Background thread inserts queued
+    documents in batches when 'batch_size' documents are queued or each
+    'flush_interval' seconds. Queue is bounded by 'max_queue_size', records
+    emitted when queue is full are dropped and counted in 'dropped_count'.
+    Queued documents are inserted on 'flush' and 'close' which are called
+    by logging module on process exit.
+
+    Args:
+        collection (pymongo.collection.Collection): Collection where
+            documents are inserted.
+        level (Optional[int]): Logging level of handler.
+    """
+
+    max_queue_size = 10000
+    batch_size = 500
+    flush_interval = 1.0
+
+    def __init__(self, collection, level=logging.NOTSET):
+        super(MongoQueueHandler, self).__init__(level)
+        self.setFormatter(MongoFormatter())
+
+        self._collection = collection
+        self._queue = collections.deque()
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._stopped = False
+        self._unreported_drops = 0
+
+        self.dropped_count = 0
+        self.inserted_count = 0
+        self.failed_count = 0
+
+    def emit(self, record):
+        try:
+            document = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._condition:
+            if len(self._queue) >= self.max_queue_size:
+                self.dropped_count += 1
+                self._unreported_drops += 1
+                return
+
+            self._queue.append(document)
+            if self._thread is None and not self._stopped:
+                self._thread = threading.Thread(
+                    target=self._flush_loop, name="MongoQueueHandler"
+                )
+                self._thread.daemon = True
+                self._thread.start()
+
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify()
+
+    def _flush_loop(self):
+        while True:
+            with self._condition:
+                if not self._stopped and len(self._queue) < self.batch_size:
+                    self._condition.wait(self.flush_interval)
+                stopped = self._stopped
+            self.flush()
+            if stopped:
+                return
+
+    def _pop_documents(self):
+        with self._condition:
+            documents = []
+            while self._queue and len(documents) < self.batch_size:
+                documents.append(self._queue.popleft())
+            dropped = self._unreported_drops
+            self._unreported_drops = 0
+
+        if dropped:
+            record = logging.LogRecord(
+                __name__, logging.WARNING, __file__, 0,
+                "Log queue was full. Dropped {} log records.".format(dropped),
+                None, None
+            )
+            documents.append(self.format(record))
+        return documents
+
+    def flush(self):
+        """Insert all queued documents to database."""
+        with self._flush_lock:
+            while True:
+                documents = self._pop_documents()
+                if not documents:
+                    break
+
+                try:
+                    self._collection.insert_many(documents, ordered=False)
+                    self.inserted_count += len(documents)
+
+                except Exception:
+                    self.failed_count += len(documents)
+                    # Can't use logger as it would log to this handler
+                    if logging.raiseExceptions:
+                        traceback.print_exc(file=sys.stderr)
+
+    def close(self):
+        with self._condition:
+            self._stopped = True
+            thread = self._thread
+            self._condition.notify()
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(self.flush_interval * 5)
+        self.flush()
+        super(MongoQueueHandler, self).close()
+
+
 class Logger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -222,6 +341,8 @@ class Logger:
 
     # Data same for all record documents
     process_data = None
+    # Handler sending records to mongo shared by all loggers
+    _mongo_handler = None
     # Cached process name or ability to set different process name
     _process_name = None
 
@@ -238,7 +359,7 @@ class Logger:
         add_console_handler = True
 
         for handler in logger.handlers:
-            if isinstance(handler, MongoHandler):
+            if isinstance(handler, (MongoHandler, MongoQueueHandler)):
                 add_mongo_handler = False
             elif isinstance(handler, LogStreamHandler):
                 add_console_handler = False
@@ -285,22 +406,13 @@ class Logger:
         if not cls.use_mongo_logging:
             return
 
-        components = get_default_components()
-        kwargs = {
-            "host": components["host"],
-            "database_name": cls.log_database_name,
-            "collection": cls.log_collection_name,
-            "username": components["username"],
-            "password": components["password"],
-            "capped": True,
-            "formatter": MongoFormatter()
-        }
-        if components["port"] is not None:
-            kwargs["port"] = int(components["port"])
-        if components["auth_db"]:
-            kwargs["authentication_db"] = components["auth_db"]
-
-        return MongoHandler(**kwargs)
+        if cls._mongo_handler is None:
+            client = cls.get_log_mongo_connection()
+            collection = (
+                client[cls.log_database_name][cls.log_collection_name]
+            )
+            cls._mongo_handler = MongoQueueHandler(collection)
+        return cls._mongo_handler
 
     @classmethod
     def _get_console_handler(cls):
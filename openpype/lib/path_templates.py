@@ -11,6 +11,11 @@ KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
 
+# Parsed parts of templates shared by all 'StringTemplate' objects
+#   - parts are not modified during formatting so they can be reused
+_COMPILED_TEMPLATES_CACHE = {}
+_COMPILED_TEMPLATES_CACHE_LIMIT = 4096
+
 
 def merge_dict(main_dict, enhance_dict):
     """Merges dictionaries by keys.
@@ -81,7 +86,11 @@ class TemplateUnsolved(Exception):
 
 
 class StringTemplate(object):
-    """String that can be formatted."""
+    """String that can be formatted.
+
+    Parsed parts of template are cached by template string, so creating
+    multiple objects of the same template parses it only once.
+    """
     def __init__(self, template):
         if not isinstance(template, six.string_types):
             raise TypeError("<{}> argument must be a string, not {}.".format(
@@ -89,6 +98,26 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        parts = _COMPILED_TEMPLATES_CACHE.get(template)
+        if parts is None:
+            parts = self._parse_template(template)
+            if len(_COMPILED_TEMPLATES_CACHE) >= (
+                _COMPILED_TEMPLATES_CACHE_LIMIT
+            ):
+                _COMPILED_TEMPLATES_CACHE.clear()
+            _COMPILED_TEMPLATES_CACHE[template] = parts
+        self._parts = parts
+
+    @classmethod
+    def _parse_template(cls, template):
+        """Split template to strings, formatting and optional parts.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            list[Union[str, FormattingPart, OptionalPart]]: Parts of template.
+        """
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -119,7 +148,7 @@ class StringTemplate(object):
             if substr:
                 new_parts.append(substr)
 
-        self._parts = self.find_optional_parts(new_parts)
+        return cls.find_optional_parts(new_parts)
 
     def __str__(self):
         return self.template
@@ -182,6 +211,44 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def format_many(self, data_items, strict=False):
+        """Format template with multiple formatting data.
+
+        Args:
+            data_items (Iterable[dict]): Formatting data for each result.
+            strict (Optional[bool]): Validate that each result is solved.
+
+        Returns:
+            list[TemplateResult]: Result for each item of formatting data.
+        """
+        if strict:
+            return [self.format_strict(data) for data in data_items]
+        return [self.format(data) for data in data_items]
+
+    def format_frames(self, data, frames, frame_key="frame", strict=False):
+        """Format template for each frame of a sequence.
+
+        Formatting data are not copied for each frame, only value of
+        'frame_key' is changed.
+
+        Args:
+            data (dict): Formatting data shared by all frames.
+            frames (Iterable[Union[int, str]]): Frames to format.
+            frame_key (Optional[str]): Key of frame in formatting data.
+            strict (Optional[bool]): Validate that each result is solved.
+
+        Returns:
+            list[TemplateResult]: Result for each frame.
+        """
+        frame_data = copy.copy(data)
+
+        def _iter_data():
+            for frame in frames:
+                frame_data[frame_key] = frame
+                yield frame_data
+
+        return self.format_many(_iter_data(), strict)
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -704,6 +771,16 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        key = template[1:-1]
+        # check if key expects subdictionary keys (e.g. project[name])
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+
     @property
     def template(self):
         return self._template
@@ -732,17 +809,13 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
-        # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -1,6 +1,9 @@
 import os
 import re
 import logging
+import collections
+
+import six
 
 log = logging.getLogger(__name__)
 
@@ -227,3 +230,234 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
             "Profile selected: {}".format(profile)
         )
     return profile
+
+
+class _ProfileKeyIndex(object):
+    """Index of profiles values for single key.
+
+    Profile values without regex special characters are stored in exact
+    values mapping, so they're resolved with single lookup. Other values are
+    compiled to regexes only once.
+    """
+
+    _regex_chars = frozenset(".^$*+?{}[]\\|()")
+
+    def __init__(self, key, profiles_data):
+        self.key = key
+        # Indexes of profiles which do not filter by the key
+        self.wildcard = set()
+        # Exact value -> indexes of profiles
+        self.exact = {}
+        # Indexes of profiles with regex values and their regexes
+        self.regexes = []
+
+        for idx, profile in enumerate(profiles_data):
+            in_list = profile.get(key)
+            if not in_list:
+                self.wildcard.add(idx)
+                continue
+
+            if not isinstance(in_list, (list, tuple, set)):
+                in_list = [in_list]
+
+            if "*" in in_list:
+                self.wildcard.add(idx)
+                continue
+
+            regex_items = []
+            for item in in_list:
+                if not item:
+                    continue
+                if (
+                    isinstance(item, six.string_types)
+                    and not self._regex_chars.intersection(item)
+                ):
+                    self.exact.setdefault(item, set()).add(idx)
+                else:
+                    regex_items.append(item)
+
+            regexes = compile_list_of_regexes(regex_items)
+            if regexes:
+                self.regexes.append((idx, regexes))
+
+    def get_matching(self, value):
+        """Indexes of profiles matching value.
+
+        Args:
+            value (Any): Value to match.
+
+        Returns:
+            tuple[set[int], set[int]]: Indexes of profiles that do match the
+                value (1 point) and indexes of profiles which do not filter
+                by the key (0 point).
+        """
+        matching = set()
+        if not value:
+            return matching, self.wildcard
+
+        if isinstance(value, six.string_types):
+            matching.update(self.exact.get(value, ()))
+
+        for idx, regexes in self.regexes:
+            if idx in matching:
+                continue
+            for regex in regexes:
+                if hasattr(regex, "fullmatch"):
+                    result = regex.fullmatch(value)
+                else:
+                    result = fullmatch(regex, value)
+                if result:
+                    matching.add(idx)
+                    break
+        return matching, self.wildcard
+
+
+class ProfilesMatcher(object):
+    """Precompiled profiles which can be matched multiple times.
+
+    Does the same as 'filter_profiles' but profiles values are compiled and
+    indexed only once and results of 'key_values' are cached. Use it when
+    the same profiles are filtered many times, e.g. for each instance or
+    representation in a publish plugin.
+
+    Profiles must not be modified after the matcher was created.
+
+    Example:
+        >>> matcher = ProfilesMatcher(profiles)
+        >>> for instance in instances:
+        ...     profile = matcher.match({
+        ...         "hosts": host_name,
+        ...         "families": instance.data["family"],
+        ...     })
+
+    Args:
+        profiles_data (list[dict[str, Any]]): Profile definitions.
+        logger (Optional[logging.Logger]): Logger used for messages.
+    """
+
+    # Maximum number of cached results of matching
+    cache_size = 1024
+
+    def __init__(self, profiles_data, logger=None):
+        self._profiles_data = profiles_data
+        self._profiles = list(profiles_data or [])
+        self._logger = logger or log
+        self._key_indexes = {}
+        self._cache = collections.OrderedDict()
+
+    @property
+    def profiles_data(self):
+        return self._profiles_data
+
+    def _get_key_index(self, key):
+        key_index = self._key_indexes.get(key)
+        if key_index is None:
+            key_index = _ProfileKeyIndex(key, self._profiles)
+            self._key_indexes[key] = key_index
+        return key_index
+
+    def match(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile for key values.
+
+        Args:
+            key_values (dict[str, Any]): Mapping of Key <-> Value.
+            keys_order (Optional[Iterable[str]]): Order of keys from
+                'key_values' which matters only when multiple profiles have
+                same score.
+            logger (Optional[logging.Logger]): Logger used for messages.
+
+        Returns:
+            Union[dict[str, Any], None]: Most matching profile or None.
+        """
+        if not self._profiles:
+            return None
+
+        if not logger:
+            logger = self._logger
+
+        _keys_order = list(keys_order or [])
+        for key in key_values.keys():
+            if key not in _keys_order:
+                _keys_order.append(key)
+        keys_order = tuple(_keys_order)
+
+        try:
+            cache_key = (
+                keys_order,
+                tuple(key_values[key] for key in keys_order)
+            )
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in self._cache:
+            return self._cache[cache_key]
+
+        profile = self._match(key_values, keys_order, logger)
+        if cache_key is not None:
+            self._cache[cache_key] = profile
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return profile
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def _match(self, key_values, keys_order, logger):
+        log_parts = " | ".join([
+            "{}: \"{}\"".format(*item)
+            for item in key_values.items()
+        ])
+        logger.debug(
+            "Looking for matching profile for: {}".format(log_parts)
+        )
+
+        candidates = None
+        key_matches = []
+        for key in keys_order:
+            matching, wildcard = self._get_key_index(key).get_matching(
+                key_values[key]
+            )
+            available = matching | wildcard
+            if candidates is None:
+                candidates = available
+            else:
+                candidates &= available
+            key_matches.append(matching)
+            if not candidates:
+                break
+
+        if candidates is None:
+            candidates = set(range(len(self._profiles)))
+
+        matching_profiles = None
+        highest_profile_points = -1
+        for idx in sorted(candidates):
+            profile_scores = [idx in matching for matching in key_matches]
+            profile_points = sum(profile_scores)
+            if profile_points < highest_profile_points:
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+
+            matching_profiles.append((self._profiles[idx], profile_scores))
+
+        if not matching_profiles:
+            logger.debug(
+                "None of profiles match your setup. {}".format(log_parts)
+            )
+            return None
+
+        if len(matching_profiles) > 1:
+            logger.debug(
+                "More than one profile match your setup. {}".format(log_parts)
+            )
+
+        profile = _profile_exclusion(matching_profiles, logger)
+        if profile:
+            logger.debug(
+                "Profile selected: {}".format(profile)
+            )
+        return profile
@@ -9,6 +9,10 @@ import six
 
 log = logging.getLogger(__name__)
 
+# Modules imported by 'import_filepath_cached' stored by filepath and module
+#   name with signature of the file
+_CACHED_MODULES = {}
+
 
 def import_filepath(filepath, module_name=None):
     """Import python file as python module.
@@ -45,11 +49,65 @@ def import_filepath(filepath, module_name=None):
     return module
 
 
-def modules_from_path(folder_path):
+def _get_filepath_signature(filepath):
+    stat = os.stat(filepath)
+    return stat.st_mtime, stat.st_size
+
+
+def import_filepath_cached(filepath, module_name=None):
+    """Import python file as python module and reuse it on next import.
+
+    Module is executed again only if modification time or size of the file
+    changed since last import. Files which crashed on import are not cached
+    so the error is raised again.
+
+    Args:
+        filepath (str): Path to python file.
+        module_name (Optional[str]): Name of loaded module. By default
+            is filled with filename of filepath.
+
+    Returns:
+        types.ModuleType: Imported module.
+    """
+    if module_name is None:
+        module_name = os.path.splitext(os.path.basename(filepath))[0]
+
+    filepath = os.path.normpath(filepath)
+    signature = _get_filepath_signature(filepath)
+    cache_key = (filepath, module_name)
+    cached = _CACHED_MODULES.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    module = import_filepath(filepath, module_name)
+    _CACHED_MODULES[cache_key] = (signature, module)
+    return module
+
+
+def clear_cached_modules(filepath=None):
+    """Clear modules cached by 'import_filepath_cached'.
+
+    Args:
+        filepath (Optional[str]): Clear only modules imported from the path.
+            All modules are cleared if not passed.
+    """
+    if filepath is None:
+        _CACHED_MODULES.clear()
+        return
+
+    filepath = os.path.normpath(filepath)
+    for cache_key in tuple(_CACHED_MODULES.keys()):
+        if cache_key[0] == filepath:
+            _CACHED_MODULES.pop(cache_key)
+
+
+def modules_from_path(folder_path, use_cache=False):
     """Get python scripts as modules from a path.
 
     Arguments:
         path (str): Path to folder containing python scripts.
+        use_cache (Optional[bool]): Reuse modules imported by previous call
+            if their files did not change.
 
     Returns:
         tuple<list, list>: First list contains successfully imported modules
@@ -89,7 +147,10 @@ def modules_from_path(folder_path):
             continue
 
         try:
-            module = import_filepath(full_path, mod_name)
+            if use_cache:
+                module = import_filepath_cached(full_path, mod_name)
+            else:
+                module = import_filepath(full_path, mod_name)
             modules.append((full_path, module))
 
         except Exception:
@@ -1,14 +1,19 @@
 import os
 import re
+import copy
 import logging
 import json
 import collections
 import tempfile
+import threading
 import subprocess
 import platform
+import multiprocessing
 
 import xml.etree.ElementTree
 
+import clique
+
 from .execute import run_subprocess
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
@@ -78,11 +83,84 @@ def get_transcode_temp_directory():
     )
 
 
+# Frame range in oiiotool sequence path e.g. 'file.1001-1010#.exr'
+OIIO_FRAME_RANGE_REGEX = re.compile(
+    r"(?P<start>-?\d+)-(?P<end>-?\d+)(?P<padding>#+|@+)"
+)
+# Minimum number of frames converted by one oiiotool process
+OIIO_MIN_FRAMES_PER_PROCESS = 20
+
+# Parsed oiiotool info by file path and file signature
+_OIIO_INFO_CACHE = {}
+_OIIO_INFO_CACHE_LIMIT = 256
+
+
+def _get_oiio_first_frame_path(filepath):
+    """Path to first frame if path is oiiotool sequence with frame range.
+
+    Args:
+        filepath (str): Path to file or sequence in format
+            'file.FRAMESTART-FRAMEEND#.ext'.
+
+    Returns:
+        str: Path to first frame or unchanged path.
+    """
+    dirpath, basename = os.path.split(filepath)
+    match = OIIO_FRAME_RANGE_REGEX.search(basename)
+    if not match:
+        return filepath
+
+    padding_chars = match.group("padding")
+    # '#' is 4 digits padding and '@' is single digit padding in oiiotool
+    padding = len(padding_chars)
+    if padding_chars[0] == "#":
+        padding *= 4
+    frame = "{:0>{}}".format(int(match.group("start")), padding)
+    start, end = match.span()
+    return os.path.join(dirpath, basename[:start] + frame + basename[end:])
+
+
+def _replace_oiio_frame_range(filepath, frame_start, frame_end):
+    """Change frame range of oiiotool sequence path."""
+    dirpath, basename = os.path.split(filepath)
+    match = OIIO_FRAME_RANGE_REGEX.search(basename)
+    start, end = match.span()
+    frame_range = "{}-{}{}".format(
+        frame_start, frame_end, match.group("padding")
+    )
+    return os.path.join(
+        dirpath, basename[:start] + frame_range + basename[end:]
+    )
+
+
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
-    Stdout should contain xml format string.
+    Stdout should contain xml format string. Output is cached by path and
+    modification time and size of the file, so each file is probed only once.
+    For sequence in format 'file.FRAMESTART-FRAMEEND#.ext' is probed only
+    the first frame.
     """
+    filepath = _get_oiio_first_frame_path(filepath)
+    cache_key = None
+    try:
+        stat = os.stat(filepath)
+        cache_key = (filepath, subimages, stat.st_mtime, stat.st_size)
+    except OSError:
+        pass
+
+    if cache_key is not None and cache_key in _OIIO_INFO_CACHE:
+        return copy.deepcopy(_OIIO_INFO_CACHE[cache_key])
+
+    output = _get_oiio_info_for_input(filepath, logger, subimages)
+    if cache_key is not None:
+        if len(_OIIO_INFO_CACHE) >= _OIIO_INFO_CACHE_LIMIT:
+            _OIIO_INFO_CACHE.clear()
+        _OIIO_INFO_CACHE[cache_key] = copy.deepcopy(output)
+    return output
+
+
+def _get_oiio_info_for_input(filepath, logger, subimages):
     args = get_oiio_tool_args(
         "oiiotool",
         "--info",
@@ -656,10 +734,193 @@ def convert_for_ffmpeg(
     run_subprocess(oiio_cmd, logger=logger)
 
 
+def _get_ffmpeg_erase_attribute_args(input_info, logger):
+    """Arguments erasing attributes which are not supported by ffmpeg.
+
+    Args:
+        input_info (dict): Information about input from oiio tool.
+        logger (logging.Logger): Logger used for logging.
+
+    Returns:
+        list[str]: Arguments for oiiotool.
+    """
+    output = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing prohibited symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            output.extend(["--eraseattrib", attr_name])
+    return output
+
+
+def _get_oiio_processes_count(frames_count, max_workers=None):
+    """Number of oiiotool processes used to convert frames.
+
+    Args:
+        frames_count (int): Number of frames to convert.
+        max_workers (Optional[int]): Maximum number of processes. Number of
+            cpu cores is used if not passed.
+
+    Returns:
+        int: Number of processes.
+    """
+    if max_workers is None:
+        max_workers = multiprocessing.cpu_count()
+    return max(
+        1, min(max_workers, frames_count // OIIO_MIN_FRAMES_PER_PROCESS)
+    )
+
+
+def _split_frames(frames, chunks_count):
+    """Split frames to chunks of similar size."""
+    chunk_size, remainder = divmod(len(frames), chunks_count)
+    output = []
+    start = 0
+    for idx in range(chunks_count):
+        end = start + chunk_size
+        if idx < remainder:
+            end += 1
+        output.append(frames[start:end])
+        start = end
+    return output
+
+
+def _frames_to_framespec(frames):
+    """Convert frames to oiiotool framespec e.g. '1001-1010,1012'."""
+    ranges = []
+    for frame in sorted(frames):
+        if ranges and ranges[-1][1] + 1 == frame:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+    return ",".join(
+        str(start) if start == end else "{}-{}".format(start, end)
+        for start, end in ranges
+    )
+
+
+def _get_oiio_threads_args(processes_count):
+    """Limit threads of oiiotool processes running in parallel."""
+    if processes_count < 2:
+        return []
+    threads = max(1, multiprocessing.cpu_count() // processes_count)
+    return ["--threads", str(threads)]
+
+
+def _run_oiio_commands(commands, logger):
+    """Run oiiotool commands in parallel.
+
+    Args:
+        commands (list[list[str]]): Arguments of each oiiotool command.
+        logger (logging.Logger): Logger used for logging.
+
+    Raises:
+        RuntimeError: Any of processes failed.
+    """
+    if len(commands) == 1:
+        logger.debug("Conversion command: {}".format(" ".join(commands[0])))
+        run_subprocess(commands[0], logger=logger)
+        return
+
+    errors = []
+
+    def _run(oiio_cmd):
+        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+        try:
+            run_subprocess(oiio_cmd, logger=logger)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=_run, args=(oiio_cmd, ))
+        for oiio_cmd in commands
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def _collect_oiio_sequences(input_paths):
+    """Split input paths to sequences that can be converted by one command.
+
+    Args:
+        input_paths (list[str]): Input file paths.
+
+    Returns:
+        tuple[list[tuple[str, str, list[int]]], list[str]]: Sequences
+            as tuple of directory, printf-style filename pattern and frames,
+            and paths that are not part of a sequence.
+    """
+    paths_by_dir = collections.defaultdict(list)
+    for input_path in input_paths:
+        dirpath, basename = os.path.split(input_path)
+        paths_by_dir[dirpath].append(basename)
+
+    sequences = []
+    remainders = []
+    for dirpath, basenames in paths_by_dir.items():
+        src_collections, src_remainders = clique.assemble(
+            basenames, patterns=[clique.PATTERNS["frames"]]
+        )
+        remainders.extend(
+            os.path.join(dirpath, basename) for basename in src_remainders
+        )
+        for collection in src_collections:
+            # Special characters of oiiotool sequences can't be escaped
+            if any(
+                char in collection.head + collection.tail
+                for char in ("%", "#", "@")
+            ):
+                remainders.extend(
+                    os.path.join(dirpath, basename)
+                    for basename in collection
+                )
+                continue
+
+            frame_pattern = "%d"
+            if collection.padding:
+                frame_pattern = "%0{}d".format(collection.padding)
+            sequences.append((
+                dirpath,
+                collection.head + frame_pattern + collection.tail,
+                sorted(collection.indexes)
+            ))
+    return sequences, remainders
+
+
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -672,12 +933,19 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Frames of a sequence are converted by single oiiotool command, long
+    sequences are split to chunks converted by multiple oiiotool processes
+    in parallel.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of same type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of oiiotool processes
+            running at the same time. Number of cpu cores is used if not
+            passed.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
@@ -705,14 +973,17 @@ def convert_input_paths_for_ffmpeg(
 
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
+    erase_args = _get_ffmpeg_erase_attribute_args(input_info, logger)
 
-    for input_path in input_paths:
+    def _get_oiio_cmd(input_path, output_path, pre_args=None):
         # Prepare subprocess arguments
         oiio_cmd = get_oiio_tool_args(
             "oiiotool",
             # Don't add any additional attributes
             "--nosoftwareattrib",
         )
+        if pre_args:
+            oiio_cmd.extend(pre_args)
         # Add input compression if available
         if compression:
             oiio_cmd.extend(["--compression", compression])
@@ -725,46 +996,32 @@ def convert_input_paths_for_ffmpeg(
             # Use first subimage
             "--subimage", "0"
         ])
-
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing prohibited symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
-
+        oiio_cmd.extend(erase_args)
         # Add last argument - path to output
-        base_filename = os.path.basename(input_path)
-        output_path = os.path.join(output_dir, base_filename)
         oiio_cmd.extend([
             "-o", output_path
         ])
+        return oiio_cmd
+
+    sequences, remainders = _collect_oiio_sequences(input_paths)
+    for dirpath, filename_pattern, frames in sequences:
+        processes_count = _get_oiio_processes_count(len(frames), max_workers)
+        threads_args = _get_oiio_threads_args(processes_count)
+        commands = []
+        for chunk_frames in _split_frames(frames, processes_count):
+            pre_args = ["--frames", _frames_to_framespec(chunk_frames)]
+            pre_args.extend(threads_args)
+            commands.append(_get_oiio_cmd(
+                os.path.join(dirpath, filename_pattern),
+                os.path.join(output_dir, filename_pattern),
+                pre_args
+            ))
+        _run_oiio_commands(commands, logger)
 
-        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+    for input_path in remainders:
+        base_filename = os.path.basename(input_path)
+        output_path = os.path.join(output_dir, base_filename)
+        _run_oiio_commands([_get_oiio_cmd(input_path, output_path)], logger)
 
 
 # FFMPEG functions
@@ -1106,9 +1363,13 @@ def convert_colorspace(
     display=None,
     additional_command_args=None,
     logger=None,
+    max_workers=None,
 ):
     """Convert source file from one color space to another.
 
+    Long sequences are split to chunks converted by multiple oiiotool
+    processes in parallel.
+
     Args:
         input_path (str): Path that should be converted. It is expected that
             contains single file or image sequence of same type
@@ -1128,6 +1389,9 @@ def convert_colorspace(
         additional_command_args (list): arguments for oiiotool (like binary
             depth for .dpx)
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of oiiotool processes
+            running at the same time. Number of cpu cores is used if not
+            passed.
     Raises:
         ValueError: if misconfigured
     """
@@ -1139,23 +1403,6 @@ def convert_colorspace(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
-    # Prepare subprocess arguments
-    oiio_cmd = get_oiio_tool_args(
-        "oiiotool",
-        # Don't add any additional attributes
-        "--nosoftwareattrib",
-        "--colorconfig", config_path
-    )
-
-    oiio_cmd.extend([
-        input_arg, input_path,
-        # Tell oiiotool which channels should be put to top stack
-        #   (and output)
-        "--ch", channels_arg,
-        # Use first subimage
-        "--subimage", "0"
-    ])
-
     if all([target_colorspace, view, display]):
         raise ValueError("Colorspace and both screen and display"
                          " cannot be set together."
@@ -1163,21 +1410,64 @@ def convert_colorspace(
     if not target_colorspace and not all([view, display]):
         raise ValueError("Both screen and display must be set.")
 
-    if additional_command_args:
-        oiio_cmd.extend(additional_command_args)
+    def _get_oiio_cmd(chunk_input_path, chunk_output_path, pre_args=None):
+        # Prepare subprocess arguments
+        oiio_cmd = get_oiio_tool_args(
+            "oiiotool",
+            # Don't add any additional attributes
+            "--nosoftwareattrib",
+            "--colorconfig", config_path
+        )
+        if pre_args:
+            oiio_cmd.extend(pre_args)
+
+        oiio_cmd.extend([
+            input_arg, chunk_input_path,
+            # Tell oiiotool which channels should be put to top stack
+            #   (and output)
+            "--ch", channels_arg,
+            # Use first subimage
+            "--subimage", "0"
+        ])
 
-    if target_colorspace:
-        oiio_cmd.extend(["--colorconvert",
-                         source_colorspace,
-                         target_colorspace])
-    if view and display:
-        oiio_cmd.extend(["--iscolorspace", source_colorspace])
-        oiio_cmd.extend(["--ociodisplay", display, view])
+        if additional_command_args:
+            oiio_cmd.extend(additional_command_args)
 
-    oiio_cmd.extend(["-o", output_path])
+        if target_colorspace:
+            oiio_cmd.extend(["--colorconvert",
+                             source_colorspace,
+                             target_colorspace])
+        if view and display:
+            oiio_cmd.extend(["--iscolorspace", source_colorspace])
+            oiio_cmd.extend(["--ociodisplay", display, view])
 
-    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-    run_subprocess(oiio_cmd, logger=logger)
+        oiio_cmd.extend(["-o", chunk_output_path])
+        return oiio_cmd
+
+    input_match = OIIO_FRAME_RANGE_REGEX.search(os.path.basename(input_path))
+    output_match = OIIO_FRAME_RANGE_REGEX.search(
+        os.path.basename(output_path)
+    )
+    if not input_match or not output_match:
+        _run_oiio_commands([_get_oiio_cmd(input_path, output_path)], logger)
+        return
+
+    # Split sequence to chunks converted in parallel
+    frames = list(range(
+        int(input_match.group("start")), int(input_match.group("end")) + 1
+    ))
+    processes_count = _get_oiio_processes_count(len(frames), max_workers)
+    threads_args = _get_oiio_threads_args(processes_count)
+    commands = []
+    for chunk_frames in _split_frames(frames, processes_count):
+        frame_start = chunk_frames[0]
+        frame_end = chunk_frames[-1]
+        commands.append(_get_oiio_cmd(
+            _replace_oiio_frame_range(input_path, frame_start, frame_end),
+            _replace_oiio_frame_range(output_path, frame_start, frame_end),
+            threads_args
+        ))
+    _run_oiio_commands(commands, logger)
 
 
 def split_cmd_args(in_args):
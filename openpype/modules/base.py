@@ -5,6 +5,7 @@ import os
 import sys
 import json
 import time
+import types
 import inspect
 import logging
 import platform
@@ -15,6 +16,18 @@ import traceback
 from uuid import uuid4
 from abc import ABCMeta, abstractmethod
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 hosts initialize addons sequentially
+    ThreadPoolExecutor = None
+
+try:
+    from importlib.util import find_spec, module_from_spec, LazyLoader
+except ImportError:
+    # Python 2 hosts import default modules directly
+    LazyLoader = None
+
 import six
 import appdirs
 
@@ -180,6 +193,106 @@ class _LoadCache:
     modules_lock = threading.Lock()
     interfaces_loaded = False
     modules_loaded = False
+    # Time spent on import of python modules by their name
+    import_times = {}
+
+
+def _import_lazy_module(import_str):
+    """Import python module which is executed on first attribute access.
+
+    Module is imported directly if lazy loading is not available.
+
+    Args:
+        import_str (str): Full import string of the module.
+
+    Returns:
+        types.ModuleType: Imported module.
+    """
+    module = sys.modules.get(import_str)
+    if module is not None:
+        return module
+
+    spec = None
+    if LazyLoader is not None:
+        spec = find_spec(import_str)
+
+    if (
+        spec is None
+        or spec.loader is None
+        or not hasattr(spec.loader, "exec_module")
+    ):
+        return __import__(import_str, fromlist=("", ))
+
+    spec.loader = LazyLoader(spec.loader)
+    module = module_from_spec(spec)
+    sys.modules[import_str] = module
+    spec.loader.exec_module(module)
+
+    parent_name, _, child_name = import_str.rpartition(".")
+    if parent_name:
+        setattr(sys.modules[parent_name], child_name, module)
+    return module
+
+
+def _is_lazy_module(module):
+    """Module was imported lazily and was not executed yet.
+
+    Type of the module must be checked without accessing any attribute
+    because that would execute it.
+    """
+    module_type = type(module)
+    return (
+        LazyLoader is not None
+        and module_type is not types.ModuleType
+        and issubclass(module_type, types.ModuleType)
+    )
+
+
+def _get_addon_classes(python_module, log):
+    """Addon classes available in python module.
+
+    Args:
+        python_module (types.ModuleType): Python module of addon.
+        log (logging.Logger): Logger used for messages.
+
+    Returns:
+        list[type[AYONAddon]]: Classes of addons which are not abstract.
+    """
+    addon_classes = []
+    # Go through globals in `pype.modules`
+    for name in dir(python_module):
+        modules_item = getattr(python_module, name, None)
+        # Filter globals that are not classes which inherit from
+        #   AYONAddon
+        if (
+            not inspect.isclass(modules_item)
+            or modules_item is AYONAddon
+            or modules_item is OpenPypeModule
+            or modules_item is OpenPypeAddOn
+            or not issubclass(modules_item, AYONAddon)
+        ):
+            continue
+
+        # Check if class is abstract (Developing purpose)
+        if inspect.isabstract(modules_item):
+            # Find abstract attributes by convention on `abc` module
+            not_implemented = []
+            for attr_name in dir(modules_item):
+                attr = getattr(modules_item, attr_name, None)
+                abs_method = getattr(
+                    attr, "__isabstractmethod__", None
+                )
+                if attr and abs_method:
+                    not_implemented.append(attr_name)
+
+            # Log missing implementations
+            log.warning((
+                "Skipping abstract Class: {}."
+                " Missing implementations: {}"
+            ).format(name, ", ".join(not_implemented)))
+            continue
+        addon_classes.append(modules_item)
+    return addon_classes
 
 
 def get_default_modules_dir():
@@ -605,12 +718,15 @@ def _load_modules():
 
             # TODO add more logic how to define if folder is module or not
             # - check manifest and content of manifest
+            import_start = time.time()
             try:
                 # Don't import dynamically current directory modules
+                # - they're executed when are used for the first time, so
+                #   addons disabled in settings are not imported at all
                 if is_in_current_dir:
                     import_str = "openpype.modules.{}".format(basename)
                     new_import_str = "{}.{}".format(modules_key, basename)
-                    default_module = __import__(import_str, fromlist=("", ))
+                    default_module = _import_lazy_module(import_str)
                     sys.modules[new_import_str] = default_module
                     setattr(openpype_modules, basename, default_module)
 
@@ -648,6 +764,8 @@ def _load_modules():
                     msg = "Failed to import module '{}'.".format(fullpath)
                 log.error(msg, exc_info=True)
 
+            _LoadCache.import_times[basename] = time.time() - import_start
+
 
 @six.add_metaclass(ABCMeta)
 class AYONAddon(object):
@@ -809,6 +927,76 @@ class OpenPypeAddOn(OpenPypeModule):
     enabled = True
 
 
+class _LazyAddon(object):
+    """Placeholder of default addon which is disabled in settings.
+
+    Python module of the addon is executed, and the addon initialized, only
+    when an attribute other than 'id', 'name' or 'enabled' is requested.
+
+    Args:
+        manager (ModulesManager): Manager which created the placeholder.
+        name (str): Name of addon.
+        python_module (types.ModuleType): Lazy imported python module.
+        settings (dict[str, Any]): Settings passed to addon.
+    """
+
+    enabled = False
+
+    def __init__(self, manager, name, python_module, settings):
+        self._id = uuid4()
+        self._name = name
+        self._manager = manager
+        self._python_module = python_module
+        self._settings = settings
+        self._addon = None
+        self._lock = threading.Lock()
+
+    @property
+    def id(self):
+        return self._id
+
+    @property
+    def name(self):
+        return self._name
+
+    def get_addon(self):
+        """Initialized addon which is represented by the placeholder.
+
+        Returns:
+            AYONAddon: Initialized addon.
+        """
+        if self._addon is None:
+            with self._lock:
+                if self._addon is None:
+                    self._addon = self._initialize_addon()
+        return self._addon
+
+    def _initialize_addon(self):
+        addon_classes = _get_addon_classes(
+            self._python_module, self._manager.log
+        )
+        if not addon_classes:
+            raise ValueError(
+                "Python module '{}' does not contain any addon.".format(
+                    self._name
+                )
+            )
+        addon_class = next(
+            (
+                addon_class
+                for addon_class in addon_classes
+                if addon_class.name == self._name
+            ),
+            addon_classes[0]
+        )
+        return addon_class(self._manager, self._settings)
+
+    def __getattr__(self, attr_name):
+        if attr_name.startswith("__"):
+            raise AttributeError(attr_name)
+        return getattr(self.get_addon(), attr_name)
+
+
 class ModulesManager:
     """Manager of Pype modules helps to load and prepare them to work.
 
@@ -821,6 +1009,9 @@ class ModulesManager:
     _report_total_key = "Total"
     _system_settings = None
     _ayon_settings = None
+    # Maximum number of threads initializing addons, value lower than 2
+    #   initializes addons one by one
+    initialize_max_workers = 4
 
     def __init__(self, system_settings=None, ayon_settings=None):
         self.log = logging.getLogger(self.__class__.__name__)
@@ -895,78 +1086,147 @@ class ModulesManager:
 
         modules_settings = system_settings["modules"]
 
+        import_report = {}
         report = {}
         time_start = time.time()
-        prev_start_time = time_start
 
         module_classes = []
-        for module in openpype_modules:
-            # Go through globals in `pype.modules`
-            for name in dir(module):
-                modules_item = getattr(module, name, None)
-                # Filter globals that are not classes which inherit from
-                #   AYONAddon
-                if (
-                    not inspect.isclass(modules_item)
-                    or modules_item is AYONAddon
-                    or modules_item is OpenPypeModule
-                    or modules_item is OpenPypeAddOn
-                    or not issubclass(modules_item, AYONAddon)
-                ):
-                    continue
+        for basename, python_module in tuple(openpype_modules.items()):
+            if self._add_lazy_addon(basename, python_module, modules_settings):
+                continue
 
-                # Check if class is abstract (Developing purpose)
-                if inspect.isabstract(modules_item):
-                    # Find abstract attributes by convention on `abc` module
-                    not_implemented = []
-                    for attr_name in dir(modules_item):
-                        attr = getattr(modules_item, attr_name, None)
-                        abs_method = getattr(
-                            attr, "__isabstractmethod__", None
-                        )
-                        if attr and abs_method:
-                            not_implemented.append(attr_name)
-
-                    # Log missing implementations
-                    self.log.warning((
-                        "Skipping abstract Class: {}."
-                        " Missing implementations: {}"
-                    ).format(name, ", ".join(not_implemented)))
-                    continue
-                module_classes.append(modules_item)
+            import_start = time.time()
+            try:
+                addon_classes = _get_addon_classes(python_module, self.log)
+            except Exception:
+                # Lazy imported module failed on execution
+                self.log.error(
+                    "Failed to import default module '{}'.".format(basename),
+                    exc_info=True
+                )
+                self._discard_python_module(basename)
+                continue
+
+            if addon_classes:
+                import_report[addon_classes[0].__name__] = (
+                    time.time() - import_start
+                    + _LoadCache.import_times.get(basename, 0)
+                )
+            module_classes.extend(addon_classes)
 
+        if self._report is not None:
+            import_report[self._report_total_key] = sum(
+                import_report.values()
+            )
+            self._report["Import"] = import_report
+
+        initialization_items = []
         for modules_item in module_classes:
             is_openpype_module = issubclass(modules_item, OpenPypeModule)
             settings = (
                 modules_settings if is_openpype_module else ayon_settings
             )
-            name = modules_item.__name__
-            try:
-                # Try initialize module
-                module = modules_item(self, settings)
-                # Store initialized object
-                self.modules.append(module)
-                self.modules_by_id[module.id] = module
-                self.modules_by_name[module.name] = module
-                enabled_str = "X"
-                if not module.enabled:
-                    enabled_str = " "
-                self.log.debug("[{}] {}".format(enabled_str, name))
-
-                now = time.time()
-                report[module.__class__.__name__] = now - prev_start_time
-                prev_start_time = now
+            initialization_items.append((modules_item, settings))
 
-            except Exception:
+        for modules_item, result in zip(
+            module_classes,
+            self._initialize_addons(initialization_items)
+        ):
+            name = modules_item.__name__
+            module, duration, exc_info = result
+            if module is None:
                 self.log.warning(
                     "Initialization of module {} failed.".format(name),
-                    exc_info=True
+                    exc_info=exc_info
                 )
+                continue
+
+            # Store initialized object
+            self.modules.append(module)
+            self.modules_by_id[module.id] = module
+            self.modules_by_name[module.name] = module
+            enabled_str = "X"
+            if not module.enabled:
+                enabled_str = " "
+            self.log.debug("[{}] {}".format(enabled_str, name))
+            report[module.__class__.__name__] = duration
 
         if self._report is not None:
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
 
+    def _add_lazy_addon(self, basename, python_module, modules_settings):
+        """Add placeholder of default addon which is disabled in settings.
+
+        Python module of the addon was not executed yet and does not have to
+        be unless something asks for the addon object.
+
+        Returns:
+            bool: Placeholder was added.
+        """
+        if AYON_SERVER_ENABLED or not _is_lazy_module(python_module):
+            return False
+
+        addon_settings = modules_settings.get(basename)
+        if (
+            not isinstance(addon_settings, dict)
+            or addon_settings.get("enabled") is not False
+        ):
+            return False
+
+        addon = _LazyAddon(self, basename, python_module, modules_settings)
+        self.modules.append(addon)
+        self.modules_by_id[addon.id] = addon
+        self.modules_by_name[addon.name] = addon
+        self.log.debug("[ ] {} (not imported)".format(basename))
+        return True
+
+    def _discard_python_module(self, basename):
+        import openpype_modules
+
+        openpype_modules.__attributes__.pop(basename, None)
+        for import_str in (
+            "openpype.modules.{}".format(basename),
+            "openpype_modules.{}".format(basename),
+        ):
+            sys.modules.pop(import_str, None)
+
+    def _initialize_addon(self, addon_class, settings):
+        start = time.time()
+        try:
+            addon = addon_class(self, settings)
+        except Exception:
+            return None, time.time() - start, sys.exc_info()
+        return addon, time.time() - start, None
+
+    def _initialize_addons(self, initialization_items):
+        """Initialize addons, in multiple threads if enabled.
+
+        Args:
+            initialization_items (list[tuple[type, Any]]): Addon classes
+                with settings passed to them.
+
+        Returns:
+            list[tuple[Union[AYONAddon, None], float, Any]]: Initialized
+                addon, duration of initialization and exception info if
+                initialization failed. In order of passed items.
+        """
+        max_workers = min(
+            self.initialize_max_workers, len(initialization_items)
+        )
+        if max_workers < 2 or ThreadPoolExecutor is None:
+            return [
+                self._initialize_addon(addon_class, settings)
+                for addon_class, settings in initialization_items
+            ]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._initialize_addon, addon_class, settings)
+                for addon_class, settings in initialization_items
+            ]
+        return [future.result() for future in futures]
+
     def connect_modules(self):
         """Trigger connection with other enabled modules.
 
@@ -1219,7 +1479,8 @@ class ModulesManager:
 
         Attribute `_report` is dictionary where key is "label" describing
         the processed part and value is dictionary where key is module's
-        class name and value is time delta of it's processing.
+        class name and value is time delta of it's processing. Import of
+        python modules is reported under "Import" label.
 
         It is good idea to add total time delta on processed part under key
         which is defined in attribute `_report_total_key`. By default has value
@@ -1328,6 +1589,8 @@ class ModulesManager:
 
 
 class TrayModulesManager(ModulesManager):
+    # Tray addons may create Qt objects on initialization
+    initialize_max_workers = 1
     # Define order of modules in menu
     modules_menu_order = (
         "user",
@@ -1528,8 +1791,18 @@ def get_module_settings_defs():
 
     log = Logger.get_logger("ModuleSettingsLoad")
 
-    for raw_module in openpype_modules:
-        for attr_name in dir(raw_module):
+    for module_name, raw_module in tuple(openpype_modules.items()):
+        try:
+            attr_names = dir(raw_module)
+        except Exception:
+            # Lazy imported module failed on execution
+            log.warning(
+                "Failed to import module '{}'.".format(module_name),
+                exc_info=True
+            )
+            continue
+
+        for attr_name in attr_names:
             attr = getattr(raw_module, attr_name)
             if (
                 not inspect.isclass(attr)
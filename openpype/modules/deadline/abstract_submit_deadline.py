@@ -27,6 +27,8 @@ from openpype.pipeline.publish.lib import (
 )
 from openpype import AYON_SERVER_ENABLED
 
+from .deadline_client import DeadlineClient
+
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
 
@@ -593,8 +595,34 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             KnownPublishError: if submission fails.
 
         """
-        url = "{}/api/jobs".format(self._deadline_url)
-        response = requests_post(url, json=payload)
+        client = DeadlineClient.get_client(self._deadline_url)
+        response = client.submit_job(payload)
+        return self._process_submission_response(response, payload)
+
+    def submit_many(self, payloads):
+        """Submit multiple payloads to Deadline API end-point at once.
+
+        Payloads are submitted concurrently using shared connections to
+        webservice, so they must not depend on each other.
+
+        Args:
+            payloads (list[dict]): Payloads of independent jobs.
+
+        Returns:
+            list[str]: Deadline job ids in order of payloads.
+
+        Throws:
+            KnownPublishError: if any submission fails.
+
+        """
+        client = DeadlineClient.get_client(self._deadline_url)
+        responses = client.submit_jobs(payloads)
+        return [
+            self._process_submission_response(response, payload)
+            for response, payload in zip(responses, payloads)
+        ]
+
+    def _process_submission_response(self, response, payload):
         if not response.ok:
             self.log.error("Submission failed!")
             self.log.error(response.status_code)
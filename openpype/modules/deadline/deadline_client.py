@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""Client for Deadline Webservice.
+
+Client keeps session with connections to the webservice alive between
+requests, so plugins submitting multiple jobs or querying pools don't have
+to connect to the webservice for each request.
+"""
+import os
+import copy
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from openpype.lib import Logger
+
+
+class DeadlineWebserviceError(Exception):
+    """
+    Exception to throw when connection to Deadline server fails.
+    """
+
+
+class DeadlineClient(object):
+    """Session based client of Deadline Webservice.
+
+    Failed requests are retried with exponential backoff. Requests which are
+    not idempotent (e.g. job submission) are retried only when connection
+    to webservice was not established, so job is never submitted twice.
+
+    Pools and workers are cached for 'cache_ttl' seconds.
+
+    Use 'get_client' to get client shared by whole process.
+
+    Args:
+        webservice (str): Url of Deadline Webservice.
+        verify (Optional[bool]): Verify SSL certificates. By default is
+            disabled if 'OPENPYPE_DONT_VERIFY_SSL' environment variable
+            is set.
+    """
+
+    # Timeout of single request in seconds
+    timeout = 10
+    # How many times are failed requests retried
+    retries = 3
+    # Backoff factor of retries, waits 0.5s, 1s, 2s... between retries
+    backoff_factor = 0.5
+    # Server errors which are retried
+    retry_status_codes = (502, 503, 504)
+    # Maximum number of connections kept alive
+    pool_maxsize = 10
+    # How long are pools and workers cached in seconds
+    cache_ttl = 300
+
+    _clients = {}
+    _clients_lock = threading.Lock()
+
+    def __init__(self, webservice, verify=None):
+        if verify is None:
+            verify = not os.getenv("OPENPYPE_DONT_VERIFY_SSL", True)
+        self._webservice = webservice.rstrip("/")
+        self._verify = verify
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._cache = {}
+        self._log = None
+
+    @classmethod
+    def get_client(cls, webservice):
+        """Client for webservice shared by whole process.
+
+        Args:
+            webservice (str): Url of Deadline Webservice.
+
+        Returns:
+            DeadlineClient: Client of the webservice.
+        """
+        webservice = webservice.rstrip("/")
+        with cls._clients_lock:
+            client = cls._clients.get(webservice)
+            if client is None:
+                client = cls(webservice)
+                cls._clients[webservice] = client
+        return client
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    @property
+    def webservice(self):
+        return self._webservice
+
+    def _create_session(self):
+        retry = Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=self.retries,
+            status=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.retry_status_codes,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=1,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def get_session(self):
+        """Session used for requests to webservice.
+
+        Returns:
+            requests.Session: Session with pooled connections.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def close(self):
+        """Close connections to webservice."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def get_url(self, endpoint):
+        """Full url of webservice endpoint.
+
+        Args:
+            endpoint (str): Endpoint of webservice e.g. '/api/jobs'.
+
+        Returns:
+            str: Url of the endpoint.
+        """
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return "{}/{}".format(self._webservice, endpoint.lstrip("/"))
+
+    def request(self, method, endpoint, **kwargs):
+        """Send request to webservice.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Endpoint of webservice e.g. '/api/jobs'.
+            **kwargs: Keyword arguments passed to 'requests.Session.request'.
+
+        Returns:
+            requests.Response: Response from webservice.
+        """
+        kwargs.setdefault("verify", self._verify)
+        kwargs.setdefault("timeout", self.timeout)
+        return self.get_session().request(
+            method, self.get_url(endpoint), **kwargs
+        )
+
+    def get(self, endpoint, **kwargs):
+        return self.request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint, **kwargs):
+        return self.request("POST", endpoint, **kwargs)
+
+    def submit_job(self, payload):
+        """Submit job payload to webservice.
+
+        Args:
+            payload (dict[str, Any]): Payload with 'JobInfo', 'PluginInfo'
+                and 'AuxFiles'.
+
+        Returns:
+            requests.Response: Response from webservice.
+        """
+        return self.post("/api/jobs", json=payload)
+
+    def submit_jobs(self, payloads, max_workers=None):
+        """Submit multiple independent job payloads to webservice.
+
+        Payloads are submitted concurrently, so they must not depend on
+        each other.
+
+        Args:
+            payloads (Iterable[dict[str, Any]]): Payloads of jobs.
+            max_workers (Optional[int]): Maximum number of concurrent
+                submissions. Size of connection pool is used by default.
+
+        Returns:
+            list[requests.Response]: Responses in order of payloads.
+        """
+        payloads = list(payloads)
+        if max_workers is None:
+            max_workers = self.pool_maxsize
+        max_workers = min(max_workers, len(payloads))
+        if max_workers < 2:
+            return [self.submit_job(payload) for payload in payloads]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.submit_job, payloads))
+
+    def _get_names(self, name, use_cache, log):
+        if log is None:
+            log = self.log
+
+        if use_cache:
+            cached = self._cache.get(name)
+            if cached is not None and time.time() - cached[0] < self.cache_ttl:
+                return copy.deepcopy(cached[1])
+
+        try:
+            response = self.get("/api/{}".format(name), params={
+                "NamesOnly": "true"
+            })
+        except requests.exceptions.ConnectionError as exc:
+            msg = "Cannot connect to DL web service {}".format(
+                self._webservice
+            )
+            log.error(msg)
+            raise DeadlineWebserviceError("{} - {}".format(msg, exc))
+
+        if not response.ok:
+            log.warning("No {} retrieved".format(name))
+            return []
+
+        names = response.json()
+        self._cache[name] = (time.time(), names)
+        return copy.deepcopy(names)
+
+    def get_pools(self, use_cache=True, log=None):
+        """Pools available on Deadline.
+
+        Args:
+            use_cache (Optional[bool]): Use cached pools if they are not
+                older than 'cache_ttl'.
+            log (Optional[logging.Logger]): Logger used for messages.
+
+        Returns:
+            list[str]: Names of pools.
+
+        Raises:
+            DeadlineWebserviceError: If webservice is unreachable.
+        """
+        return self._get_names("pools", use_cache, log)
+
+    def get_workers(self, use_cache=True, log=None):
+        """Workers (slaves) available on Deadline.
+
+        Args:
+            use_cache (Optional[bool]): Use cached workers if they are not
+                older than 'cache_ttl'.
+            log (Optional[logging.Logger]): Logger used for messages.
+
+        Returns:
+            list[str]: Names of workers.
+
+        Raises:
+            DeadlineWebserviceError: If webservice is unreachable.
+        """
+        return self._get_names("slaves", use_cache, log)
+
+    def clear_cache(self):
+        self._cache.clear()
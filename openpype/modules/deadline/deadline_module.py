@@ -1,24 +1,15 @@
 import os
-import requests
-import six
-import sys
-import copy
 
-from openpype.lib import requests_get, Logger
 from openpype.modules import OpenPypeModule, IPluginPaths
 
-
-class DeadlineWebserviceError(Exception):
-    """
-    Exception to throw when connection to Deadline server fails.
-    """
+from .deadline_client import DeadlineClient
+# Kept importable from this module for backwards compatibility
+from .deadline_client import DeadlineWebserviceError  # noqa: F401
 
 
 class DeadlineModule(OpenPypeModule, IPluginPaths):
     name = "deadline"
 
-    _cache = {}
-
     def __init__(self, manager, settings):
         self.deadline_urls = {}
         super(DeadlineModule, self).__init__(manager, settings)
@@ -59,32 +50,13 @@ class DeadlineModule(OpenPypeModule, IPluginPaths):
             RuntimeError: If deadline webservice is unreachable.
 
         """
-        if not log:
-            log = Logger.get_logger(__name__)
-
-        argument = "{}/api/pools?NamesOnly=true".format(webservice)
-        try:
-            response = requests_get(argument)
-        except requests.exceptions.ConnectionError as exc:
-            msg = 'Cannot connect to DL web service {}'.format(webservice)
-            log.error(msg)
-            six.reraise(
-                DeadlineWebserviceError,
-                DeadlineWebserviceError('{} - {}'.format(msg, exc)),
-                sys.exc_info()[2])
-        if not response.ok:
-            log.warning("No pools retrieved")
-            return []
-
-        return response.json()
+        client = DeadlineClient.get_client(webservice)
+        return client.get_pools(use_cache=False, log=log)
 
     @classmethod
     def get_deadline_pools_cached(cls, webservice, log=None):
-        cache = cls._cache.setdefault(webservice, {})
-        if "pools" not in cache:
-            cache["pools"] = DeadlineModule.get_deadline_pools(webservice,
-                                                               log=log)
-        return copy.deepcopy(cache["pools"])
+        client = DeadlineClient.get_client(webservice)
+        return client.get_pools(log=log)
 
     @staticmethod
     def get_deadline_slaves(webservice, log=None):
@@ -99,29 +71,10 @@ class DeadlineModule(OpenPypeModule, IPluginPaths):
             RuntimeError: If deadline webservice is unreachable.
 
         """
-        if not log:
-            log = Logger.get_logger(__name__)
-
-        argument = "{}/api/slaves?NamesOnly=true".format(webservice)
-        try:
-            response = requests_get(argument)
-        except requests.exceptions.ConnectionError as exc:
-            msg = 'Cannot connect to DL web service {}'.format(webservice)
-            log.error(msg)
-            six.reraise(
-                DeadlineWebserviceError,
-                DeadlineWebserviceError('{} - {}'.format(msg, exc)),
-                sys.exc_info()[2])
-        if not response.ok:
-            log.warning("No slaves retrieved")
-            return []
-
-        return response.json()
+        client = DeadlineClient.get_client(webservice)
+        return client.get_workers(use_cache=False, log=log)
 
     @classmethod
     def get_deadline_slaves_cached(cls, webservice, log=None):
-        cache = cls._cache.setdefault(webservice, {})
-        if "slaves" not in cache:
-            cache["slaves"] = DeadlineModule.get_deadline_slaves(webservice,
-                                                                 log=log)
-        return copy.deepcopy(cache["slaves"])
+        client = DeadlineClient.get_client(webservice)
+        return client.get_workers(log=log)
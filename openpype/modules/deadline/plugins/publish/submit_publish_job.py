@@ -15,6 +15,7 @@ from openpype.client import (
 )
 from openpype.pipeline import publish, legacy_io
 from openpype.lib import EnumDef, is_running_from_build
+from openpype.settings import create_settings_snapshot
 from openpype.tests.lib import is_in_tests
 from openpype.pipeline.version_start import get_versioning_start
 
@@ -152,6 +153,10 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin,
     # poor man exclusion
     skip_integration_repre_list = []
 
+    # Store resolved settings next to metadata file so publish job does
+    #   not have to query them
+    use_settings_snapshot = True
+
     def _submit_deadline_post_job(self, instance, job, instances):
         """Submit publish job to Deadline.
 
@@ -225,6 +230,16 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin,
             "--targets", "farm"
         ]
 
+        if self.use_settings_snapshot:
+            rootless_snapshot_path = self._create_settings_snapshot(
+                instance, metadata_path, rootless_metadata_path
+            )
+            if rootless_snapshot_path:
+                args.extend([
+                    "--settings-snapshot",
+                    '"{}"'.format(rootless_snapshot_path)
+                ])
+
         if is_in_tests():
             args.append("--automatic-tests")
 
@@ -350,6 +365,37 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin,
 
         return deadline_publish_job_id
 
+    def _create_settings_snapshot(
+        self, instance, metadata_path, rootless_metadata_path
+    ):
+        """Create settings snapshot file next to metadata file.
+
+        Returns:
+            Union[str, None]: Rootless path to snapshot or None if snapshot
+                could not be created.
+        """
+        project_name = instance.context.data["projectName"]
+        snapshot_path = "{}_settings.json.gz".format(
+            os.path.splitext(metadata_path)[0]
+        )
+        try:
+            create_settings_snapshot(project_name, snapshot_path)
+        except Exception:
+            self.log.warning(
+                "Failed to create settings snapshot \"{}\".".format(
+                    snapshot_path
+                ),
+                exc_info=True
+            )
+            return None
+
+        self.log.debug("Settings snapshot created \"{}\"".format(
+            snapshot_path
+        ))
+        return "{}_settings.json.gz".format(
+            os.path.splitext(rootless_metadata_path)[0]
+        )
+
     def process(self, instance):
         # type: (pyblish.api.Instance) -> None
         """Process plugin.
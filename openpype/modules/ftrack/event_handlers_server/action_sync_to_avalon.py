@@ -133,8 +133,21 @@ class SyncToAvalonServer(ServerAction):
 
         self.show_message(event, "Synchronization - Preparing data", True)
 
+        project_settings = self.get_project_settings_from_event(
+            event, project_name
+        )
+        action_settings = (
+            project_settings
+            ["ftrack"]
+            [self.settings_frack_subkey]
+            [self.settings_key]
+        )
+        incremental = action_settings.get("incremental", False)
+
         try:
-            output = self.entities_factory.launch_setup(project_name)
+            output = self.entities_factory.launch_setup(
+                project_name, incremental
+            )
             if output is not None:
                 return output
 
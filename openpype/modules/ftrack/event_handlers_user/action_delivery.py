@@ -1,6 +1,7 @@
 import os
 import copy
 import json
+import time
 import collections
 
 from openpype.client import (
@@ -23,6 +24,7 @@ from openpype.pipeline.delivery import (
     check_destination_path,
     deliver_single_file,
     deliver_sequence,
+    DeliveryJob,
 )
 
 
@@ -33,6 +35,8 @@ class Delivery(BaseAction):
     role_list = ["Pypeclub", "Administrator", "Project manager"]
     icon = statics_icon("ftrack", "action_icons", "Delivery.svg")
     settings_key = "delivery_action"
+    # How often is progress of delivery updated on ftrack job in seconds
+    job_update_interval = 10
 
     def discover(self, session, entities, event):
         is_valid = False
@@ -476,7 +480,7 @@ class Delivery(BaseAction):
         session.commit()
 
         try:
-            report = self.real_launch(session, entities, event)
+            report = self.real_launch(session, entities, event, job)
 
         except Exception as exc:
             report = {
@@ -515,7 +519,7 @@ class Delivery(BaseAction):
 
         return report
 
-    def real_launch(self, session, entities, event):
+    def real_launch(self, session, entities, event, job=None):
         self.log.info("Delivery action just started.")
         report_items = collections.defaultdict(list)
 
@@ -555,6 +559,13 @@ class Delivery(BaseAction):
 
         format_dict = get_format_dict(anatomy, location_path)
 
+        manifest_path = None
+        if location_path:
+            manifest_path = os.path.join(
+                location_path, DeliveryJob.manifest_filename
+            )
+        delivery_job = DeliveryJob(manifest_path, log=self.log)
+
         datetime_data = get_datetime_data()
         for repre in repres_to_deliver:
             source_path = repre.get("data", {}).get("path")
@@ -593,13 +604,43 @@ class Delivery(BaseAction):
                 report_items,
                 self.log
             )
+            kwargs = {"delivery_job": delivery_job}
             if not frame:
-                deliver_single_file(*args)
+                deliver_single_file(*args, **kwargs)
             else:
-                deliver_sequence(*args)
+                deliver_sequence(*args, **kwargs)
+
+        progress_callback = None
+        if job is not None:
+            progress_callback = self._get_job_progress_callback(session, job)
+        delivery_job.process(report_items, progress_callback)
 
         return self.report(report_items)
 
+    def _get_job_progress_callback(self, session, job):
+        """Callback updating description of ftrack job with progress."""
+        last_update = [0]
+
+        def progress_callback(progress):
+            now = time.time()
+            if now - last_update[0] < self.job_update_interval:
+                return
+            last_update[0] = now
+            job["data"] = json.dumps({
+                "description": "Delivery processing. {}".format(
+                    progress.get_message()
+                )
+            })
+            try:
+                session.commit()
+            except Exception:
+                session.rollback()
+                self.log.debug(
+                    "Failed to update job progress.", exc_info=True
+                )
+
+        return progress_callback
+
     def report(self, report_items):
         """Returns dict with final status of delivery (success, fail etc.)."""
         items = []
@@ -0,0 +1,243 @@
+"""Queue of ftrack events stored in mongo collection by event storer.
+
+Collection is not accessed for each event. Processed events are marked in
+batches, old processed events are removed on a schedule and redundant
+events are coalesced before they're processed.
+"""
+import json
+import time
+import datetime
+
+from openpype.lib import Logger
+
+# Sort direction of mongo query (same as 'pymongo.ASCENDING')
+ASCENDING = 1
+
+
+class StoredEventsQueue(object):
+    """Load stored events and mark them processed in batches.
+
+    Events of topics defined in 'coalesce_topics' which have the same source
+    user and the same changes on the same entities as the previous loaded
+    event of each of the entities, stored within 'coalesce_window', are
+    marked processed without handling.
+
+    Args:
+        dbcon (pymongo.collection.Collection): Collection with stored events.
+            Any object with the same interface can be used (e.g. mongomock).
+        log (Optional[logging.Logger]): Logger used for messages.
+    """
+
+    # Maximum number of events loaded at once
+    batch_size = 100
+    # Processed events are marked in collection at least this often (seconds)
+    flush_interval = 1.0
+    # How often are old processed events removed from collection in seconds
+    prune_interval = 3600
+    # Processed events older than this are removed
+    prune_age = datetime.timedelta(days=3)
+    # Events stored within this time in seconds can be coalesced
+    coalesce_window = 5.0
+    # Topics of events which can be coalesced
+    coalesce_topics = ("ftrack.update", )
+
+    def __init__(self, dbcon, log=None):
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+        self._dbcon = dbcon
+        self._pending_ids = []
+        self._last_flush = time.time()
+        self._last_prune = None
+        self._queue_lag = 0.0
+        self._processed_count = 0
+        self._coalesced_count = 0
+        self.log = log
+
+    @property
+    def queue_lag(self):
+        """Age of oldest loaded event in seconds when it was loaded."""
+        return self._queue_lag
+
+    @property
+    def processed_count(self):
+        return self._processed_count
+
+    @property
+    def coalesced_count(self):
+        return self._coalesced_count
+
+    def get_status_info(self):
+        """Metrics of queue for status of event server.
+
+        Returns:
+            list[list[str]]: Pairs of label and value.
+        """
+        return [
+            ["Events queue lag", "{:.1f}s".format(self._queue_lag)],
+            ["Processed events", str(self._processed_count)],
+            ["Coalesced events", str(self._coalesced_count)],
+        ]
+
+    def mark_processed(self, mongo_id):
+        """Mark event as processed.
+
+        Event is marked in collection on next flush.
+
+        Args:
+            mongo_id (Any): Id of event document in collection.
+        """
+        self._pending_ids.append(mongo_id)
+        self._processed_count += 1
+        if (
+            len(self._pending_ids) >= self.batch_size
+            or time.time() - self._last_flush > self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self):
+        """Mark pending processed events in collection with single write."""
+        self._last_flush = time.time()
+        if not self._pending_ids:
+            return
+
+        pending_ids, self._pending_ids = self._pending_ids, []
+        self._dbcon.update_many(
+            {"_id": {"$in": pending_ids}},
+            {"$set": {"pype_data.is_processed": True}}
+        )
+
+    def prune(self, force=False):
+        """Remove old processed events.
+
+        Args:
+            force (Optional[bool]): Prune even if 'prune_interval' did not
+                pass since last prune.
+        """
+        now = time.time()
+        if (
+            not force
+            and self._last_prune is not None
+            and now - self._last_prune < self.prune_interval
+        ):
+            return
+
+        self._last_prune = now
+        # Events are stored with utc time
+        ago_date = datetime.datetime.utcnow() - self.prune_age
+        self._dbcon.delete_many({
+            "pype_data.stored": {"$lte": ago_date},
+            "pype_data.is_processed": True
+        })
+
+    def load_events(self):
+        """Load not processed events sorted by stored date.
+
+        Pending processed events are flushed first, so they're not loaded
+        again.
+
+        Returns:
+            list[dict[str, Any]]: Event documents to process.
+        """
+        self.flush()
+        self.prune()
+
+        event_docs = list(
+            self._dbcon.find(
+                {"pype_data.is_processed": False}
+            ).sort(
+                [("pype_data.stored", ASCENDING)]
+            ).limit(self.batch_size)
+        )
+        if not event_docs:
+            return event_docs
+
+        stored = event_docs[0].get("pype_data", {}).get("stored")
+        if stored is not None:
+            self._queue_lag = max(
+                0.0, (datetime.datetime.utcnow() - stored).total_seconds()
+            )
+            self.log.debug("Loaded {} events. Queue lag {:.1f}s".format(
+                len(event_docs), self._queue_lag
+            ))
+        return self._coalesce_events(event_docs)
+
+    def _get_coalesce_key(self, event_doc):
+        if event_doc.get("topic") not in self.coalesce_topics:
+            return None
+
+        data = event_doc.get("data") or {}
+        entities = data.get("entities")
+        if not entities:
+            return None
+
+        source_user = (event_doc.get("source") or {}).get("user") or {}
+        entities_changes = sorted(
+            json.dumps(
+                [
+                    entity.get("entityId"),
+                    entity.get("action"),
+                    entity.get("changes"),
+                ],
+                sort_keys=True,
+                default=str
+            )
+            for entity in entities
+        )
+        return (
+            event_doc["topic"],
+            source_user.get("id"),
+            tuple(entities_changes)
+        )
+
+    def _get_entity_ids(self, event_doc):
+        data = event_doc.get("data") or {}
+        return [
+            entity.get("entityId")
+            for entity in data.get("entities") or []
+        ]
+
+    def _coalesce_events(self, event_docs):
+        output = []
+        # Last loaded event by entity id as coalesce key and stored date
+        last_by_entity_id = {}
+        for event_doc in event_docs:
+            key = self._get_coalesce_key(event_doc)
+            entity_ids = self._get_entity_ids(event_doc)
+            stored = event_doc.get("pype_data", {}).get("stored")
+            if key is not None and self._is_consecutive_duplicate(
+                key, stored, entity_ids, last_by_entity_id
+            ):
+                self._coalesced_count += 1
+                self._pending_ids.append(event_doc["_id"])
+                continue
+
+            # Any event touching the entity resets the last event
+            for entity_id in entity_ids:
+                last_by_entity_id[entity_id] = (key, stored)
+            output.append(event_doc)
+
+        if len(output) != len(event_docs):
+            self.log.debug("Coalesced {} redundant events".format(
+                len(event_docs) - len(output)
+            ))
+        return output
+
+    def _is_consecutive_duplicate(
+        self, key, stored, entity_ids, last_by_entity_id
+    ):
+        """Event is the same as last event of each of its entities."""
+        if stored is None:
+            return False
+
+        for entity_id in entity_ids:
+            last_key, last_stored = last_by_entity_id.get(
+                entity_id, (None, None)
+            )
+            if (
+                last_key != key
+                or last_stored is None
+                or (stored - last_stored).total_seconds()
+                > self.coalesce_window
+            ):
+                return False
+        return True
@@ -4,7 +4,6 @@ import logging
 import getpass
 import atexit
 import threading
-import datetime
 import time
 import queue
 import collections
@@ -25,6 +24,9 @@ try:
 except ImportError:
     from ftrack_api._weakref import WeakMethod
 from openpype_modules.ftrack.lib import get_ftrack_event_mongo_info
+from openpype_modules.ftrack.ftrack_server.events_queue import (
+    StoredEventsQueue
+)
 
 from openpype.client import OpenPypeMongoConnection
 from openpype.lib import Logger
@@ -116,10 +118,13 @@ class ProcessEventHub(SocketBaseEventHub):
 
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
+    # Sleep between polls of collection when there are no events in seconds
+    poll_interval = 0.5
 
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
+        self.events_queue = None
 
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
@@ -129,6 +134,7 @@ class ProcessEventHub(SocketBaseEventHub):
             mongo_client = OpenPypeMongoConnection.get_mongo_client()
             self.dbcon = mongo_client[database_name][collection_name]
             self.mongo_client = mongo_client
+            self.events_queue = StoredEventsQueue(self.dbcon, self.pypelog)
 
         except pymongo.errors.AutoReconnect:
             self.pypelog.error((
@@ -147,59 +153,45 @@ class ProcessEventHub(SocketBaseEventHub):
 
     def wait(self, duration=None):
         """Overridden wait
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are loaded from Mongo DB when queue is empty. Handled events
+        are set as processed in Mongo DB in batches.
         """
         started = time.time()
         self.prepare_dbcon()
-        while True:
-            try:
-                event = self._event_queue.get(timeout=0.1)
-            except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
-            else:
+        try:
+            while True:
                 try:
+                    event = self._event_queue.get(timeout=0.1)
+                except queue.Empty:
+                    if not self.load_events():
+                        time.sleep(self.poll_interval)
+                else:
                     self._handle(event)
 
                     mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
-
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
-
-                except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["OPENPYPE_MONGO"]))
-                    sys.exit(0)
-                # Additional special processing of events.
-                if event['topic'] == 'ftrack.meta.disconnected':
-                    break
-
-            if duration is not None:
-                if (time.time() - started) > duration:
-                    break
+                    if mongo_id is not None:
+                        self.events_queue.mark_processed(mongo_id)
+
+                    # Additional special processing of events.
+                    if event['topic'] == 'ftrack.meta.disconnected':
+                        break
+
+                if duration is not None:
+                    if (time.time() - started) > duration:
+                        break
+
+            self.events_queue.flush()
+
+        except pymongo.errors.AutoReconnect:
+            self.pypelog.error((
+                "Mongo server \"{}\" is not responding, exiting."
+            ).format(os.environ["OPENPYPE_MONGO"]))
+            sys.exit(0)
 
     def load_events(self):
         """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
-        self.dbcon.delete_many({
-            "pype_data.stored": {"$lte": ago_date},
-            "pype_data.is_processed": True
-        })
-
-        not_processed_events = self.dbcon.find(
-            {"pype_data.is_processed": False}
-        ).sort(
-            [("pype_data.stored", pymongo.ASCENDING)]
-        ).limit(100)
-
         found = False
-        for event_data in not_processed_events:
+        for event_data in self.events_queue.load_events():
             new_event_data = {
                 k: v for k, v in event_data.items()
                 if k not in ["_id", "pype_data"]
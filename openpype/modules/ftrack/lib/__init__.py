@@ -8,7 +8,8 @@ from .constants import (
     FPS_KEYS
 )
 from .settings import (
-    get_ftrack_event_mongo_info
+    get_ftrack_event_mongo_info,
+    get_ftrack_sync_mongo_info
 )
 from .custom_attributes import (
     default_custom_attributes_definition,
@@ -35,6 +36,7 @@ __all__ = (
     "FPS_KEYS",
 
     "get_ftrack_event_mongo_info",
+    "get_ftrack_sync_mongo_info",
 
     "default_custom_attributes_definition",
     "app_definitions_from_app_manager",
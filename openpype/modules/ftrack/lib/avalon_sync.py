@@ -1,5 +1,6 @@
 import re
 import json
+import datetime
 import collections
 import copy
 import numbers
@@ -7,6 +8,7 @@ import numbers
 import six
 
 from openpype.client import (
+    OpenPypeMongoConnection,
     get_project,
     get_assets,
     get_archived_assets,
@@ -24,6 +26,10 @@ from openpype.lib import ApplicationManager, Logger
 from openpype.pipeline import AvalonMongoDB, schema
 
 from .constants import CUST_ATTR_ID_KEY, FPS_KEYS
+from .settings import (
+    get_ftrack_event_mongo_info,
+    get_ftrack_sync_mongo_info
+)
 from .custom_attributes import get_openpype_attr, query_custom_attributes
 
 from bson.objectid import ObjectId
@@ -405,6 +411,14 @@ class SyncEntitiesFactory:
     )
     ignore_custom_attr_key = "avalon_ignore_sync"
     ignore_entity_types = ["milestone"]
+    # Maximum number of operations sent to mongo in one request
+    write_batch_size = 1000
+    # Events stored this many seconds before last synchronization are also
+    #   used to find changed entities (clock difference between machines)
+    sync_state_margin = 60
+    # Processed ftrack events older than this are removed by event server
+    #   so incremental synchronization can't rely on them
+    stored_events_max_age = datetime.timedelta(days=3)
 
     report_splitter = {"type": "label", "value": "---"}
 
@@ -414,7 +428,20 @@ class SyncEntitiesFactory:
         self._api_key = session.api_key
         self._api_user = session.api_user
 
-    def launch_setup(self, project_full_name):
+    def launch_setup(self, project_full_name, incremental=False):
+        """Prepare synchronization of project.
+
+        Args:
+            project_full_name (str): Full name of ftrack project.
+            incremental (Optional[bool]): Query custom attributes and
+                compare only entities which changed in ftrack since last
+                successful synchronization (with their children) and
+                entities missing in avalon database. Changes are found in
+                events stored by event server. Changes made directly in
+                avalon database on entities which did not change in ftrack
+                are not reverted.
+        """
+        sync_started = datetime.datetime.utcnow()
         try:
             self.session.close()
         except Exception:
@@ -436,6 +463,10 @@ class SyncEntitiesFactory:
             "error": collections.defaultdict(list)
         }
 
+        self.incremental = incremental
+        self.sync_started = sync_started
+        self.sync_scope = None
+
         self.create_list = []
         self.project_created = False
         self.unarchive_list = []
@@ -579,10 +610,96 @@ class SyncEntitiesFactory:
         self.ft_project_id = ft_project_id
         self.entities_dict = entities_dict
 
+        if incremental:
+            self.sync_scope = self.get_sync_scope()
+            if self.sync_scope is None:
+                self.log.debug(
+                    "Incremental synchronization is not possible."
+                    " All entities will be synchronized."
+                )
+            else:
+                self.log.debug(
+                    "Incremental synchronization of {} entities".format(
+                        len(self.sync_scope)
+                    )
+                )
+
     @property
     def project_name(self):
         return self.entities_dict[self.ft_project_id]["name"]
 
+    def get_sync_scope(self):
+        """Ftrack ids of entities which should be synchronized.
+
+        Entities changed in ftrack since last successful synchronization,
+        entities without avalon document and children of these entities.
+
+        Returns:
+            Union[set[str], None]: Ftrack ids of entities to synchronize.
+                None is returned if all entities must be synchronized.
+        """
+        last_sync = self._get_last_sync()
+        if last_sync is None:
+            return None
+
+        min_stored_date = (
+            datetime.datetime.utcnow() - self.stored_events_max_age
+        )
+        if last_sync < min_stored_date:
+            return None
+
+        changed_ids = set()
+        events_collection = self._get_events_collection()
+        stored_events = events_collection.find(
+            {
+                "topic": "ftrack.update",
+                "pype_data.stored": {
+                    "$gte": last_sync - datetime.timedelta(
+                        seconds=self.sync_state_margin
+                    )
+                }
+            },
+            {"data.entities": True}
+        )
+        for event in stored_events:
+            for ent_info in event.get("data", {}).get("entities") or []:
+                entity_id = ent_info.get("entityId")
+                if entity_id == self.ft_project_id:
+                    return None
+
+                if entity_id not in self.entities_dict:
+                    # Tasks are stored on parent entity
+                    entity_id = ent_info.get("parentId")
+
+                if entity_id in self.entities_dict:
+                    changed_ids.add(entity_id)
+
+        avalon_ftrack_ids = set()
+        for asset_doc in get_assets(
+            self.project_name, fields=["data.ftrackId"]
+        ):
+            ftrack_id = asset_doc.get("data", {}).get("ftrackId")
+            if ftrack_id:
+                avalon_ftrack_ids.add(ftrack_id)
+
+        for ftrack_id in self.entities_dict.keys():
+            if (
+                ftrack_id != self.ft_project_id
+                and ftrack_id not in avalon_ftrack_ids
+            ):
+                changed_ids.add(ftrack_id)
+
+        # Project is always synchronized
+        sync_scope = {self.ft_project_id}
+        children_queue = collections.deque(changed_ids)
+        while children_queue:
+            ftrack_id = children_queue.popleft()
+            if ftrack_id in sync_scope:
+                continue
+            sync_scope.add(ftrack_id)
+            children_queue.extend(self.entities_dict[ftrack_id]["children"])
+        return sync_scope
+
     @property
     def avalon_ents_by_id(self):
         """
@@ -1068,10 +1185,8 @@ class SyncEntitiesFactory:
                     copy.deepcopy(prepared_avalon_attr_ca_id)
                 )
 
-        items = query_custom_attributes(
-            self.session,
-            list(attribute_key_by_id.keys()),
-            sync_ids
+        items = self._query_scoped_attributes(
+            attribute_key_by_id, sync_ids
         )
 
         invalid_fps_items = []
@@ -1180,11 +1295,8 @@ class SyncEntitiesFactory:
             for key, val in prepare_dict_avalon.items():
                 entity_dict["avalon_attrs"][key] = val
 
-        items = query_custom_attributes(
-            self.session,
-            list(attribute_key_by_id.keys()),
-            sync_ids,
-            True
+        items = self._query_scoped_attributes(
+            attribute_key_by_id, sync_ids, True
         )
 
         invalid_fps_items = []
@@ -1264,6 +1376,61 @@ class SyncEntitiesFactory:
                 self.entities_dict[child_id]["hier_attrs"].update(_hier_values)
                 hier_down_queue.append((_hier_values, child_id))
 
+    def _query_scoped_attributes(
+        self, attribute_key_by_id, sync_ids, hierarchical=False
+    ):
+        """Query custom attribute values needed for synchronization.
+
+        Values of 'avalon_' attributes are queried for all entities. Values
+        of other attributes only for entities in 'sync_scope'. Hierarchical
+        values are inherited so they're queried also for parents.
+
+        Args:
+            attribute_key_by_id (dict[str, str]): Attribute keys by their
+                configuration id.
+            sync_ids (list[str]): Ids of all synchronized entities.
+            hierarchical (Optional[bool]): Attributes are hierarchical.
+
+        Returns:
+            list[dict[str, Any]]: Custom attribute values.
+        """
+        if self.sync_scope is None:
+            return query_custom_attributes(
+                self.session,
+                list(attribute_key_by_id.keys()),
+                sync_ids,
+                hierarchical
+            )
+
+        avalon_attr_ids = []
+        attr_ids = []
+        for attr_id, key in attribute_key_by_id.items():
+            if key.startswith("avalon_"):
+                avalon_attr_ids.append(attr_id)
+            else:
+                attr_ids.append(attr_id)
+
+        scope_ids = set()
+        for entity_id in self.sync_scope:
+            if not hierarchical:
+                scope_ids.add(entity_id)
+                continue
+
+            while entity_id is not None and entity_id not in scope_ids:
+                scope_ids.add(entity_id)
+                entity_id = self.entities_dict[entity_id]["parent_id"]
+
+        items = []
+        if avalon_attr_ids:
+            items.extend(query_custom_attributes(
+                self.session, avalon_attr_ids, sync_ids, hierarchical
+            ))
+        if attr_ids:
+            items.extend(query_custom_attributes(
+                self.session, attr_ids, list(scope_ids), hierarchical
+            ))
+        return items
+
     def remove_from_archived(self, mongo_id):
         entity = self.avalon_archived_by_id.pop(mongo_id, None)
         if not entity:
@@ -1939,34 +2106,57 @@ class SyncEntitiesFactory:
                         avalon_id
                     )
                 )
-            # Prepare task changes as they have to be stored as one key
-            final_doc = self.entities_dict[ftrack_id]["final_entity"]
-            final_doc_tasks = final_doc["data"].pop("tasks", None) or {}
-            current_doc_tasks = avalon_entity["data"].get("tasks") or {}
-            if not final_doc_tasks:
-                update_tasks = True
-            else:
-                update_tasks = final_doc_tasks != current_doc_tasks
+            self._prepare_entity_update(
+                ftrack_id, avalon_id, avalon_entity, ignore_keys[ftrack_id]
+            )
 
-            # check rest of data
-            data_changes = self.compare_dict(
-                final_doc,
-                avalon_entity,
-                ignore_keys[ftrack_id]
+    def _prepare_entity_update(
+        self, ftrack_id, avalon_id, avalon_entity, ignore_keys
+    ):
+        """Store changes of avalon entity to match ftrack entity.
+
+        Args:
+            ftrack_id (str): Id of ftrack entity.
+            avalon_id (str): Id of avalon entity.
+            avalon_entity (dict[str, Any]): Current avalon document.
+            ignore_keys (list[str]): Keys which are not compared.
+        """
+        # Entity did not change in ftrack since last synchronization
+        if (
+            self.sync_scope is not None
+            and ftrack_id not in self.sync_scope
+            and not ignore_keys
+        ):
+            return
+
+        # Prepare task changes as they have to be stored as one key
+        final_doc = self.entities_dict[ftrack_id]["final_entity"]
+        final_doc_tasks = final_doc["data"].pop("tasks", None) or {}
+        current_doc_tasks = avalon_entity["data"].get("tasks") or {}
+        if not final_doc_tasks:
+            update_tasks = True
+        else:
+            update_tasks = final_doc_tasks != current_doc_tasks
+
+        # check rest of data
+        data_changes = self.compare_dict(
+            final_doc,
+            avalon_entity,
+            ignore_keys
+        )
+        if data_changes:
+            self.updates[avalon_id] = self.merge_dicts(
+                data_changes,
+                self.updates[avalon_id]
             )
-            if data_changes:
-                self.updates[avalon_id] = self.merge_dicts(
-                    data_changes,
-                    self.updates[avalon_id]
-                )
 
-            # Add tasks back to final doc object
-            final_doc["data"]["tasks"] = final_doc_tasks
-            # Add tasks to updates if there are different
-            if update_tasks:
-                if "data" not in self.updates[avalon_id]:
-                    self.updates[avalon_id]["data"] = {}
-                self.updates[avalon_id]["data"]["tasks"] = final_doc_tasks
+        # Add tasks back to final doc object
+        final_doc["data"]["tasks"] = final_doc_tasks
+        # Add tasks to updates if there are different
+        if update_tasks:
+            if "data" not in self.updates[avalon_id]:
+                self.updates[avalon_id]["data"] = {}
+            self.updates[avalon_id]["data"]["tasks"] = final_doc_tasks
 
     def synchronize(self):
         self.log.debug("* Synchronization begins")
@@ -2009,11 +2199,10 @@ class SyncEntitiesFactory:
             )
             self.remove_from_archived(mongo_id)
 
-        if unarchive_writes:
-            self.dbcon.bulk_write(unarchive_writes)
+        self._bulk_write(self.dbcon, unarchive_writes)
 
-        if len(self.create_list) > 0:
-            self.dbcon.insert_many(self.create_list)
+        for chunk in create_chunks(self.create_list, self.write_batch_size):
+            self.dbcon.insert_many(list(chunk))
 
         self.session.commit()
 
@@ -2021,6 +2210,8 @@ class SyncEntitiesFactory:
         self.prepare_changes()
         self.update_entities()
         self.session.commit()
+        if self.incremental:
+            self.store_last_sync()
 
     def create_avalon_entity(self, ftrack_id):
         if ftrack_id == self.ft_project_id:
@@ -2320,18 +2511,71 @@ class SyncEntitiesFactory:
         """
             Runs changes converted to "$set" queries in bulk.
         """
-        mongo_changes_bulk = []
-        for mongo_id, changes in self.updates.items():
-            mongo_id = ObjectId(mongo_id)
-            is_project = mongo_id == self.avalon_project_id
-            change_data = from_dict_to_set(changes, is_project)
-
-            filter = {"_id": mongo_id}
-            mongo_changes_bulk.append(UpdateOne(filter, change_data))
-        if not mongo_changes_bulk:
-            # TODO LOG
-            return
-        self.dbcon.bulk_write(mongo_changes_bulk)
+        def iter_changes():
+            for mongo_id, changes in self.updates.items():
+                mongo_id = ObjectId(mongo_id)
+                is_project = mongo_id == self.avalon_project_id
+                change_data = from_dict_to_set(changes, is_project)
+
+                filter = {"_id": mongo_id}
+                yield UpdateOne(filter, change_data)
+
+        self._bulk_write(self.dbcon, iter_changes())
+
+    def _bulk_write(self, collection, operations):
+        """Write operations in batches of 'write_batch_size'.
+
+        Operations can be a generator so only one batch is in memory.
+
+        Args:
+            collection (Union[AvalonMongoDB, pymongo.collection.Collection]):
+                Object with 'bulk_write' method.
+            operations (Iterable[Any]): Mongo write operations.
+        """
+        batch = []
+        for operation in operations:
+            batch.append(operation)
+            if len(batch) >= self.write_batch_size:
+                collection.bulk_write(batch)
+                batch = []
+
+        if batch:
+            collection.bulk_write(batch)
+
+    def _get_sync_state_collection(self):
+        database_name, collection_name = get_ftrack_sync_mongo_info()
+        mongo_client = OpenPypeMongoConnection.get_mongo_client()
+        return mongo_client[database_name][collection_name]
+
+    def _get_events_collection(self):
+        database_name, collection_name = get_ftrack_event_mongo_info()
+        mongo_client = OpenPypeMongoConnection.get_mongo_client()
+        return mongo_client[database_name][collection_name]
+
+    def _get_last_sync(self):
+        """Start time of last successful synchronization of project.
+
+        Returns:
+            Union[datetime.datetime, None]: Utc time or None if project was
+                not synchronized incrementally yet.
+        """
+        collection = self._get_sync_state_collection()
+        state_doc = collection.find_one(
+            {"project_name": self.project_name},
+            {"last_sync": True}
+        )
+        if state_doc:
+            return state_doc.get("last_sync")
+        return None
+
+    def store_last_sync(self):
+        """Store start time of this synchronization as last successful."""
+        collection = self._get_sync_state_collection()
+        collection.update_one(
+            {"project_name": self.project_name},
+            {"$set": {"last_sync": self.sync_started}},
+            upsert=True
+        )
 
     def reload_parents(self, hierarchy_changing_ids):
         parents_queue = collections.deque()
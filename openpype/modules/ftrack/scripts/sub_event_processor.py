@@ -48,6 +48,9 @@ def send_status(event):
             ["OpenPype build version", get_build_version() or "N/A"]
         ]
     }
+    events_queue = getattr(session.event_hub, "events_queue", None)
+    if events_queue is not None:
+        new_event_data["status_info"].extend(events_queue.get_status_info())
 
     new_event = ftrack_api.event.base.Event(
         topic="openpype.event.server.status.result",
@@ -2,6 +2,8 @@ import json
 
 from aiohttp.web_response import Response
 
+from .jobs import JobQueueFull
+
 
 class JobQueueResource:
     def __init__(self, job_queue, server_manager):
@@ -14,7 +16,8 @@ class JobQueueResource:
         self.endpoint_defs = (
             ("POST", "/jobs", self.post_job),
             ("GET", "/jobs", self.get_jobs),
-            ("GET", "/jobs/{job_id}", self.get_job)
+            ("GET", "/jobs/{job_id}", self.get_job),
+            ("GET", "/metrics", self.get_metrics)
         )
 
         self.register()
@@ -40,7 +43,16 @@ class JobQueueResource:
                 status=400, message="Key \"host_name\" not filled."
             )
 
-        job = self._job_queue.create_job(host_name, data)
+        priority = data.get("priority")
+        if priority is not None and not isinstance(priority, int):
+            return Response(
+                status=400, message="Key \"priority\" must be integer."
+            )
+
+        try:
+            job = self._job_queue.create_job(host_name, data, priority)
+        except JobQueueFull as exc:
+            return Response(status=503, text=str(exc))
         return Response(status=201, text=job.id)
 
     async def get_job(self, request):
@@ -54,6 +66,13 @@ class JobQueueResource:
             content_type="application/json"
         )
 
+    async def get_metrics(self, request):
+        return Response(
+            status=200,
+            body=self.encode(self._job_queue.get_metrics()),
+            content_type="application/json"
+        )
+
     @classmethod
     def encode(cls, data):
         return json.dumps(
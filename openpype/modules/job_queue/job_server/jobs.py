@@ -1,27 +1,54 @@
+import heapq
 import datetime
+import itertools
 import collections
 from uuid import uuid4
 
 
+def _datetime_to_timestamp(value):
+    if value is None:
+        return None
+    return value.timestamp()
+
+
+def _timestamp_to_datetime(value):
+    if value is None:
+        return None
+    return datetime.datetime.fromtimestamp(value)
+
+
+class JobQueueFull(Exception):
+    """Queue of host name has reached maximum number of waiting jobs."""
+
+
 class Job:
     """Job related to specific host name.
 
-    Data must contain everything needed to finish the job.
+    Data must contain everything needed to finish the job. Jobs with higher
+    priority are assigned to workers first.
     """
     # Remove done jobs each n days to clear memory
     keep_in_memory_days = 3
+    default_priority = 50
 
-    def __init__(self, host_name, data, job_id=None, created_time=None):
+    def __init__(
+        self, host_name, data, job_id=None, created_time=None, priority=None
+    ):
         if job_id is None:
             job_id = str(uuid4())
         self._id = job_id
         if created_time is None:
             created_time = datetime.datetime.now()
+        if priority is None:
+            priority = self.default_priority
         self._created_time = created_time
+        # Time when job was added to queue (not stored)
+        self._queued_time = None
         self._started_time = None
         self._done_time = None
         self.host_name = host_name
         self.data = data
+        self.priority = priority
         self._result_data = None
 
         self._started = False
@@ -44,6 +71,57 @@ class Job:
     def id(self):
         return self._id
 
+    @property
+    def created_time(self):
+        return self._created_time
+
+    @property
+    def queued_time(self):
+        return self._queued_time
+
+    @property
+    def started_time(self):
+        return self._started_time
+
+    def set_queued(self):
+        self._queued_time = datetime.datetime.now()
+
+    def to_data(self):
+        """Serializable data of job used to store the job."""
+        return {
+            "id": self._id,
+            "host_name": self.host_name,
+            "priority": self.priority,
+            "data": self.data,
+            "created_time": _datetime_to_timestamp(self._created_time),
+            "started_time": _datetime_to_timestamp(self._started_time),
+            "done_time": _datetime_to_timestamp(self._done_time),
+            "started": self._started,
+            "done": self._done,
+            "errored": self._errored,
+            "message": self._message,
+            "result": self._result_data,
+        }
+
+    @classmethod
+    def from_data(cls, data):
+        """Create job from data stored by 'to_data'."""
+        job = cls(
+            data["host_name"],
+            data["data"],
+            job_id=data["id"],
+            created_time=_timestamp_to_datetime(data["created_time"]),
+            priority=data.get("priority"),
+        )
+        job._started_time = _timestamp_to_datetime(data["started_time"])
+        job._done_time = _timestamp_to_datetime(data["done_time"])
+        job._started = data["started"]
+        job._done = data["done"]
+        job._errored = data["errored"]
+        job._message = data["message"]
+        job._result_data = data["result"]
+        return job
+
     @property
     def done(self):
         return self._done
@@ -101,7 +179,8 @@ class Job:
         output = {
             "id": self.id,
             "worker_id": worker_id,
-            "done": self._done
+            "done": self._done,
+            "priority": self.priority
         }
         output["message"] = self._message or None
 
@@ -125,18 +204,81 @@ class Job:
 class JobQueue:
     """Queue holds jobs that should be done and workers that can do them.
 
-    Also asign jobs to a worker.
+    Also asign jobs to a worker. Waiting jobs of a host name are assigned by
+    priority and then by creation order. Number of jobs running at the same
+    time for a host name can be limited with 'host_limits'. Jobs waiting for
+    a host name without connected workers fail after 'worker_wait_timeout'
+    seconds since they were added to the queue (or restored from storage).
+
+    Args:
+        storage (Optional[JobsStorage]): Storage where jobs are persisted.
+            Unfinished jobs from storage are added back to the queue.
+        host_limits (Optional[dict[str, int]]): Maximum number of running
+            jobs per host name.
+        max_queued_jobs (Optional[int]): Maximum number of waiting jobs
+            per host name. New jobs are refused when is reached.
     """
     old_jobs_check_minutes_interval = 30
+    # How long wait for a worker of host name before job is failed
+    worker_wait_timeout = 600
+    # How many finished jobs are used for latency metrics
+    metrics_jobs_count = 100
 
-    def __init__(self):
+    def __init__(self, storage=None, host_limits=None, max_queued_jobs=None):
         self._last_old_jobs_check = datetime.datetime.now()
         self._jobs_by_id = {}
-        self._job_queue_by_host_name = collections.defaultdict(
-            collections.deque
-        )
+        self._job_queue_by_host_name = collections.defaultdict(list)
+        self._queue_counter = itertools.count()
         self._workers_by_id = {}
         self._workers_by_host_name = collections.defaultdict(list)
+        self._storage = storage
+        self._host_limits = host_limits or {}
+        self._max_queued_jobs = max_queued_jobs
+        self._wait_durations = collections.deque(
+            maxlen=self.metrics_jobs_count
+        )
+
+        if storage is not None:
+            self._load_jobs()
+
+    def _load_jobs(self):
+        jobs = [
+            Job.from_data(job_data)
+            for job_data in self._storage.get_jobs_data()
+        ]
+        jobs.sort(key=lambda job: job.created_time)
+        for job in jobs:
+            self._jobs_by_id[job.id] = job
+            if job.done:
+                continue
+            # Jobs which were started before restart are started again
+            if job.started:
+                job.reset()
+                self._store_job(job)
+            self._enqueue_job(job)
+
+    def _store_job(self, job):
+        if self._storage is not None:
+            self._storage.store_job(job)
+
+    def _enqueue_job(self, job):
+        job.set_queued()
+        heapq.heappush(
+            self._job_queue_by_host_name[job.host_name],
+            (
+                -job.priority,
+                job.created_time,
+                next(self._queue_counter),
+                job
+            )
+        )
+
+    def _queued_jobs(self, host_name):
+        return [
+            item[-1]
+            for item in self._job_queue_by_host_name.get(host_name, [])
+            if not item[-1].deleted
+        ]
 
     def workers(self):
         """All currently registered workers."""
@@ -158,8 +300,9 @@ class JobQueue:
             # Reset job
             job.set_worker(None)
             job.reset()
+            self._store_job(job)
             # Add job back to queue
-            self._job_queue_by_host_name[job.host_name].appendleft(job)
+            self._enqueue_job(job)
 
         # Remove worker from registered workers
         self._workers_by_id.pop(worker.id, None)
@@ -169,35 +312,89 @@ class JobQueue:
 
         print("Removed worker for \"{}\"".format(host_name))
 
+    def _get_running_count(self, host_name):
+        return sum(
+            1
+            for worker in self._workers_by_host_name.get(host_name, [])
+            if worker.job_assigned()
+        )
+
+    def _pop_job(self, host_name):
+        jobs = self._job_queue_by_host_name.get(host_name)
+        while jobs:
+            job = heapq.heappop(jobs)[-1]
+            if not job.deleted:
+                return job
+        return None
+
     def assign_jobs(self):
         """Try to assign job for each idle worker.
 
-        Error all jobs without needed worker.
+        Error jobs which are waiting for a worker longer than
+        'worker_wait_timeout'.
         """
-        available_host_names = set()
-        for worker in self._workers_by_id.values():
-            host_name = worker.host_name
-            available_host_names.add(host_name)
-            if worker.is_idle():
-                jobs = self._job_queue_by_host_name[host_name]
-                while jobs:
-                    job = jobs.popleft()
-                    if not job.deleted:
-                        worker.set_current_job(job)
-                        break
+        for host_name, workers in self._workers_by_host_name.items():
+            if not workers:
+                continue
+
+            limit = self._host_limits.get(host_name)
+            running_count = self._get_running_count(host_name)
+            for worker in workers:
+                if limit is not None and running_count >= limit:
+                    break
+
+                if not worker.is_idle():
+                    continue
+
+                job = self._pop_job(host_name)
+                if job is None:
+                    break
+                worker.set_current_job(job)
+                running_count += 1
 
+        now = datetime.datetime.now()
         for host_name in tuple(self._job_queue_by_host_name.keys()):
-            if host_name in available_host_names:
+            if self._workers_by_host_name.get(host_name):
                 continue
 
-            jobs_deque = self._job_queue_by_host_name[host_name]
+            jobs = self._job_queue_by_host_name[host_name]
             message = ("Not available workers for \"{}\"").format(host_name)
-            while jobs_deque:
-                job = jobs_deque.popleft()
-                if not job.deleted:
-                    job.set_done(False, message)
+            waiting_jobs = []
+            for item in jobs:
+                job = item[-1]
+                if job.deleted:
+                    continue
+                wait_time = (now - job.queued_time).total_seconds()
+                if wait_time < self.worker_wait_timeout:
+                    waiting_jobs.append(item)
+                    continue
+                job.set_done(False, message)
+                self._store_job(job)
+
+            heapq.heapify(waiting_jobs)
+            self._job_queue_by_host_name[host_name] = waiting_jobs
         self._remove_old_jobs()
 
+    def set_job_started(self, job):
+        """Mark job as started by worker."""
+        job.set_started()
+        self._wait_durations.append(
+            (job.started_time - job.queued_time).total_seconds()
+        )
+        self._store_job(job)
+
+    def set_job_done(self, job_id, success=True, message=None, data=None):
+        """Mark job as finished.
+
+        Returns:
+            Union[Job, None]: Finished job or None if job was not found.
+        """
+        job = self._jobs_by_id.get(job_id)
+        if job is not None:
+            job.set_done(success, message, data)
+            self._store_job(job)
+        return job
+
     def get_jobs(self):
         return self._jobs_by_id.values()
 
@@ -205,11 +402,24 @@ class JobQueue:
         """Job by it's id."""
         return self._jobs_by_id.get(job_id)
 
-    def create_job(self, host_name, job_data):
-        """Create new job from passed data and add it to queue."""
-        job = Job(host_name, job_data)
+    def create_job(self, host_name, job_data, priority=None):
+        """Create new job from passed data and add it to queue.
+
+        Raises:
+            JobQueueFull: Host name has reached maximum number of waiting
+                jobs.
+        """
+        if self._max_queued_jobs is not None:
+            queued_count = len(self._queued_jobs(host_name))
+            if queued_count >= self._max_queued_jobs:
+                raise JobQueueFull((
+                    "Queue of \"{}\" is full ({} waiting jobs)"
+                ).format(host_name, queued_count))
+
+        job = Job(host_name, job_data, priority=priority)
         self._jobs_by_id[job.id] = job
-        self._job_queue_by_host_name[host_name].append(job)
+        self._enqueue_job(job)
+        self._store_job(job)
         return job
 
     def _remove_old_jobs(self):
@@ -218,10 +428,15 @@ class JobQueue:
         if delta.seconds < self.old_jobs_check_minutes_interval:
             return
 
+        removed_ids = []
         for job_id in tuple(self._jobs_by_id.keys()):
             job = self._jobs_by_id[job_id]
             if not job.keep_in_memory():
                 self._jobs_by_id.pop(job_id)
+                removed_ids.append(job_id)
+
+        if removed_ids and self._storage is not None:
+            self._storage.remove_jobs(removed_ids)
 
     def remove_job(self, job_id):
         """Delete job and eventually stop it."""
@@ -231,6 +446,8 @@ class JobQueue:
 
         job.set_deleted()
         self._jobs_by_id.pop(job.id)
+        if self._storage is not None:
+            self._storage.remove_jobs([job.id])
 
     def get_job_status(self, job_id):
         """Job's status based on id."""
@@ -238,3 +455,48 @@ class JobQueue:
         if job is None:
             return {}
         return job.status()
+
+    def get_metrics(self):
+        """Metrics of queue.
+
+        Returns:
+            dict[str, Any]: Number of waiting and running jobs and workers
+                per host name, and how long jobs waited for a worker.
+        """
+        now = datetime.datetime.now()
+        host_names = (
+            set(self._job_queue_by_host_name.keys())
+            | set(self._workers_by_host_name.keys())
+        )
+        hosts = {}
+        for host_name in sorted(host_names):
+            queued_jobs = self._queued_jobs(host_name)
+            workers = self._workers_by_host_name.get(host_name, [])
+            oldest_wait = 0
+            if queued_jobs:
+                oldest_wait = max(
+                    (now - job.queued_time).total_seconds()
+                    for job in queued_jobs
+                )
+            hosts[host_name] = {
+                "queued": len(queued_jobs),
+                "running": self._get_running_count(host_name),
+                "workers": len(workers),
+                "idle_workers": sum(
+                    1 for worker in workers if worker.is_idle()
+                ),
+                "limit": self._host_limits.get(host_name),
+                "oldest_wait_seconds": oldest_wait,
+            }
+
+        wait_durations = list(self._wait_durations)
+        average_wait = 0
+        if wait_durations:
+            average_wait = sum(wait_durations) / len(wait_durations)
+        return {
+            "hosts": hosts,
+            "queued": sum(item["queued"] for item in hosts.values()),
+            "running": sum(item["running"] for item in hosts.values()),
+            "average_wait_seconds": average_wait,
+            "max_wait_seconds": max(wait_durations or [0]),
+        }
@@ -5,6 +5,7 @@ import logging
 from aiohttp import web
 
 from .jobs import JobQueue
+from .storage import JobsStorage
 from .job_queue_route import JobQueueResource
 from .workers_rpc_route import WorkerRpc
 
@@ -12,16 +13,41 @@ log = logging.getLogger(__name__)
 
 
 class WebServerManager:
-    """Manger that care about web server thread."""
-    def __init__(self, port, host, loop=None):
+    """Manger that care about web server thread.
+
+    Args:
+        port (int): Server port.
+        host (str): Server host.
+        loop (Optional[asyncio.AbstractEventLoop]): Loop of server.
+        database_path (Optional[str]): Path to SQLite file where jobs are
+            stored. Jobs are kept only in memory if not passed.
+        host_limits (Optional[dict[str, int]]): Maximum number of running
+            jobs per host name.
+        max_queued_jobs (Optional[int]): Maximum number of waiting jobs
+            per host name.
+    """
+    def __init__(
+        self,
+        port,
+        host,
+        loop=None,
+        database_path=None,
+        host_limits=None,
+        max_queued_jobs=None
+    ):
         self.port = port
         self.host = host
         self.app = web.Application()
         if loop is None:
             loop = asyncio.new_event_loop()
 
+        storage = None
+        if database_path:
+            storage = JobsStorage(database_path)
+        job_queue = JobQueue(storage, host_limits, max_queued_jobs)
+
         # add route with multiple methods for single "external app"
-        self.webserver_thread = WebServerThread(self, loop)
+        self.webserver_thread = WebServerThread(self, loop, job_queue)
 
     @property
     def url(self):
@@ -61,7 +87,7 @@ class WebServerManager:
 
 class WebServerThread(threading.Thread):
     """ Listener for requests in thread."""
-    def __init__(self, manager, loop):
+    def __init__(self, manager, loop, job_queue=None):
         super(WebServerThread, self).__init__()
 
         self._is_running = False
@@ -71,7 +97,8 @@ class WebServerThread(threading.Thread):
         self.runner = None
         self.site = None
 
-        job_queue = JobQueue()
+        if job_queue is None:
+            job_queue = JobQueue()
         self.job_queue_route = JobQueueResource(job_queue, manager)
         self.workers_route = WorkerRpc(job_queue, manager, loop=loop)
 
@@ -0,0 +1,65 @@
+import json
+import sqlite3
+
+
+class JobsStorage:
+    """Store jobs to SQLite database file so they survive server restart.
+
+    Jobs are stored as json serialized data of 'Job.to_data'.
+
+    Args:
+        filepath (str): Path to SQLite database file. Is created if does
+            not exist.
+    """
+
+    def __init__(self, filepath):
+        self._filepath = filepath
+        self._connection = sqlite3.connect(filepath, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " data TEXT NOT NULL"
+            ")"
+        )
+        self._connection.commit()
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    def get_jobs_data(self):
+        """Data of all stored jobs.
+
+        Returns:
+            list[dict[str, Any]]: Data of jobs.
+        """
+        cursor = self._connection.execute("SELECT data FROM jobs")
+        return [json.loads(row[0]) for row in cursor]
+
+    def store_job(self, job):
+        """Store or update job.
+
+        Args:
+            job (Job): Job to store.
+        """
+        job_data = job.to_data()
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO jobs (id, data) VALUES (?, ?)",
+                (job.id, json.dumps(job_data))
+            )
+
+    def remove_jobs(self, job_ids):
+        """Remove jobs from storage.
+
+        Args:
+            job_ids (Iterable[str]): Ids of jobs to remove.
+        """
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM jobs WHERE id = ?",
+                [(job_id, ) for job_id in job_ids]
+            )
+
+    def close(self):
+        self._connection.close()
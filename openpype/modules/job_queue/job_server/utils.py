@@ -14,7 +14,13 @@ class SharedObjects:
         cls.stopped = True
 
 
-def main(port=None, host=None):
+def main(
+    port=None,
+    host=None,
+    database_path=None,
+    host_limits=None,
+    max_queued_jobs=None
+):
     def signal_handler(sig, frame):
         print("Signal to kill process received. Termination starts.")
         SharedObjects.stop()
@@ -35,7 +41,15 @@ def main(port=None, host=None):
         return 1
 
     print("Running server {}:{}".format(host, port))
-    manager = WebServerManager(port, host)
+    if database_path:
+        print("Storing jobs to {}".format(database_path))
+    manager = WebServerManager(
+        port,
+        host,
+        database_path=database_path,
+        host_limits=host_limits,
+        max_queued_jobs=max_queued_jobs
+    )
     manager.start_server()
 
     stopped = False
@@ -53,9 +53,7 @@ class WorkerRpc(JsonRpc):
         if worker is not None:
             worker.set_current_job(None)
 
-        job = self._job_queue.get_job(job_id)
-        if job is not None:
-            job.set_done(success, message, data)
+        self._job_queue.set_job_done(job_id, success, message, data)
         return True
 
     async def send_jobs(self):
@@ -63,10 +61,16 @@ class WorkerRpc(JsonRpc):
         for worker in self._job_queue.workers():
             if worker.job_assigned() and not worker.is_working():
                 try:
-                    await worker.send_job()
+                    accepted = await worker.send_job()
 
                 except ConnectionResetError:
                     invalid_workers.append(worker)
+                    continue
+
+                job = worker.current_job
+                if accepted and job is not None:
+                    worker.set_working()
+                    self._job_queue.set_job_started(job)
 
         for worker in invalid_workers:
             self._job_queue.remove_worker(worker)
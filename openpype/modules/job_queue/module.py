@@ -27,6 +27,13 @@ workstations know where to send or receive jobs.
 ### start_server
 - start server which is handles jobs
 - it is possible to specify port and host address (default is localhost:8079)
+- jobs can be stored to SQLite file with '--database' so waiting jobs survive
+    restart of server
+- maximum number of running jobs per host name can be set with
+    '--host_limit tvpaint=2'
+- jobs can have 'priority' in job data, jobs with higher priority are
+    assigned first
+- queue metrics are available on '/api/metrics'
 
 ### start_worker
 - start worker which will process jobs
@@ -165,10 +172,17 @@ class JobQueueModule(OpenPypeModule):
         )
 
     @classmethod
-    def start_server(cls, port=None, host=None):
+    def start_server(
+        cls,
+        port=None,
+        host=None,
+        database_path=None,
+        host_limits=None,
+        max_queued_jobs=None
+    ):
         from .job_server import main
 
-        return main(port, host)
+        return main(port, host, database_path, host_limits, max_queued_jobs)
 
     @classmethod
     def start_worker(cls, app_name, server_url=None):
@@ -227,8 +241,28 @@ def cli_main():
 )
 @click.option("--port", help="Server port")
 @click.option("--host", help="Server host (ip address)")
-def cli_start_server(port, host):
-    JobQueueModule.start_server(port, host)
+@click.option(
+    "--database",
+    help="Path to SQLite file where jobs are stored to survive restart."
+)
+@click.option(
+    "--host_limit",
+    multiple=True,
+    help="Maximum running jobs of a host name (e.g. \"tvpaint=2\")."
+)
+@click.option(
+    "--max_queued_jobs",
+    type=int,
+    help="Maximum waiting jobs per host name. New jobs are then refused."
+)
+def cli_start_server(port, host, database, host_limit, max_queued_jobs):
+    host_limits = {}
+    for item in host_limit:
+        host_name, limit = item.split("=", 1)
+        host_limits[host_name.strip()] = int(limit)
+    JobQueueModule.start_server(
+        port, host, database, host_limits, max_queued_jobs
+    )
 
 
 @cli_main.command(
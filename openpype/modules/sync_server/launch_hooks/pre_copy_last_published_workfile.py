@@ -3,6 +3,7 @@ import shutil
 import filecmp
 
 from openpype.client.entities import get_representations
+from openpype.client.representation_files import expand_file_infos
 from openpype.lib.applications import PreLaunchHook, LaunchTypes
 from openpype.lib.profiles_filtering import filter_profiles
 from openpype.modules.sync_server.sync_server import (
@@ -205,7 +206,7 @@ class CopyLastPublishedWorkfile(PreLaunchHook):
             os.mkdir(resources_dir)
 
         # Copy resources to the local resources directory
-        for file in workfile_representation['files']:
+        for file in expand_file_infos(workfile_representation['files']):
             # Get resource main path
             resource_main_path = anatomy.fill_root(file["path"])
 
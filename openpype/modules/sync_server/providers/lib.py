@@ -12,8 +12,10 @@ class ProviderFactory:
     """
     def __init__(self):
         self.providers = {}  # {'PROVIDER_LABEL: {cls, int},..}
+        self.concurrency_limits = {}  # {'PROVIDER_LABEL: int,..}
 
-    def register_provider(self, provider, creator, batch_limit):
+    def register_provider(self, provider, creator, batch_limit,
+                          concurrency_limit=None):
         """
             Provide all necessary information for one specific remote provider
         Args:
@@ -21,10 +23,14 @@ class ProviderFactory:
             creator (class): class implementing AbstractProvider
             batch_limit (int): number of files that could be processed in
                                     one loop (based on provider API quota)
+            concurrency_limit (int): number of files that could be
+                                    transferred at the same time
         Returns:
             modifies self.providers and self.sites
         """
         self.providers[provider] = (creator, batch_limit)
+        if concurrency_limit:
+            self.concurrency_limits[provider] = concurrency_limit
 
     def get_provider(self, provider, project_name, site_name,
                      tree=None, presets=None):
@@ -67,6 +73,17 @@ class ProviderFactory:
         info = self._get_creator_info(provider)
         return info[1]
 
+    def get_provider_concurrency_limit(self, provider):
+        """
+            Maximum number of files of 'provider' transferred at the same
+            time. None means there is no limit other than global one.
+        Args:
+            provider (string): 'gdrive','S3'
+        Returns:
+            (int|None)
+        """
+        return self.concurrency_limits.get(provider)
+
     def get_provider_configurable_items(self, provider):
         """
             Returns dict of modifiable properties for 'provider'.
@@ -112,7 +129,8 @@ factory = ProviderFactory()
 # there is implementing 'GDriveHandler' class
 # 7 denotes number of files that could be synced in single loop - learned by
 # trial and error
-factory.register_provider(GDriveHandler.CODE, GDriveHandler, 7)
-factory.register_provider(DropboxHandler.CODE, DropboxHandler, 10)
-factory.register_provider(LocalDriveHandler.CODE, LocalDriveHandler, 50)
-factory.register_provider(SFTPHandler.CODE, SFTPHandler, 20)
+# last number denotes number of files transferred at the same time
+factory.register_provider(GDriveHandler.CODE, GDriveHandler, 7, 3)
+factory.register_provider(DropboxHandler.CODE, DropboxHandler, 10, 3)
+factory.register_provider(LocalDriveHandler.CODE, LocalDriveHandler, 50, 8)
+factory.register_provider(SFTPHandler.CODE, SFTPHandler, 20, 4)
@@ -0,0 +1,221 @@
+"""Python 3 only implementation."""
+import time
+import heapq
+import asyncio
+import itertools
+import collections
+
+from openpype.lib import Logger
+
+
+class SyncJob(object):
+    """Single file upload or download waiting for processing.
+
+    Args:
+        project_name (str): Project name.
+        provider (str): Provider code used for the transfer ('gdrive').
+        priority (int): Priority of file, higher is processed sooner.
+        func (Callable[[], Awaitable]): Coroutine function doing the transfer
+            and returning new file id.
+        file (dict): File info from representation document.
+        representation (dict): Representation document.
+        site (str): Site which should be updated in database.
+    """
+
+    def __init__(
+        self, project_name, provider, priority, func, file, representation,
+        site
+    ):
+        self.project_name = project_name
+        self.provider = provider
+        self.priority = priority
+        self.func = func
+        self.file = file
+        self.representation = representation
+        self.site = site
+
+    @property
+    def key(self):
+        return (self.project_name, str(self.file["_id"]), self.site)
+
+
+class SyncScheduler(object):
+    """Persistent scheduler of sync jobs running in asyncio loop.
+
+    Jobs are processed by priority within a project and projects are
+    interleaved in round-robin fashion, so one slow project does not block
+    other projects. Number of running jobs is limited globally and
+    per provider.
+
+    Results are written to database in batches using
+    'SyncServerModule.update_db_many' when 'flush_size' results are
+    available or after 'flush_interval' seconds.
+
+    Args:
+        module (SyncServerModule): Module used for database updates.
+        max_workers (int): Maximum number of jobs running at the same time.
+        provider_limits (Optional[dict[str, int]]): Maximum number of
+            running jobs per provider.
+        flush_size (Optional[int]): Number of results that trigger
+            database update.
+        flush_interval (Optional[float]): Maximum time in seconds that
+            result waits for database update.
+    """
+
+    def __init__(
+        self,
+        module,
+        max_workers,
+        provider_limits=None,
+        flush_size=20,
+        flush_interval=2.0
+    ):
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self._module = module
+        self._max_workers = max(1, max_workers)
+        self._provider_limits = provider_limits or {}
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+
+        # Priority heap of jobs per project
+        self._jobs_by_project = collections.OrderedDict()
+        self._counter = itertools.count()
+        # Keys of jobs which are queued, running or waiting for db update
+        self._keys = set()
+        self._running_by_provider = collections.defaultdict(int)
+        self._running_count = 0
+        self._results = []
+        self._last_flush = time.time()
+        self._wakeup = None
+        self._is_running = False
+
+    @property
+    def queued_count(self):
+        return sum(len(jobs) for jobs in self._jobs_by_project.values())
+
+    @property
+    def running_count(self):
+        return self._running_count
+
+    def is_scheduled(self, project_name, file, site):
+        """File is already queued, processed or waiting for db update."""
+        return (project_name, str(file["_id"]), site) in self._keys
+
+    def add_job(self, job):
+        """Add job to queue.
+
+        Returns:
+            bool: Job was added, False if same job is already scheduled.
+        """
+
+        if job.key in self._keys:
+            return False
+        self._keys.add(job.key)
+        jobs = self._jobs_by_project.setdefault(job.project_name, [])
+        heapq.heappush(jobs, (-job.priority, next(self._counter), job))
+        self._wake()
+        return True
+
+    def clear_project(self, project_name):
+        """Remove queued jobs of project (running jobs are finished)."""
+        jobs = self._jobs_by_project.pop(project_name, None) or []
+        for _, _, job in jobs:
+            self._keys.discard(job.key)
+
+    def stop(self):
+        self._is_running = False
+        self._wake()
+
+    async def run(self):
+        """Dispatch jobs until 'stop' is called."""
+        self._is_running = True
+        self._wakeup = asyncio.Event()
+        while self._is_running:
+            job = self._pop_next_job()
+            if job is not None:
+                self._running_count += 1
+                self._running_by_provider[job.provider] += 1
+                asyncio.ensure_future(self._run_job(job))
+                continue
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), self._flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+
+            if (
+                self._results
+                and time.time() - self._last_flush >= self._flush_interval
+            ):
+                self.flush()
+
+        self.flush()
+
+    def flush(self):
+        """Write collected results to database."""
+        self._last_flush = time.time()
+        if not self._results:
+            return
+
+        results, self._results = self._results, []
+        results_by_project = collections.defaultdict(list)
+        for job, file_id, error in results:
+            results_by_project[job.project_name].append(
+                (file_id, job.file, job.representation, job.site, error)
+            )
+
+        try:
+            for project_name, items in results_by_project.items():
+                self._module.update_db_many(project_name, items)
+        finally:
+            for job, _, _ in results:
+                self._keys.discard(job.key)
+
+    def _wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _pop_next_job(self):
+        if self._running_count >= self._max_workers:
+            return None
+
+        for project_name in list(self._jobs_by_project.keys()):
+            jobs = self._jobs_by_project[project_name]
+            if not jobs:
+                self._jobs_by_project.pop(project_name)
+                continue
+
+            job = jobs[0][2]
+            limit = self._provider_limits.get(job.provider)
+            if limit and self._running_by_provider[job.provider] >= limit:
+                continue
+
+            heapq.heappop(jobs)
+            # Move project to the end to interleave projects
+            self._jobs_by_project.move_to_end(project_name)
+            return job
+        return None
+
+    async def _run_job(self, job):
+        file_id = error = None
+        try:
+            file_id = await job.func()
+        except asyncio.CancelledError:
+            self._keys.discard(job.key)
+            raise
+        except Exception as exc:
+            error = str(exc)
+            self.log.debug(
+                "Sync of file {} failed".format(job.file.get("path")),
+                exc_info=True)
+        finally:
+            self._running_count -= 1
+            self._running_by_provider[job.provider] -= 1
+
+        self._results.append((job, file_id, error))
+        if len(self._results) >= self._flush_size:
+            self.flush()
+        self._wake()
@@ -1,12 +1,14 @@
 """Python 3 only implementation."""
 import os
 import asyncio
+import functools
 import threading
 import concurrent.futures
 from time import sleep
 
 from .providers import lib
 from openpype.client.entity_links import get_linked_representation_id
+from openpype.client.representation_files import get_file_info_paths
 from openpype.lib import Logger
 from openpype.lib.local_settings import get_local_site_id
 from openpype.modules.base import ModulesManager
@@ -14,6 +16,7 @@ from openpype.pipeline import Anatomy
 from openpype.pipeline.load.utils import get_representation_path_with_anatomy
 
 from .utils import SyncStatus, ResumableError
+from .scheduler import SyncJob, SyncScheduler
 
 
 async def upload(module, project_name, file, representation, provider_name,
@@ -54,32 +57,40 @@ async def upload(module, project_name, file, representation, provider_name,
                                                   tree=tree,
                                                   presets=preset)
 
-        file_path = file.get("path", "")
-        local_file_path, remote_file_path = resolve_paths(
-            module, file_path, project_name,
-            remote_site_name, remote_handler
-        )
+        # Compact file info of sequence contains multiple files
+        path_pairs = [
+            resolve_paths(
+                module, file_path, project_name,
+                remote_site_name, remote_handler
+            )
+            for file_path in get_file_info_paths(file)
+        ]
 
-        target_folder = os.path.dirname(remote_file_path)
-        folder_id = remote_handler.create_folder(target_folder)
+        target_folders = {
+            os.path.dirname(remote_file_path)
+            for _, remote_file_path in path_pairs
+        }
+        for target_folder in target_folders:
+            folder_id = remote_handler.create_folder(target_folder)
 
-        if not folder_id:
-            err = "Folder {} wasn't created. Check permissions.". \
-                format(target_folder)
-            raise NotADirectoryError(err)
+            if not folder_id:
+                err = "Folder {} wasn't created. Check permissions.". \
+                    format(target_folder)
+                raise NotADirectoryError(err)
 
     loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
-                                         remote_handler.upload_file,
-                                         local_file_path,
-                                         remote_file_path,
-                                         module,
-                                         project_name,
-                                         file,
-                                         representation,
-                                         remote_site_name,
-                                         True
-                                         )
+    for local_file_path, remote_file_path in path_pairs:
+        file_id = await loop.run_in_executor(None,
+                                             remote_handler.upload_file,
+                                             local_file_path,
+                                             remote_file_path,
+                                             module,
+                                             project_name,
+                                             file,
+                                             representation,
+                                             remote_site_name,
+                                             True
+                                             )
 
     module.handle_alternate_site(project_name, representation,
                                  remote_site_name,
@@ -114,28 +125,36 @@ async def download(module, project_name, file, representation, provider_name,
                                                   tree=tree,
                                                   presets=preset)
 
-        file_path = file.get("path", "")
-        local_file_path, remote_file_path = resolve_paths(
-            module, file_path, project_name, remote_site_name, remote_handler
-        )
+        # Compact file info of sequence contains multiple files
+        path_pairs = [
+            resolve_paths(
+                module, file_path, project_name,
+                remote_site_name, remote_handler
+            )
+            for file_path in get_file_info_paths(file)
+        ]
 
-        local_folder = os.path.dirname(local_file_path)
-        os.makedirs(local_folder, exist_ok=True)
+        for local_folder in {
+            os.path.dirname(local_file_path)
+            for local_file_path, _ in path_pairs
+        }:
+            os.makedirs(local_folder, exist_ok=True)
 
     local_site = module.get_active_site(project_name)
 
     loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
-                                         remote_handler.download_file,
-                                         remote_file_path,
-                                         local_file_path,
-                                         module,
-                                         project_name,
-                                         file,
-                                         representation,
-                                         local_site,
-                                         True
-                                         )
+    for local_file_path, remote_file_path in path_pairs:
+        file_id = await loop.run_in_executor(None,
+                                             remote_handler.download_file,
+                                             remote_file_path,
+                                             local_file_path,
+                                             module,
+                                             project_name,
+                                             file,
+                                             representation,
+                                             local_site,
+                                             True
+                                             )
 
     module.handle_alternate_site(project_name, representation, local_site,
                                  file["_id"], file_id)
@@ -297,7 +316,17 @@ class SyncServerThread(threading.Thread):
         self.module = module
         self.loop = None
         self.is_running = False
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        max_workers = module.MAX_CONCURRENT_TRANSFERS
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers)
+        self.scheduler = SyncScheduler(
+            module,
+            max_workers,
+            provider_limits={
+                provider: lib.factory.get_provider_concurrency_limit(provider)
+                for provider in lib.factory.providers
+            }
+        )
         self.timer = None
 
     def run(self):
@@ -310,6 +339,7 @@ class SyncServerThread(threading.Thread):
             self.loop.set_default_executor(self.executor)
 
             asyncio.ensure_future(self.check_shutdown(), loop=self.loop)
+            asyncio.ensure_future(self.scheduler.run(), loop=self.loop)
             asyncio.ensure_future(self.sync_loop(), loop=self.loop)
             self.log.info("Sync Server Started")
             self.loop.run_forever()
@@ -328,8 +358,9 @@ class SyncServerThread(threading.Thread):
                     credentials)
                 - for each project_name it looks for representations that
                   should be synced
-                - synchronize found collections
-                - update representations - fills error messages for exceptions
+                - adds found files to scheduler which synchronizes them in
+                  order of priority and updates representations (fills error
+                  messages for exceptions) in batches as files are finished
                 - waits X seconds and repeat
         Returns:
 
@@ -347,16 +378,17 @@ class SyncServerThread(threading.Thread):
                     local_site, remote_site = self._working_sites(project_name,
                                                                   preset)
                     if not all([local_site, remote_site]):
+                        # do not start queued files of paused project
+                        self.scheduler.clear_project(project_name)
                         continue
 
                     sync_repres = self.module.get_sync_representations(
                         project_name,
                         local_site,
-                        remote_site
+                        remote_site,
+                        incremental=True
                     )
 
-                    task_files_to_process = []
-                    files_processed_info = []
                     # process only unique file paths in one batch
                     # multiple representation could have same file path
                     # (textures),
@@ -376,81 +408,69 @@ class SyncServerThread(threading.Thread):
                     # first call to get_provider could be expensive, its
                     # building folder tree structure in memory
                     # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
+                    added_count = 0
                     for sync in sync_repres:
                         if limit <= 0:
                             continue
                         files = sync.get("files") or []
-                        if files:
-                            for file in files:
-                                # skip already processed files
-                                file_path = file.get('path', '')
-                                if file_path in processed_file_path:
-                                    continue
-                                status = self.module.check_status(
+                        priority = sync.get(
+                            "priority", self.module.DEFAULT_PRIORITY)
+                        for file in files:
+                            # skip already processed files
+                            file_path = file.get('path', '')
+                            if file_path in processed_file_path:
+                                continue
+                            status = self.module.check_status(
+                                file,
+                                local_site,
+                                remote_site,
+                                preset.get('config'))
+                            if status == SyncStatus.DO_UPLOAD:
+                                func = upload
+                                site = remote_site
+                            elif status == SyncStatus.DO_DOWNLOAD:
+                                func = download
+                                site = local_site
+                            else:
+                                continue
+
+                            processed_file_path.add(file_path)
+                            if self.scheduler.is_scheduled(
+                                project_name, file, site
+                            ):
+                                continue
+
+                            tree = handler.get_tree()
+                            limit -= 1
+                            job = SyncJob(
+                                project_name,
+                                remote_provider,
+                                priority,
+                                functools.partial(
+                                    func,
+                                    self.module,
+                                    project_name,
                                     file,
-                                    local_site,
+                                    sync,
+                                    remote_provider,
                                     remote_site,
-                                    preset.get('config'))
-                                if status == SyncStatus.DO_UPLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        upload(self.module,
-                                               project_name,
-                                               file,
-                                               sync,
-                                               remote_provider,
-                                               remote_site,
-                                               tree,
-                                               site_preset))
-                                    task_files_to_process.append(task)
-                                    # store info for exception handlingy
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 remote_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-                                if status == SyncStatus.DO_DOWNLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        download(self.module,
-                                                 project_name,
-                                                 file,
-                                                 sync,
-                                                 remote_provider,
-                                                 remote_site,
-                                                 tree,
-                                                 site_preset))
-                                    task_files_to_process.append(task)
-
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 local_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-
-                    self.log.debug("Sync tasks count {}".format(
-                        len(task_files_to_process)
-                    ))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, project_name = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
+                                    tree,
+                                    site_preset
+                                ),
+                                file,
+                                sync,
+                                site
+                            )
+                            if self.scheduler.add_job(job):
+                                added_count += 1
+
+                    self.log.debug(
+                        "Sync tasks added {}, queued {}, running {}".format(
+                            added_count,
+                            self.scheduler.queued_count,
+                            self.scheduler.running_count
+                        )
+                    )
 
                 duration = time.time() - start_time
                 self.log.debug("One loop took {:.2f}s".format(duration))
@@ -481,6 +501,7 @@ class SyncServerThread(threading.Thread):
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
+        self.scheduler.stop()
 
     async def check_shutdown(self):
         """ Future that is running and checks if server should be running
@@ -498,6 +519,8 @@ class SyncServerThread(threading.Thread):
                  task is not asyncio.current_task()]
         list(map(lambda task: task.cancel(), tasks))  # cancel all the tasks
         results = await asyncio.gather(*tasks, return_exceptions=True)
+        # store results of already finished files
+        self.scheduler.flush()
         self.log.debug(
             f'Finished awaiting cancelled tasks, results: {results}...')
         await self.loop.shutdown_asyncgens()
@@ -1,7 +1,7 @@
 import os
 import sys
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 import threading
 import copy
 import signal
@@ -9,11 +9,13 @@ from collections import deque, defaultdict
 
 import click
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 
 from openpype.client import (
     get_projects,
     get_representations,
     get_representation_by_id,
+    get_file_info_paths,
 )
 from openpype.modules import OpenPypeModule, ITrayModule, IPluginPaths
 from openpype.settings import (
@@ -108,6 +110,12 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
     LOCAL_SITE = 'local'
     LOG_PROGRESS_SEC = 5  # how often log progress to DB
     DEFAULT_PRIORITY = 50  # higher is better, allowed range 1 - 1000
+    # maximum number of files transferred at the same time for all projects
+    MAX_CONCURRENT_TRANSFERS = 8
+    # how often query all representations in incremental mode (in seconds)
+    DEFAULT_FULL_SCAN_INTERVAL = 600
+    # overlap of incremental queries to cover clock differences of machines
+    SYNC_MODIFIED_MARGIN_SEC = 60
 
     name = "sync_server"
     label = "Sync Queue"
@@ -136,6 +144,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
         self._connection = None
 
+        # state of incremental queries of 'get_sync_representations'
+        self._sync_repres_state = {}
+
         # list of long blocking tasks
         self.long_running_tasks = deque()
         # projects that long tasks are running on
@@ -505,13 +516,19 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
                     self.log.debug("Structure error in {}".format(repre_id))
                     continue
 
-                file_path = repre_file.get("path", "")
-                local_file_path = self.get_local_file_path(project_name,
-                                                           site_name,
-                                                           file_path)
+                # Compact file info of sequence contains multiple files
+                local_file_paths = [
+                    self.get_local_file_path(project_name,
+                                             site_name,
+                                             file_path)
+                    for file_path in get_file_info_paths(repre_file)
+                ]
+                local_file_path = local_file_paths[0]
 
-                file_exists = (local_file_path and
-                               os.path.exists(local_file_path))
+                file_exists = all(
+                    path and os.path.exists(path)
+                    for path in local_file_paths
+                )
                 if not is_on_site:
                     if file_exists:
                         self.log.debug(
@@ -1681,8 +1698,23 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
         return sites.get(site, 'N/A')
 
+    def get_full_scan_interval(self, project_name):
+        """
+            Return count of seconds after which incremental query of
+            representations to sync falls back to query of all
+            representations.
+        Returns:
+            (int): in seconds
+        """
+        config = self.sync_project_settings[project_name]["config"]
+        interval = config.get("full_scan_interval")
+        if not interval:
+            return self.DEFAULT_FULL_SCAN_INTERVAL
+        return int(interval)
+
     @time_function
-    def get_sync_representations(self, project_name, active_site, remote_site):
+    def get_sync_representations(self, project_name, active_site, remote_site,
+                                 incremental=False):
         """
             Get representations that should be synced, these could be
             recognised by presence of document in 'files.sites', where key is
@@ -1692,12 +1724,19 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             Querying of 'to-be-synched' files is offloaded to Mongod for
             better performance. Goal is to get as few representations as
             possible.
+
+            In 'incremental' mode are queried only representations which
+            were created or had site records changed ('sync_modified_dt')
+            since last query and representations which were returned by last
+            query (not yet synchronized). All representations are queried
+            once per 'get_full_scan_interval'.
         Args:
             project_name (string):
             active_site (string): identifier of current active site (could be
                 'local_0' when working from home, 'studio' when working in the
                 studio (default)
             remote_site (string): identifier of remote site I want to sync to
+            incremental (bool): query only changed representations
 
         Returns:
             (list) of dictionaries
@@ -1747,6 +1786,29 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             ]
         }
 
+        query_time = datetime.utcnow()
+        state_key = (project_name, active_site, remote_site)
+        state = self._sync_repres_state.get(state_key)
+        full_scan = (
+            not incremental
+            or state is None
+            or (
+                time.time() - state["full_scan_time"]
+                >= self.get_full_scan_interval(project_name)
+            )
+        )
+        if not full_scan:
+            since = state["watermark"] - timedelta(
+                seconds=self.SYNC_MODIFIED_MARGIN_SEC)
+            match = {"$and": [
+                match,
+                {"$or": [
+                    {"_id": {"$in": list(state["pending_ids"])}},
+                    {"_id": {"$gte": ObjectId.from_datetime(since)}},
+                    {"sync_modified_dt": {"$gte": since}}
+                ]}
+            ]}
+
         aggr = [
             {"$match": match},
             {'$unwind': '$files'},
@@ -1787,7 +1849,17 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             active_site, remote_site
         ))
         self.log.debug("query: {}".format(aggr))
-        representations = self.connection.aggregate(aggr)
+        representations = list(self.connection.aggregate(aggr))
+
+        if incremental:
+            full_scan_time = time.time()
+            if not full_scan:
+                full_scan_time = state["full_scan_time"]
+            self._sync_repres_state[state_key] = {
+                "watermark": query_time,
+                "full_scan_time": full_scan_time,
+                "pending_ids": {repre["_id"] for repre in representations}
+            }
 
         return representations
 
@@ -1867,6 +1939,57 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         Returns:
             None
         """
+        query, update, arr_filter = self._prepare_update_db(
+            new_file_id, file, representation, site, error, progress,
+            priority
+        )
+        self.connection.database[project_name].update_one(
+            query,
+            update,
+            upsert=True,
+            array_filters=arr_filter
+        )
+
+        if progress is not None or priority is not None:
+            return
+
+        self._log_update_db(new_file_id, file, representation, error)
+
+    def update_db_many(self, project_name, items):
+        """
+            Update results of multiple synced files with single bulk write.
+
+        Args:
+            project_name (string): name of project
+            items (list): of tuples (new_file_id, file, representation,
+                site, error) - same meaning as arguments of 'update_db'
+
+        Returns:
+            None
+        """
+        if not items:
+            return
+
+        operations = []
+        for new_file_id, file, representation, site, error in items:
+            query, update, arr_filter = self._prepare_update_db(
+                new_file_id, file, representation, site, error
+            )
+            operations.append(UpdateOne(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            ))
+
+        self.connection.database[project_name].bulk_write(operations)
+
+        for new_file_id, file, representation, _, error in items:
+            self._log_update_db(new_file_id, file, representation, error)
+
+    def _prepare_update_db(self, new_file_id, file, representation, site,
+                           error=None, progress=None, priority=None):
+        """Prepare query, update and array filters for 'update_db'."""
         representation_id = representation.get("_id")
         file_id = None
         if file:
@@ -1890,6 +2013,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             tries += 1
 
             update["$set"] = self._get_error_dict(error, tries)
+        update["$set"].update(self._get_sync_modified_dict())
 
         arr_filter = [
             {'s.name': site}
@@ -1897,16 +2021,10 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         if file_id:
             arr_filter.append({'f._id': ObjectId(file_id)})
 
-        self.connection.database[project_name].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
-
-        if progress is not None or priority is not None:
-            return
+        return query, update, arr_filter
 
+    def _log_update_db(self, new_file_id, file, representation, error):
+        representation_id = representation.get("_id")
         status = 'failed'
         error_str = 'with error {}'.format(error)
         if new_file_id:
@@ -2048,6 +2166,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         query = {
             "_id": ObjectId(representation_id)
         }
+        update.setdefault("$set", {}).update(self._get_sync_modified_dict())
 
         self.connection.database[project_name].update_one(
             query,
@@ -2236,21 +2355,22 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
             local_file_path = ''
             for file in representation.get("files"):
-                local_file_path = self.get_local_file_path(project_name,
-                                                           site_name,
-                                                           file.get("path", "")
-                                                           )
-                try:
-                    self.log.debug("Removing {}".format(local_file_path))
-                    os.remove(local_file_path)
-                except IndexError:
-                    msg = "No file set for {}".format(representation_id)
-                    self.log.debug(msg)
-                    raise ValueError(msg)
-                except OSError:
-                    msg = "File {} cannot be removed".format(file["path"])
-                    self.log.warning(msg)
-                    raise ValueError(msg)
+                # Compact file info of sequence contains multiple files
+                for path in get_file_info_paths(file):
+                    local_file_path = self.get_local_file_path(project_name,
+                                                               site_name,
+                                                               path)
+                    try:
+                        self.log.debug("Removing {}".format(local_file_path))
+                        os.remove(local_file_path)
+                    except IndexError:
+                        msg = "No file set for {}".format(representation_id)
+                        self.log.debug(msg)
+                        raise ValueError(msg)
+                    except OSError:
+                        msg = "File {} cannot be removed".format(path)
+                        self.log.warning(msg)
+                        raise ValueError(msg)
 
             folder = None
             try:
@@ -2298,6 +2418,15 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         self.enabled = no_errors
         self.widget.show()
 
+    def _get_sync_modified_dict(self):
+        """
+            Provide time of last change of site records used by
+            incremental query of representations to sync.
+        Returns:
+            (dictionary)
+        """
+        return {"sync_modified_dt": datetime.utcnow()}
+
     def _get_success_dict(self, new_file_id):
         """
             Provide success metadata ("id", "created_dt") to be stored in Db.
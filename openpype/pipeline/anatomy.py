@@ -145,6 +145,10 @@ class BaseAnatomy(object):
         """Wrapper for Roots `find_root_template_from_path`."""
         return self.roots_obj.find_root_template_from_path(*args, **kwargs)
 
+    def find_root_templates_from_paths(self, *args, **kwargs):
+        """Wrapper for Roots `find_root_templates_from_paths`."""
+        return self.roots_obj.find_root_templates_from_paths(*args, **kwargs)
+
     def path_remapper(self, *args, **kwargs):
         """Wrapper for Roots `path_remapper`."""
         return self.roots_obj.path_remapper(*args, **kwargs)
@@ -634,7 +638,8 @@ class AnatomyStringTemplate(StringTemplate):
 
         anatomy_templates = self.anatomy_templates
         if not data.get("root"):
-            data = copy.deepcopy(data)
+            # Formatting does not modify data so shallow copy is enough
+            data = copy.copy(data)
             data["root"] = anatomy_templates.anatomy.roots
         result = StringTemplate.format(self, data)
         rootless_path = anatomy_templates.rootless_path_from_result(result)
@@ -986,7 +991,8 @@ class AnatomyTemplates(TemplatesDict):
         return output
 
     def format(self, data, strict=True):
-        copy_data = copy.deepcopy(data)
+        # Data are deep copied in 'TemplatesDict.format'
+        copy_data = copy.copy(data)
         roots = self.roots
         if roots:
             copy_data["root"] = roots
@@ -1231,6 +1237,103 @@ class RootItem(FormatObject):
         return (result, output)
 
 
+class RootsPrefixIndex:
+    """Index of root values of all platforms for fast lookup in paths.
+
+    Root values are stored in mappings by their length, so finding root of
+    a path needs one lookup per distinct root value length instead of
+    comparison with each root of each platform. Windows root values are
+    compared case insensitive.
+
+    Result is the same as from 'RootItem.find_root_template_from_path'
+    called on roots in their order.
+
+    Args:
+        roots (Union[RootItem, dict[str, Any]]): Roots to index.
+    """
+
+    def __init__(self, roots):
+        # Root value -> (priority, root item, root name)
+        self._values = {}
+        self._lowered_values = {}
+        self._lengths = []
+
+        lengths = set()
+        for priority, root_item, root_name, root_os, root_path in (
+            self._iter_root_values(roots)
+        ):
+            mapping = self._values
+            if root_os == "windows":
+                mapping = self._lowered_values
+                root_path = root_path.lower()
+
+            if root_path not in mapping:
+                mapping[root_path] = (priority, root_item, root_name)
+            lengths.add(len(root_path))
+        self._lengths = sorted(lengths)
+
+    @classmethod
+    def _iter_root_values(cls, roots):
+        priority = 0
+        for root_item, root_name in cls._iter_root_items(roots):
+            for root_os, root_path in root_item.cleaned_data.items():
+                # Skip empty paths
+                if root_path:
+                    yield priority, root_item, root_name, root_os, root_path
+                    priority += 1
+
+    @classmethod
+    def _iter_root_items(cls, roots, root_name=None):
+        if isinstance(roots, RootItem):
+            yield roots, root_name
+            return
+
+        for key, value in roots.items():
+            for item in cls._iter_root_items(value, root_name or key):
+                yield item
+
+    def find(self, path):
+        """Find root in path.
+
+        Args:
+            path (str): Path where root value should be found.
+
+        Returns:
+            tuple[bool, str, Union[str, None]]: Success, path with replaced
+                root value with formattable key and name of root.
+        """
+        mod_path = str(path).replace("\\", "/")
+        lowered_path = None
+        if self._lowered_values:
+            lowered_path = mod_path.lower()
+
+        path_len = len(mod_path)
+        match = None
+        match_len = None
+        for length in self._lengths:
+            if length > path_len:
+                break
+            found = self._values.get(mod_path[:length])
+            if found is not None and (match is None or found[0] < match[0]):
+                match = found
+                match_len = length
+
+            if lowered_path is None:
+                continue
+
+            found = self._lowered_values.get(lowered_path[:length])
+            if found is not None and (match is None or found[0] < match[0]):
+                match = found
+                match_len = length
+
+        if match is None:
+            return False, str(path), None
+
+        _, root_item, root_name = match
+        replacement = "{" + root_item.full_key() + "}"
+        return True, replacement + mod_path[match_len:], root_name
+
+
 class Roots:
     """Object which should be used for formatting "root" key in templates.
 
@@ -1245,6 +1348,7 @@ class Roots:
         self.anatomy = anatomy
         self.loaded_project = None
         self._roots = None
+        self._prefix_index = None
 
     def __format__(self, *args, **kwargs):
         return self.roots.__format__(*args, **kwargs)
@@ -1255,6 +1359,24 @@ class Roots:
     def reset(self):
         """Reset current roots value."""
         self._roots = None
+        self._prefix_index = None
+
+    def get_prefix_index(self):
+        """Index of current roots for fast lookup in paths.
+
+        Returns:
+            RootsPrefixIndex: Index of current roots.
+
+        Raises:
+            ValueError: When roots can't be loaded.
+        """
+        roots = self.roots
+        if roots is None:
+            raise ValueError("Roots are not set. Can't find path.")
+
+        if self._prefix_index is None or self._prefix_index[0] is not roots:
+            self._prefix_index = (roots, RootsPrefixIndex(roots))
+        return self._prefix_index[1]
 
     def path_remapper(
         self, path, dst_platform=None, src_platform=None, roots=None
@@ -1319,10 +1441,12 @@ class Roots:
             log.debug(
                 "Looking for matching root in path \"{}\".".format(path)
             )
-            roots = self.roots
-
-        if roots is None:
-            raise ValueError("Roots are not set. Can't find path.")
+            success, result, root_name = self.get_prefix_index().find(path)
+            if not success:
+                log.warning("No matching root was found in current setting.")
+            elif root_name:
+                log.info("Found match in root \"{}\".".format(root_name))
+            return success, result
 
         if isinstance(roots, RootItem):
             return roots.find_root_template_from_path(path)
@@ -1336,6 +1460,31 @@ class Roots:
         log.warning("No matching root was found in current setting.")
         return (False, path)
 
+    def find_root_templates_from_paths(self, paths):
+        """Find root values in multiple paths at once.
+
+        Same as 'find_root_template_from_path' for each path, without
+        logging of each path.
+
+        Args:
+            paths (Iterable[str]): Source paths where root will be searched.
+
+        Returns:
+            list[tuple[bool, str]]: Success and path with or without replaced
+                root with formatting key for each path.
+
+        Raises:
+            ValueError: When roots can't be loaded.
+        """
+        prefix_index = self.get_prefix_index()
+        output = []
+        for path in paths:
+            success, result, _ = prefix_index.find(path)
+            output.append((success, result))
+
+        log.debug("Looked for matching root in {} paths.".format(len(output)))
+        return output
+
     def set_root_environments(self):
         """Set root environments for current project."""
         for key, value in self.root_environments().items():
@@ -1,6 +1,11 @@
 import re
 import os
 import json
+import atexit
+import hashlib
+import itertools
+import threading
+import subprocess
 import contextlib
 import functools
 import platform
@@ -13,6 +18,10 @@ from openpype.settings import get_project_settings
 from openpype.lib import (
     StringTemplate,
     run_openpype_process,
+    get_openpype_execute_args,
+    clean_envs_for_openpype_process,
+    is_running_from_build,
+    CREATE_NO_WINDOW,
     Logger
 )
 from openpype.pipeline import Anatomy
@@ -36,6 +45,203 @@ class DeprecatedWarning(DeprecationWarning):
     pass
 
 
+class OCIOWorkerError(RuntimeError):
+    """OCIO worker process failed or is not available."""
+    pass
+
+
+class _OCIOWorker(object):
+    """Persistent process answering OCIO queries.
+
+    Process is started once per session with 'ocio_wrapper.py serve' and
+    communicates using json lines over stdin/stdout, so python
+    interpreter and addons startup is not paid for each query.
+    Used only when PyOpenColorIO is not available in current process.
+    """
+
+    # Must match 'RPC_RESPONSE_PREFIX' in 'ocio_wrapper.py'
+    response_prefix = "OCIO_RPC_RESPONSE:"
+    _instance = None
+
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+
+    @classmethod
+    def get_worker(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+            atexit.register(cls._instance.stop)
+        return cls._instance
+
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def request(self, method, **params):
+        """Send request to worker process and wait for response.
+
+        Args:
+            method (str): '<group>.<command>' of 'ocio_wrapper.py' command.
+            **params: Arguments of the command.
+
+        Raises:
+            OCIOWorkerError: Worker process is not available.
+            RuntimeError: Command failed in worker process.
+
+        Returns:
+            Any: Result of the command.
+        """
+        with self._lock:
+            if not self.is_running():
+                self._start()
+
+            request_id = next(self._counter)
+            line = json.dumps({
+                "id": request_id, "method": method, "params": params
+            })
+            try:
+                self._process.stdin.write(line + "\n")
+                self._process.stdin.flush()
+            except (IOError, OSError) as exc:
+                self.stop()
+                raise OCIOWorkerError(
+                    "Failed to send request to OCIO worker: {}".format(exc))
+
+            while True:
+                line = self._process.stdout.readline()
+                if not line:
+                    self.stop()
+                    raise OCIOWorkerError("OCIO worker process has ended")
+
+                if not line.startswith(self.response_prefix):
+                    # Output of process bootstrap
+                    log.debug(line.rstrip())
+                    continue
+
+                response = json.loads(line[len(self.response_prefix):])
+                if response.get("id") != request_id:
+                    continue
+                if "error" in response:
+                    raise RuntimeError(
+                        "OCIO worker failed '{}': {}".format(
+                            method, response["error"]))
+                return response["result"]
+
+    def stop(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except Exception:
+            process.kill()
+
+    def _start(self):
+        args = get_openpype_execute_args(
+            "run", get_ocio_config_script_path(), "serve"
+        )
+        env = clean_envs_for_openpype_process(os.environ)
+        # Only keep OpenPype version if we are running from build.
+        if not is_running_from_build():
+            env.pop("OPENPYPE_VERSION", None)
+
+        log.info("Starting OCIO worker: {}".format(" ".join(args)))
+        kwargs = {}
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = CREATE_NO_WINDOW
+        try:
+            self._process = subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=env,
+                universal_newlines=True,
+                bufsize=1,
+                **kwargs
+            )
+        except (IOError, OSError) as exc:
+            self._process = None
+            raise OCIOWorkerError(
+                "Failed to start OCIO worker: {}".format(exc))
+
+
+class _OCIOResultsCache(object):
+    """Results of OCIO subprocess queries cached on disk.
+
+    Results are stored per config path and its modification time, so
+    change of config invalidates cached results. Only results which depend
+    only on config (e.g. colorspaces, views, version) should be cached so
+    number of results stored per config is bounded.
+    """
+
+    _data_by_key = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _get_cache_filepath(config_path):
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            return None
+        key = "{}|{}|{}".format(
+            os.path.normpath(config_path), stat.st_mtime, stat.st_size)
+        return os.path.join(
+            tempfile.gettempdir(),
+            "openpype_ocio_cache",
+            hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json"
+        )
+
+    @classmethod
+    def _get_data(cls, cache_filepath):
+        data = cls._data_by_key.get(cache_filepath)
+        if data is None:
+            data = {}
+            if os.path.exists(cache_filepath):
+                try:
+                    with open(cache_filepath, "r") as stream:
+                        data = json.load(stream)
+                except (IOError, OSError, ValueError):
+                    log.debug("Failed to read OCIO cache", exc_info=True)
+            cls._data_by_key[cache_filepath] = data
+        return data
+
+    @classmethod
+    def get(cls, config_path, keys):
+        """Get cached results.
+
+        Returns:
+            dict[str, Any]: Cached results by passed keys.
+        """
+        cache_filepath = cls._get_cache_filepath(config_path)
+        if not cache_filepath:
+            return {}
+        with cls._lock:
+            data = cls._get_data(cache_filepath)
+            return {key: data[key] for key in keys if key in data}
+
+    @classmethod
+    def set(cls, config_path, results):
+        cache_filepath = cls._get_cache_filepath(config_path)
+        if not cache_filepath:
+            return
+        with cls._lock:
+            data = cls._get_data(cache_filepath)
+            data.update(results)
+            try:
+                dirpath = os.path.dirname(cache_filepath)
+                if not os.path.exists(dirpath):
+                    os.makedirs(dirpath)
+                tmp_path = "{}.{}.tmp".format(cache_filepath, os.getpid())
+                with open(tmp_path, "w") as stream:
+                    json.dump(data, stream)
+                os.replace(tmp_path, cache_filepath)
+            except (IOError, OSError):
+                log.debug("Failed to write OCIO cache", exc_info=True)
+
+
 def deprecated(new_destination):
     """Mark functions as deprecated.
 
@@ -283,25 +489,48 @@ def get_config_file_rules_colorspace_from_filepath(config_path, filepath):
     Returns:
         Any[str, None]: matching colorspace name
     """
-    if not compatibility_check():
+    return get_config_file_rules_colorspaces_from_filepaths(
+        config_path, [filepath]
+    )[filepath]
+
+
+def get_config_file_rules_colorspaces_from_filepaths(config_path, filepaths):
+    """Get colorspaces for multiple file paths from OCIO v2 file-rules.
+
+    All file paths are resolved with single query to OCIO worker process
+    if PyOpenColorIO is not available in current process.
+
+    Args:
+        config_path (str): path leading to config.ocio file
+        filepaths (Iterable[str]): paths leading to files
+
+    Returns:
+        dict[str, Union[str, None]]: matching colorspace name by file path
+    """
+    filepaths = list(filepaths)
+    if compatibility_check():
+        # TODO: refactor this so it is not imported but part of this file
+        from openpype.scripts.ocio_wrapper import _get_config_file_rules_colorspaces_from_filepaths  # noqa: E501
+
+        results = _get_config_file_rules_colorspaces_from_filepaths(
+            config_path, filepaths)
+
+    else:
         # python environment is not compatible with PyOpenColorIO
         # needs to be run in subprocess
-        result_data = _get_wrapped_with_subprocess(
-            "colorspace", "get_config_file_rules_colorspace_from_filepath",
-            config_path=config_path,
-            filepath=filepath
+        results = _get_wrapped_with_subprocess_batch(
+            "colorspace",
+            "get_config_file_rules_colorspace_from_filepath",
+            "get_config_file_rules_colorspaces_from_filepaths",
+            "filepath",
+            filepaths,
+            config_path=config_path
         )
-        if result_data:
-            return result_data[0]
 
-    # TODO: refactor this so it is not imported but part of this file
-    from openpype.scripts.ocio_wrapper import _get_config_file_rules_colorspace_from_filepath  # noqa: E501
-
-    result_data = _get_config_file_rules_colorspace_from_filepath(
-        config_path, filepath)
-
-    if result_data:
-        return result_data[0]
+    return {
+        filepath: result_data[0] if result_data else None
+        for filepath, result_data in zip(filepaths, results)
+    }
 
 
 def parse_colorspace_from_filepath(
@@ -420,10 +649,88 @@ def get_data_subprocess(config_path, data_type):
     )
 
 
+def _get_ocio_cache_key(command_group, command, kwargs):
+    return json.dumps([command_group, command, kwargs], sort_keys=True)
+
+
 def _get_wrapped_with_subprocess(command_group, command, **kwargs):
     """Get data via subprocess
 
-    Wrapper for Python 2 hosts.
+    Wrapper for Python 2 hosts. Data are queried from persistent OCIO
+    worker process and cached on disk per config file.
+
+    Args:
+        command_group (str): command group name
+        command (str): command name
+        **kwargs: command arguments
+
+    Returns:
+        Any[dict, None]: data
+    """
+    config_path = kwargs.get("config_path") or kwargs.get("in_path")
+    cache_key = _get_ocio_cache_key(command_group, command, kwargs)
+    cached = _OCIOResultsCache.get(config_path, [cache_key])
+    if cache_key in cached:
+        return cached[cache_key]
+
+    try:
+        result = _OCIOWorker.get_worker().request(
+            "{}.{}".format(command_group, command), **kwargs
+        )
+    except OCIOWorkerError:
+        log.warning(
+            "OCIO worker is not available, using single subprocess.",
+            exc_info=True)
+        result = _run_wrapped_subprocess(command_group, command, **kwargs)
+
+    _OCIOResultsCache.set(config_path, {cache_key: result})
+    return result
+
+
+def _get_wrapped_with_subprocess_batch(
+    command_group, command, batch_command, batch_key, batch_values, **kwargs
+):
+    """Get data for multiple values of one argument via subprocess.
+
+    All values are sent to OCIO worker in single request of
+    'batch_command' which expects list of values in '<key>s' argument.
+    Results are not cached on disk as they depend on passed values (e.g.
+    file paths) and their number would not be bounded.
+
+    Args:
+        command_group (str): command group name
+        command (str): command name of single value
+        batch_command (str): command name of multiple values
+        batch_key (str): argument name which has multiple values
+        batch_values (list[Any]): values of 'batch_key' argument
+        **kwargs: other command arguments
+
+    Returns:
+        list[Any]: data for each value
+    """
+    if not batch_values:
+        return []
+
+    try:
+        return _OCIOWorker.get_worker().request(
+            "{}.{}".format(command_group, batch_command),
+            **dict(kwargs, **{batch_key + "s": list(batch_values)})
+        )
+    except OCIOWorkerError:
+        log.warning(
+            "OCIO worker is not available, using single subprocess.",
+            exc_info=True)
+
+    return [
+        _run_wrapped_subprocess(
+            command_group, command, **dict(kwargs, **{batch_key: value})
+        )
+        for value in batch_values
+    ]
+
+
+def _run_wrapped_subprocess(command_group, command, **kwargs):
+    """Run single command of ocio wrapper in new process.
 
     Args:
         command_group (str): command group name
@@ -1176,20 +1483,9 @@ def get_display_view_colorspace_subprocess(config_path, display, view):
         view color space name (str) e.g. "Output - sRGB"
     """
 
-    with _make_temp_json_file() as tmp_json_path:
-        # Prepare subprocess arguments
-        args = [
-            "run", get_ocio_config_script_path(),
-            "config", "get_display_view_colorspace_name",
-            "--in_path", config_path,
-            "--out_path", tmp_json_path,
-            "--display", display,
-            "--view", view
-        ]
-        log.debug("Executing: {}".format(" ".join(args)))
-
-        run_openpype_process(*args, logger=log)
-
-        # return default view colorspace name
-        with open(tmp_json_path, "r") as f:
-            return json.load(f)
+    return _get_wrapped_with_subprocess(
+        "config", "get_display_view_colorspace_name",
+        in_path=config_path,
+        display=display,
+        view=view
+    )
@@ -1,12 +1,16 @@
 """Functions useful for delivery of published representations."""
 import os
 import copy
+import json
+import time
 import shutil
 import glob
+import threading
 import clique
 import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from openpype.lib import create_hard_link
+from openpype.lib import Logger, create_hard_link, format_file_size
 
 
 def _copy_file(src_path, dst_path):
@@ -27,6 +31,376 @@ def _copy_file(src_path, dst_path):
         shutil.copyfile(src_path, dst_path)
 
 
+def _transfer_file(src_path, dst_path):
+    """Hardlink or copy file to destination, replacing existing file.
+
+    Copy is created under temporary name and renamed when finished, so
+    interrupted delivery never leaves incomplete file under destination
+    path.
+    """
+
+    dst_dir = os.path.dirname(dst_path)
+    try:
+        os.makedirs(dst_dir)
+    except OSError:
+        # Folder may be created by other transfer at the same time
+        if not os.path.isdir(dst_dir):
+            raise
+
+    if os.path.exists(dst_path):
+        os.remove(dst_path)
+
+    try:
+        create_hard_link(src_path, dst_path)
+        return
+    except OSError:
+        pass
+
+    tmp_path = "{}.delivery_tmp".format(dst_path)
+    try:
+        shutil.copyfile(src_path, tmp_path)
+        os.replace(tmp_path, dst_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class DeliveryProgress(object):
+    """Progress of delivery job with throughput and estimated time.
+
+    Skipped files, which were already delivered, are not used to calculate
+    throughput.
+    """
+
+    def __init__(self):
+        self.files_total = 0
+        self.files_done = 0
+        self.files_skipped = 0
+        self.files_failed = 0
+        self.bytes_total = 0
+        self.bytes_done = 0
+        self.bytes_skipped = 0
+        self.start_time = time.time()
+
+    @property
+    def files_finished(self):
+        return self.files_done + self.files_skipped + self.files_failed
+
+    @property
+    def ratio(self):
+        """Finished part of delivery in range 0.0-1.0.
+
+        Returns:
+            float: Ratio based on size of files, or on count of files
+                if are empty.
+        """
+        if self.bytes_total:
+            return (
+                float(self.bytes_done + self.bytes_skipped) / self.bytes_total
+            )
+        if self.files_total:
+            return float(self.files_finished) / self.files_total
+        return 1.0
+
+    @property
+    def elapsed(self):
+        return time.time() - self.start_time
+
+    @property
+    def throughput(self):
+        """Transferred bytes per second."""
+        elapsed = self.elapsed
+        if not elapsed:
+            return 0.0
+        return self.bytes_done / elapsed
+
+    @property
+    def eta(self):
+        """Estimated time to finish delivery in seconds.
+
+        Returns:
+            Union[float, None]: Seconds or None if can't be estimated yet.
+        """
+        remaining = self.bytes_total - self.bytes_done - self.bytes_skipped
+        if remaining <= 0:
+            return 0.0
+        throughput = self.throughput
+        if not throughput:
+            return None
+        return remaining / throughput
+
+    def get_message(self):
+        """Human readable state of delivery."""
+        eta = self.eta
+        if eta is None:
+            eta_text = "-"
+        else:
+            eta_text = time.strftime("%H:%M:%S", time.gmtime(eta))
+        return "{}/{} files, {} of {}, {}/s, ETA {}".format(
+            self.files_finished,
+            self.files_total,
+            format_file_size(self.bytes_done + self.bytes_skipped),
+            format_file_size(self.bytes_total),
+            format_file_size(self.throughput),
+            eta_text
+        )
+
+
+class DeliveryJob(object):
+    """Deliver files concurrently with possibility to resume.
+
+    Transfers are added with 'add_transfer' and delivered with 'process'.
+    Files are hardlinked if possible, copied if not, by a pool of workers.
+
+    Delivered files are stored to manifest json file. Files which are
+    already in manifest with the same source size and modification time
+    are skipped, so failed or interrupted delivery can be resumed.
+
+    Args:
+        manifest_path (Optional[str]): Path to manifest json file. Manifest
+            is stored to common directory of destinations if not passed.
+        max_workers (Optional[int]): Maximum number of files transferred
+            at the same time.
+        log (Optional[logging.Logger]): Logger used for messages.
+    """
+
+    # Filename of manifest created in common directory of destinations
+    manifest_filename = ".delivery_manifest.json"
+    # How often is manifest stored during delivery in seconds
+    manifest_save_interval = 5
+    # Default maximum number of files transferred at the same time
+    default_max_workers = 8
+
+    def __init__(self, manifest_path=None, max_workers=None, log=None):
+        if max_workers is None:
+            max_workers = self.default_max_workers
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+        self._manifest_path = manifest_path
+        self._max_workers = max(1, max_workers)
+        self._transfers = collections.OrderedDict()
+        self._manifest = {}
+        self._manifest_lock = threading.Lock()
+        self.log = log
+
+    @property
+    def transfers(self):
+        """Transfers added to the job.
+
+        Returns:
+            list[tuple[str, str]]: Source and destination paths.
+        """
+        return [(src, dst) for dst, src in self._transfers.items()]
+
+    def add_transfer(self, src_path, dst_path):
+        """Add file to deliver.
+
+        Args:
+            src_path (str): Path to source file.
+            dst_path (str): Delivery path of the file.
+
+        Returns:
+            bool: Transfer was added, destination was not used yet.
+        """
+        src_path = os.path.normpath(src_path)
+        dst_path = os.path.normpath(dst_path)
+        if dst_path in self._transfers:
+            if self._transfers[dst_path] != src_path:
+                self.log.warning(
+                    "Destination {} is already used by {}. Skipped {}".format(
+                        dst_path, self._transfers[dst_path], src_path
+                    )
+                )
+            return False
+        self._transfers[dst_path] = src_path
+        return True
+
+    def get_manifest_path(self):
+        """Path to manifest json file.
+
+        Returns:
+            Union[str, None]: Path to manifest or None if destinations don't
+                have usable common directory.
+        """
+        if self._manifest_path or not self._transfers:
+            return self._manifest_path
+
+        try:
+            common_dir = os.path.commonpath([
+                os.path.dirname(dst_path)
+                for dst_path in self._transfers
+            ])
+        except ValueError:
+            # Destinations are on different drives
+            return None
+
+        # Don't create manifest in root of filesystem
+        if not common_dir or os.path.dirname(common_dir) == common_dir:
+            return None
+        return os.path.join(common_dir, self.manifest_filename)
+
+    def _load_manifest(self, manifest_path):
+        self._manifest = {}
+        if not manifest_path or not os.path.exists(manifest_path):
+            return
+
+        try:
+            with open(manifest_path, "r") as stream:
+                data = json.load(stream)
+            self._manifest = data["files"]
+        except Exception:
+            self.log.warning(
+                "Failed to read delivery manifest {}".format(manifest_path),
+                exc_info=True
+            )
+
+    def _save_manifest(self, manifest_path):
+        if not manifest_path:
+            return
+
+        with self._manifest_lock:
+            data = {"files": dict(self._manifest)}
+
+        manifest_dir = os.path.dirname(manifest_path)
+        tmp_path = "{}.tmp".format(manifest_path)
+        try:
+            if not os.path.exists(manifest_dir):
+                os.makedirs(manifest_dir)
+            with open(tmp_path, "w") as stream:
+                json.dump(data, stream)
+            os.replace(tmp_path, manifest_path)
+        except Exception:
+            self.log.warning(
+                "Failed to store delivery manifest {}".format(manifest_path),
+                exc_info=True
+            )
+
+    def _is_delivered(self, src_path, dst_path, src_stat):
+        try:
+            dst_stat = os.stat(dst_path)
+        except OSError:
+            return False
+
+        if dst_stat.st_size != src_stat.st_size:
+            return False
+
+        entry = self._manifest.get(dst_path)
+        # File was delivered without manifest
+        if entry is None:
+            return True
+
+        return (
+            entry.get("src") == src_path
+            and entry.get("size") == src_stat.st_size
+            and entry.get("mtime") == src_stat.st_mtime
+        )
+
+    def _deliver(self, src_path, dst_path, src_stat):
+        _transfer_file(src_path, dst_path)
+        with self._manifest_lock:
+            self._manifest[dst_path] = {
+                "src": src_path,
+                "size": src_stat.st_size,
+                "mtime": src_stat.st_mtime,
+            }
+
+    def process(self, report_items=None, progress_callback=None):
+        """Deliver all added transfers.
+
+        Failed transfers don't stop the delivery. They're added to report
+        items and are delivered again on next run.
+
+        Args:
+            report_items (Optional[collections.defaultdict]): Report items
+                where are added error messages.
+            progress_callback (Optional[Callable[[DeliveryProgress], None]]):
+                Called in current thread after each finished file.
+
+        Returns:
+            DeliveryProgress: Final progress of delivery.
+        """
+        if report_items is None:
+            report_items = collections.defaultdict(list)
+
+        progress = DeliveryProgress()
+        manifest_path = self.get_manifest_path()
+        self._load_manifest(manifest_path)
+
+        to_deliver = []
+        for dst_path, src_path in self._transfers.items():
+            try:
+                src_stat = os.stat(src_path)
+            except OSError:
+                report_items["Source file was not found"].append(src_path)
+                continue
+
+            progress.files_total += 1
+            progress.bytes_total += src_stat.st_size
+            if self._is_delivered(src_path, dst_path, src_stat):
+                progress.files_skipped += 1
+                progress.bytes_skipped += src_stat.st_size
+                with self._manifest_lock:
+                    self._manifest.setdefault(dst_path, {
+                        "src": src_path,
+                        "size": src_stat.st_size,
+                        "mtime": src_stat.st_mtime,
+                    })
+                continue
+            to_deliver.append((src_path, dst_path, src_stat))
+
+        if progress.files_skipped:
+            self.log.info(
+                "Skipped {} already delivered files".format(
+                    progress.files_skipped
+                )
+            )
+
+        if progress_callback is not None:
+            progress_callback(progress)
+
+        if not to_deliver:
+            self._save_manifest(manifest_path)
+            return progress
+
+        last_save = time.time()
+        max_workers = min(self._max_workers, len(to_deliver))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._deliver, *item): item
+                for item in to_deliver
+            }
+            for future in as_completed(futures):
+                src_path, dst_path, src_stat = futures[future]
+                try:
+                    future.result()
+                    progress.files_done += 1
+                    progress.bytes_done += src_stat.st_size
+                    self.log.debug("Delivered: {} -> {}".format(
+                        src_path, dst_path
+                    ))
+
+                except Exception as exc:
+                    progress.files_failed += 1
+                    report_items["Failed to deliver files"].append(
+                        "{} -> {} ({})".format(src_path, dst_path, exc)
+                    )
+                    self.log.warning(
+                        "Failed to deliver {}".format(src_path),
+                        exc_info=True
+                    )
+
+                if progress_callback is not None:
+                    progress_callback(progress)
+
+                if time.time() - last_save > self.manifest_save_interval:
+                    self._save_manifest(manifest_path)
+                    last_save = time.time()
+
+        self._save_manifest(manifest_path)
+        self.log.info("Delivery finished: {}".format(progress.get_message()))
+        return progress
+
+
 def get_format_dict(anatomy, location_path):
     """Returns replaced root values from user provider value.
 
@@ -144,7 +518,8 @@ def deliver_single_file(
     anatomy_data,
     format_dict,
     report_items,
-    log
+    log,
+    delivery_job=None
 ):
     """Copy single file to calculated path based on template
 
@@ -158,9 +533,13 @@ def deliver_single_file(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        delivery_job (Optional[DeliveryJob]): Job where the file is added
+            to be delivered later. File is delivered immediately if not
+            passed.
 
     Returns:
-        (collections.defaultdict, int)
+        (collections.defaultdict, int): Report items and count of
+            delivered, or added files if 'delivery_job' is passed.
     """
 
     # Make sure path is valid for all platforms
@@ -178,14 +557,16 @@ def deliver_single_file(
         format_dict
     )
 
-    delivery_folder = os.path.dirname(delivery_path)
-    if not os.path.exists(delivery_folder):
-        os.makedirs(delivery_folder)
-
     log.debug("Copying single: {} -> {}".format(src_path, delivery_path))
-    _copy_file(src_path, delivery_path)
+    if delivery_job is not None:
+        delivery_job.add_transfer(src_path, delivery_path)
+        return report_items, 1
 
-    return report_items, 1
+    delivery_job = DeliveryJob(log=log)
+    delivery_job.add_transfer(src_path, delivery_path)
+    progress = delivery_job.process(report_items)
+
+    return report_items, progress.files_done + progress.files_skipped
 
 
 def deliver_sequence(
@@ -198,7 +579,8 @@ def deliver_sequence(
     report_items,
     log,
     has_renumbered_frame=False,
-    new_frame_start=0
+    new_frame_start=0,
+    delivery_job=None
 ):
     """ For Pype2(mainly - works in 3 too) where representation might not
         contain files.
@@ -218,9 +600,16 @@ def deliver_sequence(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        has_renumbered_frame (Optional[bool]): Renumber frames to start
+            with 'new_frame_start'.
+        new_frame_start (Optional[int]): First frame of renumbered frames.
+        delivery_job (Optional[DeliveryJob]): Job where files are added
+            to be delivered later. Files are delivered immediately if not
+            passed.
 
     Returns:
-        (collections.defaultdict, int)
+        (collections.defaultdict, int): Report items and count of
+            delivered, or added files if 'delivery_job' is passed.
     """
 
     src_path = os.path.normpath(src_path.replace("\\", "/"))
@@ -299,7 +688,6 @@ def deliver_sequence(
     delivery_path = template_obj.format_strict(anatomy_data)
 
     delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
-    delivery_folder = os.path.dirname(delivery_path)
     dst_head, dst_tail = delivery_path.split(frame_indicator)
     dst_padding = src_collection.padding
     dst_collection = clique.Collection(
@@ -308,8 +696,9 @@ def deliver_sequence(
         padding=dst_padding
     )
 
-    if not os.path.exists(delivery_folder):
-        os.makedirs(delivery_folder)
+    process_job = delivery_job is None
+    if process_job:
+        delivery_job = DeliveryJob(log=log)
 
     src_head = src_collection.head
     src_tail = src_collection.tail
@@ -336,8 +725,12 @@ def deliver_sequence(
         dst_padding = dst_collection.format("{padding}") % dst_index
         dst = "{}{}{}".format(dst_head, dst_padding, dst_tail)
         log.debug("Copying single: {} -> {}".format(src, dst))
-        _copy_file(src, dst)
+        delivery_job.add_transfer(src, dst)
 
         uploaded += 1
 
+    if process_job:
+        progress = delivery_job.process(report_items)
+        uploaded = progress.files_done + progress.files_skipped
+
     return report_items, uploaded
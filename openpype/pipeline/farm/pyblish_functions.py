@@ -47,15 +47,34 @@ def remap_source(path, anatomy):
         ValueError: if the root cannot be found.
 
     """
-    success, rootless_path = (
-        anatomy.find_root_template_from_path(path)
-    )
-    if success:
-        source = rootless_path
-    else:
-        raise ValueError(
-            "Root from template path cannot be found: {}".format(path))
-    return source
+    return remap_sources([path], anatomy)[0]
+
+
+def remap_sources(paths, anatomy):
+    """Try to remap multiple paths to rootless paths at once.
+
+    Args:
+        paths (Iterable[str]): Paths to be remapped to rootless.
+        anatomy (Anatomy): Anatomy object to handle remapping
+            itself.
+
+    Returns:
+        list[str]: Remapped paths.
+
+    Throws:
+        ValueError: if the root cannot be found for any of paths.
+
+    """
+    paths = list(paths)
+    output = []
+    for path, (success, rootless_path) in zip(
+        paths, anatomy.find_root_templates_from_paths(paths)
+    ):
+        if not success:
+            raise ValueError(
+                "Root from template path cannot be found: {}".format(path))
+        output.append(rootless_path)
+    return output
 
 
 def extend_frames(asset, subset, start, end):
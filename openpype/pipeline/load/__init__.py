@@ -11,6 +11,7 @@ from .utils import (
     get_contexts_for_repre_docs,
     get_subset_contexts,
     get_representation_context,
+    RepresentationContextResolver,
 
     load_with_repre_context,
     load_with_subset_context,
@@ -65,6 +66,7 @@ __all__ = (
     "get_contexts_for_repre_docs",
     "get_subset_contexts",
     "get_representation_context",
+    "RepresentationContextResolver",
 
     "load_with_repre_context",
     "load_with_subset_context",
@@ -188,6 +188,208 @@ def get_contexts_for_repre_docs(project_name, repre_docs):
     return contexts
 
 
+class RepresentationContextResolver(object):
+    """Resolve parents of many representations with one query per entity.
+
+    Representation, version, subset, asset and last version documents are
+    queried for all passed representations at once. Queried documents are
+    cached on the resolver so next call queries only documents which were
+    not resolved yet. Create new resolver to get up-to-date data.
+
+    Args:
+        project_name (str): Project name.
+        fields (Optional[dict[str, Iterable[str]]]): Fields to query by
+            entity type. Keys are 'representation', 'version', 'subset',
+            'asset' and 'last_version'. All fields are queried for
+            missing keys.
+    """
+
+    def __init__(self, project_name, fields=None):
+        self._project_name = project_name
+        self._fields = fields or {}
+        self._repre_docs_by_id = {}
+        self._version_docs_by_id = {}
+        self._subset_docs_by_id = {}
+        self._asset_docs_by_id = {}
+        self._last_version_docs_by_subset_id = {}
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    def _get_fields(self, entity_type, required_fields):
+        fields = self._fields.get(entity_type)
+        if fields is None:
+            return None
+        return set(fields) | set(required_fields)
+
+    @staticmethod
+    def _query_missing(docs_by_id, entity_ids, query_func):
+        missing_ids = {
+            str(entity_id)
+            for entity_id in entity_ids
+            if entity_id and str(entity_id) not in docs_by_id
+        }
+        if not missing_ids:
+            return
+
+        # Mark all as not found, found documents will replace them
+        for entity_id in missing_ids:
+            docs_by_id[entity_id] = None
+
+        for doc in query_func(missing_ids):
+            docs_by_id[str(doc["_id"])] = doc
+
+    def resolve(self, representation_ids):
+        """Contexts of representations.
+
+        Args:
+            representation_ids (Iterable[Union[str, ObjectId]]): Ids of
+                representations.
+
+        Returns:
+            dict[str, dict[str, Union[dict[str, Any], None]]]: Context by
+                stringified representation id with 'representation',
+                'version', 'subset', 'asset' and 'last_version' documents.
+                Context of hero version has also 'hero_source_version'.
+                Documents which were not found are 'None'.
+        """
+        project_name = self._project_name
+        repre_ids = {
+            str(repre_id)
+            for repre_id in representation_ids
+            if repre_id
+        }
+        self._query_missing(
+            self._repre_docs_by_id,
+            repre_ids,
+            lambda ids: get_representations(
+                project_name,
+                representation_ids=ids,
+                fields=self._get_fields("representation", ["_id", "parent"])
+            )
+        )
+
+        version_fields = self._get_fields(
+            "version", ["_id", "parent", "type", "version_id"]
+        )
+        version_ids = {
+            repre_doc["parent"]
+            for repre_doc in self._get_docs(self._repre_docs_by_id, repre_ids)
+        }
+        self._query_missing(
+            self._version_docs_by_id,
+            version_ids,
+            lambda ids: get_versions(
+                project_name, version_ids=ids, hero=True, fields=version_fields
+            )
+        )
+        version_docs = list(
+            self._get_docs(self._version_docs_by_id, version_ids)
+        )
+        # Versions of hero versions
+        self._query_missing(
+            self._version_docs_by_id,
+            {
+                version_doc["version_id"]
+                for version_doc in version_docs
+                if version_doc["type"] == "hero_version"
+            },
+            lambda ids: get_versions(
+                project_name, version_ids=ids, fields=version_fields
+            )
+        )
+
+        subset_ids = {version_doc["parent"] for version_doc in version_docs}
+        self._query_missing(
+            self._subset_docs_by_id,
+            subset_ids,
+            lambda ids: get_subsets(
+                project_name,
+                subset_ids=ids,
+                fields=self._get_fields("subset", ["_id", "parent"])
+            )
+        )
+        missing_subset_ids = {
+            str(subset_id)
+            for subset_id in subset_ids
+            if str(subset_id) not in self._last_version_docs_by_subset_id
+        }
+        if missing_subset_ids:
+            last_versions = get_last_versions(
+                project_name,
+                missing_subset_ids,
+                fields=self._get_fields("last_version", ["_id", "parent"])
+            )
+            for subset_id in missing_subset_ids:
+                self._last_version_docs_by_subset_id[subset_id] = None
+            for subset_id, version_doc in last_versions.items():
+                self._last_version_docs_by_subset_id[str(subset_id)] = (
+                    version_doc
+                )
+
+        self._query_missing(
+            self._asset_docs_by_id,
+            {
+                subset_doc["parent"]
+                for subset_doc in self._get_docs(
+                    self._subset_docs_by_id, subset_ids
+                )
+            },
+            lambda ids: get_assets(
+                project_name,
+                asset_ids=ids,
+                fields=self._get_fields("asset", ["_id"])
+            )
+        )
+
+        return {
+            repre_id: self._get_context(repre_id)
+            for repre_id in repre_ids
+        }
+
+    @staticmethod
+    def _get_docs(docs_by_id, entity_ids):
+        for entity_id in entity_ids:
+            doc = docs_by_id.get(str(entity_id))
+            if doc is not None:
+                yield doc
+
+    def _get_context(self, repre_id):
+        context = {
+            "representation": self._repre_docs_by_id.get(repre_id),
+            "version": None,
+            "subset": None,
+            "asset": None,
+            "last_version": None,
+        }
+        repre_doc = context["representation"]
+        if repre_doc is None:
+            return context
+
+        version_doc = self._version_docs_by_id.get(str(repre_doc["parent"]))
+        context["version"] = version_doc
+        if version_doc is None:
+            return context
+
+        if version_doc["type"] == "hero_version":
+            context["hero_source_version"] = self._version_docs_by_id.get(
+                str(version_doc["version_id"])
+            )
+
+        subset_id = str(version_doc["parent"])
+        context["last_version"] = (
+            self._last_version_docs_by_subset_id.get(subset_id)
+        )
+        subset_doc = self._subset_docs_by_id.get(subset_id)
+        context["subset"] = subset_doc
+        if subset_doc is not None:
+            context["asset"] = self._asset_docs_by_id.get(
+                str(subset_doc["parent"])
+            )
+        return context
+
+
 def get_subset_contexts(subset_ids, dbcon=None):
     """Return parenthood context for subset.
 
@@ -880,7 +1082,6 @@ def filter_containers(containers, project_name):
         not_found_containers,
         invalid_containers
     )
-    # Query representation docs to get it's version ids
     repre_ids = {
         container["representation"]
         for container in containers
@@ -891,56 +1092,14 @@ def filter_containers(containers, project_name):
             invalid_containers.extend(containers)
         return output
 
-    repre_docs = get_representations(
-        project_name,
-        representation_ids=repre_ids,
-        fields=["_id", "parent"]
-    )
-    # Store representations by stringified representation id
-    repre_docs_by_str_id = {}
-    repre_docs_by_version_id = collections.defaultdict(list)
-    for repre_doc in repre_docs:
-        repre_id = str(repre_doc["_id"])
-        version_id = repre_doc["parent"]
-        repre_docs_by_str_id[repre_id] = repre_doc
-        repre_docs_by_version_id[version_id].append(repre_doc)
-
-    # Query version docs to get it's subset ids
-    # - also query hero version to be able identify if representation
-    #   belongs to existing version
-    version_docs = get_versions(
-        project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True,
-        fields=["_id", "parent", "type"]
-    )
-    verisons_by_id = {}
-    versions_by_subset_id = collections.defaultdict(list)
-    hero_version_ids = set()
-    for version_doc in version_docs:
-        version_id = version_doc["_id"]
-        # Store versions by their ids
-        verisons_by_id[version_id] = version_doc
-        # There's no need to query subsets for hero versions
-        #   - they are considered as latest?
-        if version_doc["type"] == "hero_version":
-            hero_version_ids.add(version_id)
-            continue
-        subset_id = version_doc["parent"]
-        versions_by_subset_id[subset_id].append(version_doc)
-
-    last_versions = get_last_versions(
-        project_name,
-        subset_ids=versions_by_subset_id.keys(),
-        fields=["_id"]
-    )
-    # Figure out which versions are outdated
-    outdated_version_ids = set()
-    for subset_id, last_version_doc in last_versions.items():
-        for version_doc in versions_by_subset_id[subset_id]:
-            version_id = version_doc["_id"]
-            if version_id != last_version_doc["_id"]:
-                outdated_version_ids.add(version_id)
+    resolver = RepresentationContextResolver(project_name, fields={
+        "representation": ["_id", "parent"],
+        "version": ["_id", "parent", "type"],
+        "subset": ["_id", "parent"],
+        "asset": ["_id"],
+        "last_version": ["_id"],
+    })
+    contexts_by_repre_id = resolver.resolve(repre_ids)
 
     # Based on all collected data figure out which containers are outdated
     #   - log out if there are missing representation or version documents
@@ -951,8 +1110,8 @@ def filter_containers(containers, project_name):
             invalid_containers.append(container)
             continue
 
-        repre_doc = repre_docs_by_str_id.get(repre_id)
-        if not repre_doc:
+        context = contexts_by_repre_id[str(repre_id)]
+        if not context["representation"]:
             log.debug((
                 "Container '{}' has an invalid representation."
                 " It is missing in the database."
@@ -960,17 +1119,23 @@ def filter_containers(containers, project_name):
             not_found_containers.append(container)
             continue
 
-        version_id = repre_doc["parent"]
-        if version_id in outdated_version_ids:
-            outdated_containers.append(container)
-
-        elif version_id not in verisons_by_id:
+        version_doc = context["version"]
+        last_version_doc = context["last_version"]
+        if not version_doc:
             log.debug((
                 "Representation on container '{}' has an invalid version."
                 " It is missing in the database."
             ).format(container_name))
             not_found_containers.append(container)
 
+        # Hero versions are considered as latest
+        elif (
+            version_doc["type"] != "hero_version"
+            and last_version_doc
+            and last_version_doc["_id"] != version_doc["_id"]
+        ):
+            outdated_containers.append(container)
+
         else:
             uptodate_containers.append(container)
 
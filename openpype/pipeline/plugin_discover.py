@@ -100,11 +100,18 @@ class PluginDiscoverContext(object):
     """Store and discover registered types nad registered paths to types.
 
     Keeps in memory all registered types and their paths. Paths are dynamically
-    loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    loaded on discover. Modules of files which did not change since last
+    discover are reused when 'use_cache' is enabled, so different discover
+    calls return the same class objects for them. Enable it only if
+    discovered classes are not modified (e.g. by 'apply_settings'),
+    otherwise the modifications are kept on next discover.
+
+    Args:
+        use_cache (Optional[bool]): Reuse modules of unchanged files.
     """
 
-    def __init__(self):
+    def __init__(self, use_cache=False):
+        self._use_cache = use_cache
         self._registered_plugins = {}
         self._registered_plugin_paths = {}
         self._last_discovered_plugins = {}
@@ -168,7 +175,9 @@ class PluginDiscoverContext(object):
 
         # Include plug-ins from registered paths
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            modules, crashed = modules_from_path(
+                path, use_cache=self._use_cache
+            )
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
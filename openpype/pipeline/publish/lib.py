@@ -12,6 +12,7 @@ import pyblish.api
 from openpype.lib import (
     Logger,
     import_filepath,
+    import_filepath_cached,
     filter_profiles,
     is_func_signature_supported,
 )
@@ -214,7 +215,7 @@ def load_help_content_from_plugin(plugin):
     return load_help_content_from_filepath(filepath)
 
 
-def publish_plugins_discover(paths=None):
+def publish_plugins_discover(paths=None, use_cache=False):
     """Find and return available pyblish plug-ins
 
     Overridden function from `pyblish` module to be able to collect
@@ -223,6 +224,9 @@ def publish_plugins_discover(paths=None):
     Arguments:
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
+        use_cache (bool, optional): Reuse modules of files which did not
+            change since previous discovery. Plugin classes are then shared
+            between discoveries, including attributes changed by settings.
     """
 
     # The only difference with `pyblish.api.discover`
@@ -258,7 +262,10 @@ def publish_plugins_discover(paths=None):
                 continue
 
             try:
-                module = import_filepath(abspath, mod_name)
+                if use_cache:
+                    module = import_filepath_cached(abspath, mod_name)
+                else:
+                    module = import_filepath(abspath, mod_name)
 
                 # Store reference to original module, to avoid
                 # garbage collection from collecting it's global
@@ -7,7 +7,11 @@ from collections import defaultdict
 import clique
 from qtpy import QtWidgets, QtCore, QtGui
 
-from openpype.client import get_representations, get_versions
+from openpype.client import (
+    get_representations,
+    get_versions,
+    get_file_info_paths,
+)
 from openpype.pipeline import load, Anatomy
 from openpype import resources, style
 
@@ -22,8 +26,7 @@ from openpype.pipeline.delivery import (
     deliver_single_file,
     deliver_sequence,
     format_delivery_path,
-    # todo: avoid private access
-    _copy_file,
+    DeliveryJob,
 )
 from openpype.lib import StringTemplate
 
@@ -99,7 +102,6 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self.anatomy = Anatomy(project_name)
         self._representations = None
         self.log = log
-        self.currently_uploaded = 0
 
         self._project_name = project_name
         self._set_representations(project_name, contexts)
@@ -248,6 +250,12 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         format_dict = get_format_dict(self.anatomy, delivery_root)
         renumber_frame = self.renumber_frame.isChecked()
         frame_offset = self.first_frame_start.value()
+        manifest_path = None
+        if delivery_root:
+            manifest_path = os.path.join(
+                delivery_root, DeliveryJob.manifest_filename
+            )
+        delivery_job = DeliveryJob(manifest_path, log=self.log)
         processed = set()
         for repre in representations:
             repre_path = get_representation_path_with_anatomy(
@@ -276,13 +284,15 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                 report_items,
                 self.log
             ]
+            kwargs = {"delivery_job": delivery_job}
 
             if repre.get("files"):
                 src_paths = []
                 for repre_file in repre["files"]:
-                    src_path = self.anatomy.fill_root(repre_file["path"])
-                    src_path = os.path.normpath(src_path)
-                    src_paths.append(src_path)
+                    for path in get_file_info_paths(repre_file):
+                        src_path = self.anatomy.fill_root(path)
+                        src_path = os.path.normpath(src_path)
+                        src_paths.append(src_path)
 
                 collections, remainder = assemble(src_paths)
 
@@ -292,9 +302,10 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                 # should identify initially whether the file we're processing
                 # is a file of the representation or resource files.
                 def deliver(*args):
-                    new_report_items, uploaded = deliver_single_file(*args)
+                    new_report_items, _ = deliver_single_file(
+                        *args, **kwargs
+                    )
                     report_items.update(new_report_items)
-                    self._update_progress(uploaded)
 
                 def is_main_file(path):
                     """Return whether Collection or Path is main
@@ -373,10 +384,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                         # the path more than once, if so we ignore it
                         continue
 
-                    destination_dir = os.path.dirname(destination)
-                    os.makedirs(destination_dir, exist_ok=True)
-                    _copy_file(resource, destination)
-                    self._update_progress(1)
+                    delivery_job.add_transfer(resource, destination)
                     processed.add(destination)
 
             else:  # fallback for Pype2 and representations without files
@@ -385,11 +393,12 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                     repre["context"]["frame"] = len(str(frame)) * "#"
 
                 if not frame:
-                    new_report_items, uploaded = deliver_single_file(*args)
+                    new_report_items, _ = deliver_single_file(*args, **kwargs)
                 else:
-                    new_report_items, uploaded = deliver_sequence(*args)
+                    new_report_items, _ = deliver_sequence(*args, **kwargs)
                 report_items.update(new_report_items)
-                self._update_progress(uploaded)
+
+        delivery_job.process(report_items, self._update_progress)
 
         report_text = self._format_report(report_items)
         if self.write_changelog.isChecked() and not report_items:
@@ -448,7 +457,8 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                         if path in processed:
                             continue
 
-                        files_selected += 1
+                        # Compact file info of sequence has multiple files
+                        files_selected += len(get_file_info_paths(repre_file))
                         size_selected += repre_file["size"]
                         processed.add(path)
 
@@ -488,12 +498,19 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.template_label.setText(template_value)
             self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
 
-    def _update_progress(self, uploaded):
-        """Update progress bar after each repre copied."""
-        self.currently_uploaded += uploaded
+    def _update_progress(self, progress):
+        """Update progress bar after each file delivered.
 
-        ratio = self.currently_uploaded / self.files_selected
-        self.progress_bar.setValue(ratio * self.progress_bar.maximum())
+        Args:
+            progress (DeliveryProgress): Progress of delivery job.
+        """
+        self.progress_bar.setValue(
+            int(progress.ratio * self.progress_bar.maximum())
+        )
+        self.progress_bar.setFormat(
+            "%p% - {}".format(progress.get_message())
+        )
+        QtWidgets.QApplication.processEvents()
 
     def _format_report(self, report_items):
         """Format final result and error details as html."""
@@ -9,6 +9,7 @@ from openpype.client.entities import (
     get_last_version_by_subset_name,
     get_representations
 )
+from openpype.client.representation_files import get_file_info_paths
 
 
 class CollectFramesFixDef(
@@ -66,7 +67,7 @@ class CollectFramesFixDef(
                 continue
 
             for file_info in repre.get("files"):
-                published_files.append(file_info["path"])
+                published_files.extend(get_file_info_paths(file_info))
 
         instance.data["last_version_published_files"] = published_files
         self.log.debug("last_version_published_files::{}".format(
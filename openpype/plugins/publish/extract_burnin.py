@@ -18,7 +18,7 @@ from openpype.lib import (
     convert_input_paths_for_ffmpeg,
     should_convert_for_ffmpeg
 )
-from openpype.lib.profiles_filtering import filter_profiles
+from openpype.lib.profiles_filtering import ProfilesMatcher
 from openpype.pipeline.publish.lib import add_repre_files_for_cleanup
 
 
@@ -77,6 +77,13 @@ class ExtractBurnin(publish.Extractor):
     profiles = None
     options = None
 
+    # Render burnins in publish process instead of launching burnin script
+    #   in new OpenPype process for each burnin definition
+    render_in_process = True
+
+    # Compiled 'profiles' reused for all instances
+    _profiles_matcher = None
+
     def process(self, instance):
         if not self.profiles:
             self.log.warning("No profiles present for create burnin")
@@ -145,6 +152,15 @@ class ExtractBurnin(publish.Extractor):
 
         return filtered_repres
 
+    def _get_profiles_matcher(self):
+        """Matcher of 'profiles' shared by all instances of the plugin."""
+        cls = self.__class__
+        matcher = cls._profiles_matcher
+        if matcher is None or matcher.profiles_data is not self.profiles:
+            matcher = ProfilesMatcher(self.profiles)
+            cls._profiles_matcher = matcher
+        return matcher
+
     def main_process(self, instance):
         host_name = instance.context.data["hostName"]
         family = instance.data["family"]
@@ -160,8 +176,9 @@ class ExtractBurnin(publish.Extractor):
             "task_types": task_type,
             "subset": subset
         }
-        profile = filter_profiles(self.profiles, filtering_criteria,
-                                  logger=self.log)
+        profile = self._get_profiles_matcher().match(
+            filtering_criteria, logger=self.log
+        )
 
         if not profile:
             self.log.debug(
@@ -197,10 +214,6 @@ class ExtractBurnin(publish.Extractor):
         _burnin_data, _temp_data = self.prepare_basic_data(instance)
 
         anatomy = instance.context.data["anatomy"]
-        scriptpath = self.burnin_script_path()
-
-        # Args that will execute the script
-        executable_args = ["run", scriptpath]
         for repre, repre_burnin_defs in burnins_per_repres:
             # Create copy of `_burnin_data` and `_temp_data` for repre.
             burnin_data = copy.deepcopy(_burnin_data)
@@ -273,6 +286,8 @@ class ExtractBurnin(publish.Extractor):
             first_output = True
 
             files_to_delete = []
+            new_repres = []
+            burnins_data = []
 
             repre_burnin_options = copy.deepcopy(burnin_options)
             # Use fps from representation for output in options
@@ -335,39 +350,19 @@ class ExtractBurnin(publish.Extractor):
                 self.log.debug(
                     "script_data: {}".format(json.dumps(script_data, indent=4))
                 )
-
-                # Dump data to string
-                dumped_script_data = json.dumps(script_data)
-
-                # Store dumped json to temporary file
-                temporary_json_file = tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                )
-                temporary_json_file.write(dumped_script_data)
-                temporary_json_file.close()
-                temporary_json_filepath = temporary_json_file.name.replace(
-                    "\\", "/"
-                )
-
-                # Prepare subprocess arguments
-                args = list(executable_args)
-                args.append(temporary_json_filepath)
-                self.log.debug("Executing: {}".format(" ".join(args)))
-
-                # Run burnin script
-                process_kwargs = {
-                    "logger": self.log
-                }
-
-                run_openpype_process(*args, **process_kwargs)
-                # Remove the temporary json
-                os.remove(temporary_json_filepath)
+                # Copy data which are modified for next burnin definitions
+                burnins_data.append(copy.deepcopy(script_data))
 
                 for filepath in temp_data["full_input_paths"]:
                     filepath = filepath.replace("\\", "/")
                     if filepath not in files_to_delete:
                         files_to_delete.append(filepath)
 
+                new_repres.append(new_repre)
+
+            self.render_burnins(burnins_data)
+
+            for new_repre in new_repres:
                 # Add new representation to instance
                 instance.data["representations"].append(new_repre)
 
@@ -393,6 +388,74 @@ class ExtractBurnin(publish.Extractor):
                     os.remove(filepath)
                     self.log.debug("Removed: \"{}\"".format(filepath))
 
+    def render_burnins(self, burnins_data):
+        """Render burnins of outputs of single representation.
+
+        Burnins are rendered in current process if burnin script can be
+        imported, then outputs of the same input share one ffmpeg pass.
+        Otherwise the burnin script is launched in new OpenPype process for
+        each output.
+
+        Args:
+            burnins_data (list[dict[str, Any]]): Data for burnin script of
+                each output.
+        """
+        if not burnins_data:
+            return
+
+        otio_burnin = None
+        if self.render_in_process:
+            otio_burnin = self._import_burnin_script()
+
+        if otio_burnin is not None:
+            otio_burnin.render_burnins_from_data(
+                burnins_data, logger=self.log
+            )
+            return
+
+        scriptpath = self.burnin_script_path()
+        for script_data in burnins_data:
+            self._run_burnin_script(scriptpath, script_data)
+
+    def _import_burnin_script(self):
+        try:
+            from openpype.scripts import otio_burnin
+
+        except ImportError:
+            self.log.debug((
+                "Burnin script can't be imported in current process."
+                " Burnins will be rendered in separate process."
+            ), exc_info=True)
+            return None
+        return otio_burnin
+
+    def _run_burnin_script(self, scriptpath, script_data):
+        # Dump data to string
+        dumped_script_data = json.dumps(script_data)
+
+        # Store dumped json to temporary file
+        temporary_json_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        temporary_json_file.write(dumped_script_data)
+        temporary_json_file.close()
+        temporary_json_filepath = temporary_json_file.name.replace(
+            "\\", "/"
+        )
+
+        # Prepare subprocess arguments
+        args = ["run", scriptpath, temporary_json_filepath]
+        self.log.debug("Executing: {}".format(" ".join(args)))
+
+        # Run burnin script
+        process_kwargs = {
+            "logger": self.log
+        }
+
+        run_openpype_process(*args, **process_kwargs)
+        # Remove the temporary json
+        os.remove(temporary_json_filepath)
+
     def _get_burnin_options(self):
         # Prepare burnin options
         burnin_options = copy.deepcopy(self.default_options)
@@ -2,9 +2,11 @@ import os
 import re
 import copy
 import json
+import time
 import shutil
 import subprocess
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import six
 import clique
@@ -13,7 +15,7 @@ import pyblish.api
 
 from openpype.lib import (
     get_ffmpeg_tool_args,
-    filter_profiles,
+    ProfilesMatcher,
     path_to_subprocess_arg,
     run_subprocess,
 )
@@ -106,6 +108,16 @@ class ExtractReview(pyblish.api.InstancePlugin):
     # Preset attributes
     profiles = None
 
+    # Maximum number of ffmpeg processes rendering output definitions at the
+    #   same time, value lower than 2 renders outputs one by one
+    ffmpeg_max_workers = 1
+    # Render output definitions with same input arguments by single ffmpeg
+    #   process so the input is decoded only once
+    ffmpeg_share_input = False
+
+    # Compiled 'profiles' reused for all instances
+    _profiles_matcher = None
+
     def process(self, instance):
         # Skip review when requested.
         if not instance.data.get("review", True):
@@ -130,12 +142,20 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
             instance.data["representations"].remove(repre)
 
+    def _get_profiles_matcher(self):
+        """Matcher of 'profiles' shared by all instances of the plugin."""
+        cls = self.__class__
+        matcher = cls._profiles_matcher
+        if matcher is None or matcher.profiles_data is not self.profiles:
+            matcher = ProfilesMatcher(self.profiles)
+            cls._profiles_matcher = matcher
+        return matcher
+
     def _get_outputs_for_instance(self, instance):
         host_name = instance.context.data["hostName"]
         family = self.main_family_from_instance(instance)
 
-        profile = filter_profiles(
-            self.profiles,
+        profile = self._get_profiles_matcher().match(
             {
                 "hosts": host_name,
                 "families": family,
@@ -345,6 +365,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
         layer_name
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
+        # ffmpeg commands are run after all output definitions are prepared
+        jobs = []
+        all_files_to_clean = []
         for _output_def in output_definitions:
             output_def = copy.deepcopy(_output_def)
             # Make sure output definition has "tags" key
@@ -448,29 +471,44 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    break
                 raise NotImplementedError
 
-            subprcs_cmd = " ".join(ffmpeg_args)
-
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
+            for filepath in files_to_clean:
+                if filepath not in all_files_to_clean:
+                    all_files_to_clean.append(filepath)
+
+            jobs.append({
+                "ffmpeg_args": ffmpeg_args,
+                "input_args": temp_data["ffmpeg_input_args"],
+                "output_name": output_name,
+                "output_ext": output_ext,
+                "output_def": output_def,
+                "new_repre": new_repre,
+                "temp_data": temp_data,
+            })
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+        try:
+            self._run_ffmpeg_jobs(instance, jobs)
 
+        finally:
             # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
-
+            for f in all_files_to_clean:
+                os.unlink(f)
+
+        for job in jobs:
+            output_name = job["output_name"]
+            output_ext = job["output_ext"]
+            temp_data = job["temp_data"]
+            new_repre = job["new_repre"]
             new_repre.update({
                 "fps": temp_data["fps"],
                 "name": "{}_{}".format(output_name, output_ext),
                 "outputName": output_name,
-                "outputDef": output_def,
+                "outputDef": job["output_def"],
                 "frameStartFtrack": temp_data["output_frame_start"],
                 "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
+                "ffmpeg_cmd": " ".join(job["ffmpeg_args"])
             })
 
             # Force to pop these key if are in new repre
@@ -486,6 +524,72 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
             add_repre_files_for_cleanup(instance, new_repre)
 
+    def _run_ffmpeg_jobs(self, instance, jobs):
+        """Run ffmpeg commands of prepared output definitions.
+
+        Commands run concurrently based on 'ffmpeg_max_workers'. Outputs
+        with same input arguments are rendered by single ffmpeg process
+        when 'ffmpeg_share_input' is enabled. Duration of rendering of each
+        output is stored to 'reviewOutputTimings' on instance by name of
+        new representation.
+
+        Args:
+            instance (Instance): Currently processed instance.
+            jobs (list[dict[str, Any]]): Prepared output definitions with
+                ffmpeg arguments.
+        """
+        jobs_groups = []
+        jobs_by_input = {}
+        for job in jobs:
+            input_key = None
+            if self.ffmpeg_share_input:
+                input_key = tuple(job["input_args"])
+            if input_key is None or input_key not in jobs_by_input:
+                jobs_group = []
+                jobs_groups.append(jobs_group)
+                if input_key is not None:
+                    jobs_by_input[input_key] = jobs_group
+            else:
+                jobs_group = jobs_by_input[input_key]
+            jobs_group.append(job)
+
+        timings = instance.data.setdefault("reviewOutputTimings", {})
+
+        def _run(jobs_group):
+            first_args = jobs_group[0]["ffmpeg_args"]
+            # Executable and input arguments are shared, output arguments
+            #   of each output are added after them
+            input_end = 1 + len(jobs_group[0]["input_args"])
+            ffmpeg_args = list(first_args)
+            for job in jobs_group[1:]:
+                ffmpeg_args.extend(job["ffmpeg_args"][input_end:])
+
+            subprcs_cmd = " ".join(ffmpeg_args)
+            # run subprocess
+            self.log.debug("Executing: {}".format(subprcs_cmd))
+            start = time.time()
+            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            duration = time.time() - start
+            for job in jobs_group:
+                repre_name = "{}_{}".format(
+                    job["output_name"], job["output_ext"]
+                )
+                timings[repre_name] = duration
+
+        max_workers = min(self.ffmpeg_max_workers or 1, len(jobs_groups))
+        if max_workers < 2:
+            for jobs_group in jobs_groups:
+                _run(jobs_group)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_run, jobs_group)
+                for jobs_group in jobs_groups
+            ]
+            for future in futures:
+                future.result()
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -750,6 +854,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
         ffmpeg_video_filters.extend(res_filters)
 
         ffmpeg_input_args = self.split_ffmpeg_args(ffmpeg_input_args)
+        # Input arguments are used to find outputs sharing same input
+        temp_data["ffmpeg_input_args"] = ffmpeg_input_args
 
         lut_filters = self.lut_filters(new_repre, instance, ffmpeg_input_args)
         ffmpeg_video_filters.extend(lut_filters)
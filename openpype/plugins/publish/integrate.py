@@ -23,6 +23,9 @@ from openpype.client import (
     get_representations,
     get_subset_by_name,
     get_version_by_name,
+    get_versions,
+    compact_file_infos,
+    get_file_info_paths,
 )
 from openpype.lib import source_hash
 from openpype.lib.file_transaction import (
@@ -153,6 +156,27 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         "family", "hierarchy", "username", "user", "output"
     ]
 
+    # File transfer options
+    # - number of worker threads transferring files, value lower than 2
+    #   transfers files one by one
+    transfer_max_workers = 1
+    # - number of files of one destination folder processed by one task
+    transfer_batch_size = 16
+    # - buffer size in bytes for chunked copy, platform copy is used if unset
+    transfer_buffer_size = None
+    # - skip destinations identical to source and hardlink files identical
+    #   to files of previous version
+    transfer_dedup = False
+    # - compare content hash instead of modification time when skipping
+    #   identical destinations (hardlinks always compare content hash)
+    transfer_dedup_compare_hash = False
+
+    # Store frame sequences in representation 'files' as single file info
+    #   with frame range instead of file info per frame
+    compact_sequences = False
+    # - minimum number of frames of sequence stored in compact form
+    compact_sequences_min_frames = 10
+
     def process(self, instance):
 
         # Instance should be integrated on a farm
@@ -176,9 +200,17 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.transfer_max_workers,
+            batch_size=self.transfer_batch_size,
+            buffer_size=self.transfer_buffer_size,
+            progress_callback=self._on_transfer_progress,
+            dedup=self.transfer_dedup,
+            compare_hash=self.transfer_dedup_compare_hash
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -199,6 +231,53 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # the try, except.
         file_transactions.finalize()
 
+    def _get_previous_version_files(
+        self, project_name, subset, version, anatomy
+    ):
+        """Published file paths of previous version of the subset.
+
+        Files are used as hardlink sources for identical files.
+
+        Returns:
+            List[str]: Paths to files of previous version.
+        """
+
+        previous_version = None
+        for version_doc in get_versions(
+            project_name,
+            subset_ids=[subset["_id"]],
+            fields=["_id", "name"]
+        ):
+            if version_doc["name"] >= version["name"]:
+                continue
+            if (
+                previous_version is None
+                or previous_version["name"] < version_doc["name"]
+            ):
+                previous_version = version_doc
+
+        if previous_version is None:
+            return []
+
+        paths = set()
+        for repre_doc in get_representations(
+            project_name,
+            version_ids=[previous_version["_id"]],
+            fields=["files"]
+        ):
+            for file_info in repre_doc.get("files") or []:
+                for path in get_file_info_paths(file_info):
+                    if path:
+                        paths.add(anatomy.fill_root(path))
+        return list(paths)
+
+    def _on_transfer_progress(self, processed, total, dst):
+        # Log only each 10% to avoid log flooding of long sequences
+        step = max(total // 10, 1)
+        if processed == total or processed % step == 0:
+            self.log.debug(
+                "Transferred {}/{} files".format(processed, total))
+
     def filter_representations(self, instance):
         # Prepare repsentations that should be integrated
         repres = instance.data.get("representations")
@@ -301,6 +380,13 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 file_transactions.add(src, dst, mode=copy_mode)
                 resource_destinations.add(os.path.abspath(dst))
 
+        if self.transfer_dedup:
+            file_transactions.add_dedup_candidates(
+                self._get_previous_version_files(
+                    project_name, subset, version, anatomy
+                )
+            )
+
         # Bulk write to the database
         # We write the subset and version to the database before the File
         # Transaction to reduce the chances of another publish trying to
@@ -319,6 +405,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "Backed up existing files: {}".format(file_transactions.backups))
         self.log.debug(
             "Transferred files: {}".format(file_transactions.transferred))
+        if file_transactions.skipped:
+            self.log.debug(
+                "Skipped identical files: {}".format(
+                    file_transactions.skipped))
+        if file_transactions.bytes_saved:
+            self.log.info(
+                "Deduplication saved {} bytes".format(
+                    file_transactions.bytes_saved))
         self.log.debug("Retrieving Representation Site Sync information ...")
 
         # Get the accessible sites for Site Sync
@@ -350,9 +444,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             repre_update_data = prepared["repre_doc_update_data"]
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
-            repre_doc["files"] = self.get_files_info(
+            files_info = self.get_files_info(
                 destinations, sites=sites, anatomy=anatomy
             )
+            if self.compact_sequences:
+                files_info = compact_file_infos(
+                    files_info, self.compact_sequences_min_frames
+                )
+            repre_doc["files"] = files_info
 
             # Add the version resource file infos to each representation
             repre_doc["files"] += resource_file_infos
@@ -945,15 +1044,36 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             + warning logged
         """
 
-        success, rootless_path = anatomy.find_root_template_from_path(path)
-        if success:
-            path = rootless_path
-        else:
-            self.log.warning((
-                "Could not find root path for remapping \"{}\"."
-                " This may cause issues on farm."
-            ).format(path))
-        return path
+        return self.get_rootless_paths(anatomy, [path])[0]
+
+    def get_rootless_paths(self, anatomy, paths):
+        """Rootless paths of multiple paths at once.
+
+        Same as 'get_rootless_path' for each path, but roots are looked up
+        in all paths using single prepared index of roots.
+
+        Args:
+            anatomy (Anatomy): Anatomy of project.
+            paths (Iterable[str]): Absolute paths.
+
+        Returns:
+            list[str]: Rootless paths, or unmodified paths where root was
+                not found.
+        """
+        paths = list(paths)
+        output = []
+        for path, (success, rootless_path) in zip(
+            paths, anatomy.find_root_templates_from_paths(paths)
+        ):
+            if success:
+                path = rootless_path
+            else:
+                self.log.warning((
+                    "Could not find root path for remapping \"{}\"."
+                    " This may cause issues on farm."
+                ).format(path))
+            output.append(path)
+        return output
 
     def get_files_info(self, destinations, sites, anatomy):
         """Prepare 'files' info portion for representations.
@@ -967,13 +1087,16 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             in representation
         """
 
+        rootless_paths = self.get_rootless_paths(anatomy, destinations)
         file_infos = []
-        for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
+        for file_path, rootless_path in zip(destinations, rootless_paths):
+            file_info = self.prepare_file_info(
+                file_path, anatomy, sites=sites, rootless_path=rootless_path
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy, sites):
+    def prepare_file_info(self, path, anatomy, sites, rootless_path=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
@@ -982,14 +1105,19 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             sites: array of published locations,
                 [ {'name':'studio', 'created_dt':date} by default
                 keys expected ['studio', 'site1', 'gdrive1']
+            rootless_path (Optional[str]): Already resolved rootless path
+                of 'path'.
 
         Returns:
             dict: file info dictionary
         """
 
+        if rootless_path is None:
+            rootless_path = self.get_rootless_path(anatomy, path)
+
         return {
             "_id": ObjectId(),
-            "path": self.get_rootless_path(anatomy, path),
+            "path": rootless_path,
             "size": os.path.getsize(path),
             "hash": source_hash(path),
             "sites": sites
@@ -12,6 +12,7 @@ from openpype.client import (
     get_hero_version_by_subset_id,
     get_archived_representations,
     get_representations,
+    set_file_info_path,
 )
 from openpype.client.operations import (
     OperationsSession,
@@ -382,9 +383,15 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
                     for src_file, dst_file in src_to_dst_file_paths:
                         src_file_name = os.path.basename(src_file)
                         if src_file_name == file_name:
-                            repre["files"][index]["path"] = self._update_path(
-                                anatomy, repre["files"][index]["path"],
-                                src_file, dst_file)
+                            # Head and tail of compact sequence file info
+                            #   are changed too
+                            set_file_info_path(
+                                repre["files"][index],
+                                self._update_path(
+                                    anatomy, repre["files"][index]["path"],
+                                    src_file, dst_file
+                                )
+                            )
 
                             repre["files"][index]["hash"] = self._update_hash(
                                 repre["files"][index]["hash"],
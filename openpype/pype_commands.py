@@ -72,7 +72,38 @@ class PypeCommands:
         traypublisher.main()
 
     @staticmethod
-    def publish(paths, targets=None, gui=False):
+    def _fill_settings_snapshot_root(filepath):
+        """Fill roots in rootless path to settings snapshot.
+
+        Roots are filled with anatomy of project from 'AVALON_PROJECT'
+        environment variable, same as paths in metadata file.
+
+        Args:
+            filepath (str): Path to settings snapshot, can be rootless.
+
+        Returns:
+            str: Path to settings snapshot with filled roots.
+        """
+        from openpype.lib import Logger
+        from openpype.pipeline import Anatomy
+
+        project_name = os.environ.get("AVALON_PROJECT")
+        if "{root" not in filepath or not project_name:
+            return filepath
+
+        try:
+            return Anatomy(project_name).fill_root(filepath)
+        except Exception:
+            Logger.get_logger("CLI-publish").warning(
+                "Failed to fill roots of settings snapshot path \"{}\"".format(
+                    filepath
+                ),
+                exc_info=True
+            )
+        return filepath
+
+    @staticmethod
+    def publish(paths, targets=None, gui=False, settings_snapshot=None):
         """Start headless publishing.
 
         Publish use json from passed paths argument.
@@ -82,6 +113,8 @@ class PypeCommands:
             targets (string): What module should be targeted
                 (to choose validator for example)
             gui (bool): Show publish UI.
+            settings_snapshot (Optional[str]): Path to settings snapshot
+                file used instead of querying settings.
 
         Raises:
             RuntimeError: When there is no path to process.
@@ -106,6 +139,17 @@ class PypeCommands:
 
         log = Logger.get_logger("CLI-publish")
 
+        if settings_snapshot:
+            from openpype.settings import load_settings_snapshot
+
+            settings_snapshot = PypeCommands._fill_settings_snapshot_root(
+                settings_snapshot
+            )
+            if load_settings_snapshot(settings_snapshot):
+                log.info("Using settings snapshot \"{}\"".format(
+                    settings_snapshot
+                ))
+
         install_openpype_plugins()
 
         manager = ModulesManager()
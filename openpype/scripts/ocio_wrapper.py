@@ -17,13 +17,43 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- serve - console command - python 2
+        - persistent process answering json requests from stdin
+          so the process startup is paid only once per session.
 """
 
+import os
+import sys
 import click
 import json
 from pathlib import Path
 import PyOpenColorIO as ocio
 
+# Prefix of response lines written by 'serve' to stdout, other lines
+#   (e.g. output of process bootstrap) are ignored by client
+RPC_RESPONSE_PREFIX = "OCIO_RPC_RESPONSE:"
+
+# Loaded configs by config path with modification time of config file
+_config_cache = {}
+
+
+def _load_config(config_path):
+    """Load ocio config from file and cache it until the file is modified.
+
+    Args:
+        config_path (Path): path leading to config.ocio
+
+    Returns:
+        ocio.Config: Loaded config.
+    """
+    config_path = str(config_path)
+    mtime = os.path.getmtime(config_path)
+    cached = _config_cache.get(config_path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, ocio.Config.CreateFromFile(config_path))
+        _config_cache[config_path] = cached
+    return cached[1]
+
 
 @click.group()
 def main():
@@ -104,7 +134,7 @@ def _get_colorspace_data(config_path):
         raise IOError(
             f"Input path `{config_path}` should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _load_config(config_path)
 
     colorspace_data = {
         "roles": {},
@@ -201,7 +231,7 @@ def _get_views_data(config_path):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _load_config(config_path)
 
     data_ = {}
     for display in config.getDisplays():
@@ -274,7 +304,7 @@ def _get_version_data(config_path):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _load_config(config_path)
 
     return {
         "major": config.getMajorVersion(),
@@ -347,7 +377,7 @@ def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
         raise IOError(
             f"Input path `{config_path}` should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _load_config(config_path)
 
     # TODO: use `parseColorSpaceFromString` instead if ocio v1
     colorspace = config.getColorSpaceFromFilepath(str(filepath))
@@ -355,6 +385,33 @@ def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
     return colorspace
 
 
+def _get_config_file_rules_colorspaces_from_filepaths(config_path, filepaths):
+    """Return colorspaces found in v2 file rules for multiple file paths.
+
+    Args:
+        config_path (str): path string leading to config.ocio
+        filepaths (list[str]): paths to match against file rules
+
+    Raises:
+        IOError: Input config does not exist.
+
+    Returns:
+        list[str]: colorspace for each of file paths
+    """
+    config_path = Path(config_path)
+
+    if not config_path.is_file():
+        raise IOError(
+            f"Input path `{config_path}` should be `config.ocio` file")
+
+    config = _load_config(config_path)
+
+    return [
+        config.getColorSpaceFromFilepath(str(filepath))
+        for filepath in filepaths
+    ]
+
+
 def _get_display_view_colorspace_name(config_path, display, view):
     """Returns the colorspace attribute of the (display, view) pair.
 
@@ -376,7 +433,7 @@ def _get_display_view_colorspace_name(config_path, display, view):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config.CreateFromFile(str(config_path))
+    config = _load_config(config_path)
     colorspace = config.getDisplayViewColorSpaceName(display, view)
 
     return colorspace
@@ -429,5 +486,73 @@ def get_display_view_colorspace_name(in_path, out_path,
 
     print(f"Display view colorspace saved to '{out_path}'")
 
+
+# Functions available for 'serve' command with names of their arguments.
+#   Names match console commands '<group>.<command>' and their options
+#   without '--out_path'.
+_RPC_METHODS = {
+    "config.get_colorspace": (_get_colorspace_data, ["in_path"]),
+    "config.get_views": (_get_views_data, ["in_path"]),
+    "config.get_version": (_get_version_data, ["config_path"]),
+    "config.get_display_view_colorspace_name": (
+        _get_display_view_colorspace_name, ["in_path", "display", "view"]
+    ),
+    "colorspace.get_config_file_rules_colorspace_from_filepath": (
+        _get_config_file_rules_colorspace_from_filepath,
+        ["config_path", "filepath"]
+    ),
+    "colorspace.get_config_file_rules_colorspaces_from_filepaths": (
+        _get_config_file_rules_colorspaces_from_filepaths,
+        ["config_path", "filepaths"]
+    ),
+}
+
+
+def _process_rpc_request(line):
+    """Process one json request and return response data."""
+    request_id = None
+    try:
+        request = json.loads(line)
+        request_id = request.get("id")
+        func, arg_names = _RPC_METHODS[request["method"]]
+        params = request.get("params") or {}
+        result = func(*[params[arg_name] for arg_name in arg_names])
+        return {"id": request_id, "result": result}
+
+    except Exception as exc:
+        return {
+            "id": request_id,
+            "error": f"{exc.__class__.__name__}: {exc}"
+        }
+
+
+@main.command(
+    name="serve",
+    help=(
+        "process json requests from stdin until stdin is closed "
+        "one request per line, response is printed to stdout"
+    )
+)
+def serve():
+    """Answer requests from stdin until stdin is closed.
+
+    Request is one json line with 'id', 'method' and 'params' keys, where
+    method is '<group>.<command>' of console command. Response is one line
+    with 'RPC_RESPONSE_PREFIX' followed by json with 'id' and 'result' or
+    'error' keys.
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py serve
+    {"id": 1, "method": "config.get_version", "params": {"config_path": ..}}
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        response = _process_rpc_request(line)
+        sys.stdout.write(RPC_RESPONSE_PREFIX + json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
 if __name__ == '__main__':
     main()
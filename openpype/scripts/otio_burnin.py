@@ -1,9 +1,11 @@
 import os
 import sys
+import copy
 import subprocess
 import platform
 import json
 import tempfile
+from collections import OrderedDict
 from string import Formatter
 
 import opentimelineio_contrib.adapters.ffmpeg_burnins as ffmpeg_burnins
@@ -14,9 +16,13 @@ from openpype.lib import (
     convert_ffprobe_fps_value,
 )
 
+FFMPEG_EXECUTABLE = subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
 FFMPEG = (
     '{}%(input_args)s -i "%(input)s" %(filters)s %(args)s%(output)s'
-).format(subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg")))
+).format(FFMPEG_EXECUTABLE)
+FFMPEG_MULTIPLE_OUTPUTS = (
+    '{}%(input_args)s -i "%(input)s" %(filters)s %(outputs)s'
+).format(FFMPEG_EXECUTABLE)
 
 DRAWTEXT = (
     "drawtext@'%(label)s'=fontfile='%(font)s':text=\\'%(text)s\\':"
@@ -34,6 +40,9 @@ CURRENT_FRAME_SPLITTER = "_-_CURRENT_FRAME_-_"
 TIMECODE_KEY = "{timecode}"
 SOURCE_TIMECODE_KEY = "{source_timecode}"
 
+# Cached ffprobe data by source path, modification time and size
+_FFPROBE_DATA_CACHE = {}
+
 
 def _get_ffprobe_data(source):
     """Reimplemented from otio burnins to be able use full path to ffprobe
@@ -64,6 +73,86 @@ def _get_ffprobe_data(source):
     return json.loads(out)
 
 
+def get_ffprobe_data(source):
+    """Get ffprobe data of source with cache.
+
+    Cached data are used until the source file is changed, so multiple
+    burnins of the same source don't have to probe it again.
+
+    Args:
+        source (str): Path to source media file.
+
+    Returns:
+        dict[str, Any]: Data received from ffprobe.
+    """
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return _get_ffprobe_data(source)
+
+    key = (os.path.normpath(source), stat.st_mtime, stat.st_size)
+    ffprobe_data = _FFPROBE_DATA_CACHE.get(key)
+    if ffprobe_data is None:
+        ffprobe_data = _get_ffprobe_data(source)
+        _FFPROBE_DATA_CACHE[key] = ffprobe_data
+    return copy.deepcopy(ffprobe_data)
+
+
+def _run_command(command, output, logger=None):
+    """Run ffmpeg command.
+
+    Args:
+        command (str): Command to run.
+        output (str): Output path used in error message.
+        logger (Optional[logging.Logger]): Logger of command output. Output
+            is printed if not passed.
+
+    Raises:
+        RuntimeError: Command failed. Message contains its output.
+    """
+    log_output = print
+    if logger is not None:
+        log_output = logger.debug
+
+    log_output("Launching command: {}".format(command))
+
+    kwargs = {
+        "stdout": subprocess.PIPE,
+        "stderr": subprocess.PIPE,
+        "shell": True,
+    }
+    proc = subprocess.Popen(command, **kwargs)
+
+    _stdout, _stderr = proc.communicate()
+    if _stdout:
+        _stdout = _stdout.decode("utf-8", errors="backslashreplace")
+        log_output(_stdout)
+
+    # This will probably never happen as ffmpeg use stdout
+    if _stderr:
+        _stderr = _stderr.decode("utf-8", errors="backslashreplace")
+        log_output(_stderr)
+
+    if proc.returncode != 0:
+        exc_msg = "Failed to render '{}': {}'".format(output, command)
+        if _stdout:
+            exc_msg += "\n\nOutput:\n{}".format(_stdout)
+
+        if _stderr:
+            exc_msg += "\n\nError:\n{}".format(_stderr)
+        raise RuntimeError(exc_msg)
+
+
+def _validate_output(output, duration):
+    if "%" in output:
+        output = output % duration
+
+    if not os.path.exists(output):
+        raise RuntimeError(
+            "Failed to generate this f*cking file '%s'" % output
+        )
+
+
 class ModifiedBurnins(ffmpeg_burnins.Burnins):
     '''
     This is modification of OTIO FFmpeg Burnin adapter.
@@ -134,9 +223,14 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
         self.first_frame = first_frame
         self.input_args = []
         self.cleanup_paths = []
+        # Per frame text is changed with commands targeting filter names
+        #   which must be unique in filter graph
+        self.has_per_frame_text = False
 
         super().__init__(source, source_streams)
 
+        # Copy class options so they're not shared between instances
+        self.options_init = copy.deepcopy(self.options_init)
         if options_init:
             self.options_init.update(options_init)
 
@@ -334,6 +428,7 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
             temp.write("\n".join(lines))
 
         self.cleanup_paths.append(path)
+        self.has_per_frame_text = True
         self.filters["drawtext"].append("sendcmd=f='{}'".format(
             path.replace("\\", "/").replace(":", "\\:")
         ))
@@ -429,6 +524,7 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
         output = '"{}"'.format(output or '')
         if overwrite:
             output = '-y {}'.format(output)
+        args = self.get_output_args(args)
 
         filters = ""
         filter_string = self.filter_string
@@ -440,78 +536,76 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
             print("Filters:", filter_string)
             self.cleanup_paths.append(filters_path)
 
-        if self.first_frame is not None:
-            start_number_arg = "-start_number {}".format(self.first_frame)
-            self.input_args.append(start_number_arg)
-            if "start_number" not in args:
-                if not args:
-                    args = start_number_arg
-                else:
-                    args = " ".join((start_number_arg, args))
-
-        input_args = ""
-        if self.input_args:
-            input_args = " {}".format(" ".join(self.input_args))
-
         return (FFMPEG % {
-            'input_args': input_args,
+            'input_args': self.get_input_args(),
             'input': self.source,
             'output': output,
             'args': '%s ' % args if args else '',
             'filters': filters
         }).strip()
 
-    def render(self, output, args=None, overwrite=False, **kwargs):
+    def get_input_args(self):
+        """Arguments of ffmpeg input.
+
+        Returns:
+            str: Input arguments prefixed with space or empty string.
+        """
+        input_args = list(self.input_args)
+        if self.first_frame is not None:
+            input_args.append("-start_number {}".format(self.first_frame))
+
+        if not input_args:
+            return ""
+        return " {}".format(" ".join(input_args))
+
+    def get_output_args(self, args=None):
+        """Arguments of ffmpeg output with start number of first frame.
+
+        Args:
+            args (Optional[str]): Additional ffmpeg output arguments.
+
+        Returns:
+            str: Output arguments.
+        """
+        if self.first_frame is None:
+            return args or ""
+
+        start_number_arg = "-start_number {}".format(self.first_frame)
+        if not args:
+            return start_number_arg
+        if "start_number" in args:
+            return args
+        return " ".join((start_number_arg, args))
+
+    def cleanup(self):
+        """Remove temporary files created for the burnins."""
+        for path in self.cleanup_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def render(
+        self, output, args=None, overwrite=False, logger=None, **kwargs
+    ):
         """
         Render the media to a specified destination.
 
         :param str output: output file
         :param str args: additional FFMPEG arguments
         :param bool overwrite: overwrite the output if it exists
+        :param logging.Logger logger: logger of ffmpeg output
         """
         if not overwrite and os.path.exists(output):
             raise RuntimeError("Destination '%s' exists, please "
                                "use overwrite" % output)
 
-        is_sequence = "%" in output
-
         command = self.command(
             output=output,
             args=args,
             overwrite=overwrite
         )
-        print("Launching command: {}".format(command))
-
-        kwargs = {
-            "stdout": subprocess.PIPE,
-            "stderr": subprocess.PIPE,
-            "shell": True,
-        }
-        proc = subprocess.Popen(command, **kwargs)
-
-        _stdout, _stderr = proc.communicate()
-        if _stdout:
-            print(_stdout.decode("utf-8", errors="backslashreplace"))
-
-        # This will probably never happen as ffmpeg use stdout
-        if _stderr:
-            print(_stderr.decode("utf-8", errors="backslashreplace"))
-
-        if proc.returncode != 0:
-            raise RuntimeError(
-                "Failed to render '{}': {}'".format(output, command)
-            )
-        if is_sequence:
-            output = output % kwargs.get("duration")
-
-        if not os.path.exists(output):
-            raise RuntimeError(
-                "Failed to generate this f*cking file '%s'" % output
-            )
-
-        for path in self.cleanup_paths:
-            if os.path.exists(path):
-                os.remove(path)
+        _run_command(command, output, logger)
+        _validate_output(output, kwargs.get("duration"))
+        self.cleanup()
 
 
 def example(input_path, output_path):
@@ -581,7 +675,8 @@ def prepare_fill_values(burnin_template, data):
 def burnins_from_data(
     input_path, output_path, data,
     codec_data=None, options=None, burnin_values=None, overwrite=True,
-    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None
+    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None,
+    ffprobe_data=None
 ):
     """This method adds burnins to video/image file based on presets setting.
 
@@ -597,6 +692,8 @@ def burnins_from_data(
         burnin_values (dict): Contain positioned values.
         overwrite (bool): Output will be overwritten if already exists,
             True by default.
+        ffprobe_data (Optional[dict]): Data of input received from ffprobe.
+            Input is probed if not passed.
 
     Presets must be set separately. Should be dict with 2 keys:
     - "options" - sets look of burnins - colors, opacity,...
@@ -640,8 +737,36 @@ def burnins_from_data(
         "shot": "sh0010"
     }
     """
-    ffprobe_data = None
-    if full_input_path:
+    burnin = prepare_burnins(
+        input_path,
+        data,
+        options=options,
+        burnin_values=burnin_values,
+        full_input_path=full_input_path,
+        first_frame=first_frame,
+        ffprobe_data=ffprobe_data
+    )
+    ffmpeg_args_str = get_burnin_output_args(
+        burnin, codec_data, source_ffmpeg_cmd
+    )
+    burnin.render(
+        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
+    )
+
+
+def prepare_burnins(
+    input_path, data, options=None, burnin_values=None,
+    full_input_path=None, first_frame=None, ffprobe_data=None
+):
+    """Prepare burnins filters for input without rendering them.
+
+    Data are modified with values calculated from input (e.g. resolution).
+    Arguments are the same as in 'burnins_from_data'.
+
+    Returns:
+        ModifiedBurnins: Burnins with filters ready to render.
+    """
+    if ffprobe_data is None and full_input_path:
         ffprobe_data = _get_ffprobe_data(full_input_path)
 
     burnin = ModifiedBurnins(input_path, ffprobe_data, options, first_frame)
@@ -693,7 +818,6 @@ def burnins_from_data(
     if source_timecode is not None:
         data[SOURCE_TIMECODE_KEY[1:-1]] = SOURCE_TIMECODE_KEY
 
-    clean_up_paths = []
     for align_text, value in burnin_values.items():
         if not value:
             continue
@@ -779,10 +903,25 @@ def burnins_from_data(
 
         burnin.add_text(text, align, frame_start, frame_end)
 
+    return burnin
+
+
+def get_burnin_output_args(burnin, codec_data=None, source_ffmpeg_cmd=None):
+    """Ffmpeg output arguments for prepared burnins.
+
+    Args:
+        burnin (ModifiedBurnins): Prepared burnins.
+        codec_data (Optional[list[str]]): Codec related arguments. Codec
+            is copied from input when not passed.
+        source_ffmpeg_cmd (Optional[str]): Command that created input.
+
+    Returns:
+        str: Output arguments joined to string.
+    """
     ffmpeg_args = []
     if codec_data:
         # Use codec definition from method arguments
-        ffmpeg_args = codec_data
+        ffmpeg_args = list(codec_data)
         ffmpeg_args.append("-g 1")
 
     else:
@@ -804,12 +943,129 @@ def burnins_from_data(
                     ffmpeg_args.extend([arg, args[idx + 1]])
 
     # Use group one (same as `-intra` argument, which is deprecated)
-    ffmpeg_args_str = " ".join(ffmpeg_args)
-    burnin.render(
-        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
-    )
-    for path in clean_up_paths:
-        os.remove(path)
+    return " ".join(ffmpeg_args)
+
+
+def _render_multiple_outputs(burnin_outputs, overwrite=True, logger=None):
+    """Render multiple burnins of the same input in single ffmpeg pass.
+
+    Input video stream is split to one branch per output in filter graph.
+
+    Args:
+        burnin_outputs (list[tuple[ModifiedBurnins, str, str, dict]]):
+            Prepared burnins with output path, output arguments and data.
+        overwrite (bool): Overwrite the outputs if they exist.
+        logger (Optional[logging.Logger]): Logger of ffmpeg output.
+    """
+    first_burnin = burnin_outputs[0][0]
+    filter_parts = ["[0:v]split={}{}".format(
+        len(burnin_outputs),
+        "".join(
+            "[in{}]".format(idx)
+            for idx in range(len(burnin_outputs))
+        )
+    )]
+    outputs = []
+    for idx, (burnin, output, args, _) in enumerate(burnin_outputs):
+        if not overwrite and os.path.exists(output):
+            raise RuntimeError("Destination '%s' exists, please "
+                               "use overwrite" % output)
+
+        filter_parts.append("[in{0}]{1}[out{0}]".format(
+            idx, burnin.filter_string or "null"
+        ))
+        output_args = [
+            '-map "[out{}]"'.format(idx),
+            '-map "0:a?"',
+        ]
+        args = burnin.get_output_args(args)
+        if args:
+            output_args.append(args)
+        if overwrite:
+            output_args.append("-y")
+        output_args.append('"{}"'.format(output))
+        outputs.append(" ".join(output_args))
+
+    with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp:
+        temp.write(";".join(filter_parts))
+        filters_path = temp.name
+
+    command = (FFMPEG_MULTIPLE_OUTPUTS % {
+        "input_args": first_burnin.get_input_args(),
+        "input": first_burnin.source,
+        "filters": '-filter_complex_script "{}"'.format(filters_path),
+        "outputs": " ".join(outputs),
+    }).strip()
+
+    output_paths = ", ".join(item[1] for item in burnin_outputs)
+    try:
+        _run_command(command, output_paths, logger)
+    finally:
+        os.remove(filters_path)
+
+    for burnin, output, _, data in burnin_outputs:
+        _validate_output(output, data.get("duration"))
+        burnin.cleanup()
+
+
+def render_burnins_from_data(burnins_data, overwrite=True, logger=None):
+    """Render burnins of multiple outputs in current process.
+
+    Burnins of the same input are rendered in single ffmpeg pass. Burnins
+    with per frame text are always rendered separately. The ffprobe data
+    of inputs are probed only once.
+
+    Args:
+        burnins_data (list[dict[str, Any]]): Data of each output, with the
+            same structure as json data passed to this script.
+        overwrite (bool): Outputs will be overwritten if already exist.
+        logger (Optional[logging.Logger]): Logger of ffmpeg output. Output
+            is printed if not passed.
+    """
+    burnins_by_input = OrderedDict()
+    for burnin_data in burnins_data:
+        full_input_path = burnin_data.get("full_input_path")
+        ffprobe_data = None
+        if full_input_path:
+            ffprobe_data = get_ffprobe_data(full_input_path)
+
+        # Data and options are modified during preparation
+        data = copy.deepcopy(burnin_data["burnin_data"])
+        burnin = prepare_burnins(
+            burnin_data["input"],
+            data,
+            options=copy.deepcopy(burnin_data.get("options")),
+            burnin_values=burnin_data.get("values"),
+            full_input_path=full_input_path,
+            first_frame=burnin_data.get("first_frame"),
+            ffprobe_data=ffprobe_data
+        )
+        args = get_burnin_output_args(
+            burnin, burnin_data.get("codec"), burnin_data.get("ffmpeg_cmd")
+        )
+
+        key = (burnin.source, burnin.first_frame)
+        if burnin.has_per_frame_text:
+            key = len(burnins_by_input)
+        burnins_by_input.setdefault(key, []).append(
+            (burnin, burnin_data["output"], args, data)
+        )
+
+    for burnin_outputs in burnins_by_input.values():
+        if len(burnin_outputs) > 1:
+            _render_multiple_outputs(burnin_outputs, overwrite, logger)
+            continue
+
+        burnin, output, args, data = burnin_outputs[0]
+        # Data are not passed as keyword arguments so their keys can't
+        #   collide with arguments of 'render'
+        burnin.render(
+            output,
+            args=args,
+            overwrite=overwrite,
+            logger=logger,
+            duration=data.get("duration")
+        )
 
 
 if __name__ == "__main__":
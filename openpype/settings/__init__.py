@@ -24,6 +24,10 @@ from .lib import (
     get_current_project_settings,
     get_anatomy_settings,
     get_local_settings,
+    create_settings_snapshot,
+    load_settings_snapshot,
+    clear_settings_snapshot,
+    get_settings_snapshot,
 )
 from .entities import (
     SystemSettings,
@@ -56,6 +60,10 @@ __all__ = (
     "get_current_project_settings",
     "get_anatomy_settings",
     "get_local_settings",
+    "create_settings_snapshot",
+    "load_settings_snapshot",
+    "clear_settings_snapshot",
+    "get_settings_snapshot",
 
     "SystemSettings",
     "ProjectSettings",
@@ -1,5 +1,7 @@
 import os
 import json
+import gzip
+import time
 import functools
 import logging
 import platform
@@ -18,7 +20,10 @@ from .constants import (
     SYSTEM_SETTINGS_KEY,
     PROJECT_SETTINGS_KEY,
     PROJECT_ANATOMY_KEY,
-    DEFAULT_PROJECT_KEY
+    DEFAULT_PROJECT_KEY,
+
+    SETTINGS_SNAPSHOT_ENV_KEY,
+    SETTINGS_SNAPSHOT_VERSION,
 )
 
 from .ayon_settings import (
@@ -41,12 +46,19 @@ DEFAULTS_DIR = os.path.join(
 # Variable where cache of default settings are stored
 _DEFAULT_SETTINGS = None
 
+# Resolved settings by settings type and arguments with signature of
+#   overrides used to resolve them
+_RESOLVED_SETTINGS_CACHE = {}
+
 # Handler of studio overrides
 _SETTINGS_HANDLER = None
 
 # Handler of local settings
 _LOCAL_SETTINGS_HANDLER = None
 
+# Loaded settings snapshot as tuple of filepath and data
+_SETTINGS_SNAPSHOT = None
+
 
 def clear_metadata_from_settings(values):
     """Remove all metadata keys from loaded settings."""
@@ -166,7 +178,7 @@ def save_studio_settings(data):
     from openpype.modules import ModulesManager, ISettingsChangeListener
 
     old_data = get_system_settings()
-    default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
+    default_values = _get_default_settings_section(SYSTEM_SETTINGS_KEY)
     new_data = apply_overrides(default_values, copy.deepcopy(data))
     new_data_with_metadata = copy.deepcopy(new_data)
     clear_metadata_from_settings(new_data)
@@ -213,7 +225,7 @@ def save_project_settings(project_name, overrides):
     # Notify Pype modules
     from openpype.modules import ModulesManager, ISettingsChangeListener
 
-    default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
+    default_values = _get_default_settings_section(PROJECT_SETTINGS_KEY)
     if project_name:
         old_data = get_project_settings(project_name)
 
@@ -274,7 +286,7 @@ def save_project_anatomy(project_name, anatomy_data):
     # Notify Pype modules
     from openpype.modules import ModulesManager, ISettingsChangeListener
 
-    default_values = get_default_settings()[PROJECT_ANATOMY_KEY]
+    default_values = _get_default_settings_section(PROJECT_ANATOMY_KEY)
     if project_name:
         old_data = get_anatomy_settings(project_name)
 
@@ -539,6 +551,7 @@ def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    _RESOLVED_SETTINGS_CACHE.clear()
 
 
 def _get_default_settings():
@@ -589,10 +602,57 @@ def get_default_settings():
     Returns:
         dict: Loaded default settings.
     """
+    return copy.deepcopy(_get_cached_default_settings())
+
+
+def _get_cached_default_settings():
+    """Cached default settings which must not be modified."""
     global _DEFAULT_SETTINGS
     if _DEFAULT_SETTINGS is None:
         _DEFAULT_SETTINGS = _get_default_settings()
-    return copy.deepcopy(_DEFAULT_SETTINGS)
+    return _DEFAULT_SETTINGS
+
+
+def _get_default_settings_section(key):
+    """Copy of one settings type from default settings.
+
+    Cheaper than 'get_default_settings' which copies all settings types.
+
+    Args:
+        key (str): Settings type key e.g. 'system_settings'.
+
+    Returns:
+        dict[str, Any]: Default settings of settings type.
+    """
+    return copy.deepcopy(_get_cached_default_settings()[key])
+
+
+def _get_memoized_settings(cache_key, inputs, resolve_func):
+    """Resolved settings which are resolved again only if inputs change.
+
+    Resolving of settings (merging of overrides on top of default values)
+    is skipped when inputs are same as on previous call with same
+    'cache_key'.
+
+    Args:
+        cache_key (tuple): Settings type and arguments of resolving.
+        inputs (list[Any]): Overrides and local settings used to resolve
+            settings.
+        resolve_func (Callable[[], dict[str, Any]]): Function which resolves
+            settings. It can modify passed inputs.
+
+    Returns:
+        dict[str, Any]: Resolved settings. Returned value is shared and
+            must not be modified.
+    """
+    # Inputs are compared by value. Version of override documents is
+    #   OpenPype version which does not change when settings are saved.
+    cached = _RESOLVED_SETTINGS_CACHE.get(cache_key)
+    if cached is None or cached[0] != inputs:
+        cached_inputs = copy.deepcopy(inputs)
+        cached = (cached_inputs, resolve_func())
+        _RESOLVED_SETTINGS_CACHE[cache_key] = cached
+    return cached[1]
 
 
 def load_json_file(fpath):
@@ -924,68 +984,104 @@ def apply_local_settings_on_project_settings(
 
 def _get_system_settings(clear_metadata=True, exclude_locals=None):
     """System settings with applied studio overrides."""
-    default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
     studio_values = get_studio_system_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
-
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
 
     # Apply local settings
     # Default behavior is based on `clear_metadata` value
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    local_settings = None
     if not exclude_locals:
         # TODO local settings may be required to apply for environments
         local_settings = get_local_settings()
-        apply_local_settings_on_system_settings(result, local_settings)
 
-    return result
+    def resolve():
+        result = _get_default_settings_section(SYSTEM_SETTINGS_KEY)
+        if studio_values:
+            result = merge_overrides(result, studio_values)
+
+        # Clear overrides metadata from settings
+        if clear_metadata:
+            clear_metadata_from_settings(result)
+
+        if local_settings is not None:
+            apply_local_settings_on_system_settings(result, local_settings)
+        return result
+
+    return copy.deepcopy(_get_memoized_settings(
+        (SYSTEM_SETTINGS_KEY, None, clear_metadata, exclude_locals),
+        [studio_values, local_settings],
+        resolve
+    ))
 
 
 def get_default_project_settings(clear_metadata=True, exclude_locals=None):
     """Project settings with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
     studio_values = get_studio_project_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
 
     # Apply local settings
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    local_settings = None
     if not exclude_locals:
         local_settings = get_local_settings()
-        apply_local_settings_on_project_settings(
-            result, local_settings, None
-        )
-    return result
+
+    def resolve():
+        result = _get_default_settings_section(PROJECT_SETTINGS_KEY)
+        if studio_values:
+            result = merge_overrides(result, studio_values)
+
+        # Clear overrides metadata from settings
+        if clear_metadata:
+            clear_metadata_from_settings(result)
+
+        if local_settings is not None:
+            apply_local_settings_on_project_settings(
+                result, local_settings, None
+            )
+        return result
+
+    return copy.deepcopy(_get_memoized_settings(
+        (PROJECT_SETTINGS_KEY, None, clear_metadata, exclude_locals),
+        [studio_values, local_settings],
+        resolve
+    ))
 
 
 def get_default_anatomy_settings(clear_metadata=True, exclude_locals=None):
     """Project anatomy data with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_ANATOMY_KEY]
     studio_values = get_studio_project_anatomy_overrides()
 
-    result = apply_overrides(default_values, studio_values)
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
-
     # Apply local settings
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    local_settings = None
     if not exclude_locals:
         local_settings = get_local_settings()
-        apply_local_settings_on_anatomy_settings(
-            result, local_settings, None
-        )
-    return result
+
+    def resolve():
+        result = _get_default_settings_section(PROJECT_ANATOMY_KEY)
+        if studio_values:
+            result = merge_overrides(result, studio_values)
+
+        # Clear overrides metadata from settings
+        if clear_metadata:
+            clear_metadata_from_settings(result)
+
+        if local_settings is not None:
+            apply_local_settings_on_anatomy_settings(
+                result, local_settings, None
+            )
+        return result
+
+    return copy.deepcopy(_get_memoized_settings(
+        (PROJECT_ANATOMY_KEY, None, clear_metadata, exclude_locals),
+        [studio_values, local_settings],
+        resolve
+    ))
 
 
 def get_anatomy_settings(
@@ -998,30 +1094,53 @@ def get_anatomy_settings(
             "`get_default_anatomy_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_anatomy_settings(False)
+    if clear_metadata and not site_name:
+        snapshot_settings = _get_snapshot_settings(
+            PROJECT_ANATOMY_KEY, project_name
+        )
+        if snapshot_settings is not None:
+            return snapshot_settings
+
+    studio_values = get_studio_project_anatomy_overrides()
     project_overrides = get_project_anatomy_overrides(
         project_name
     )
-    result = copy.deepcopy(studio_overrides)
-    if project_overrides:
-        for key, value in project_overrides.items():
-            result[key] = value
-
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
 
     # Apply local settings
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    local_settings = None
     if not exclude_locals:
         local_settings = get_local_settings()
-        apply_local_settings_on_anatomy_settings(
-            result, local_settings, project_name, site_name
-        )
 
-    return result
+    def resolve():
+        result = _get_default_settings_section(PROJECT_ANATOMY_KEY)
+        if studio_values:
+            result = merge_overrides(result, studio_values)
+
+        if project_overrides:
+            for key, value in project_overrides.items():
+                result[key] = value
+
+        # Clear overrides metadata from settings
+        if clear_metadata:
+            clear_metadata_from_settings(result)
+
+        if local_settings is not None:
+            apply_local_settings_on_anatomy_settings(
+                result, local_settings, project_name, site_name
+            )
+        return result
+
+    return copy.deepcopy(_get_memoized_settings(
+        (
+            PROJECT_ANATOMY_KEY, project_name, site_name,
+            clear_metadata, exclude_locals
+        ),
+        [studio_values, project_overrides, local_settings],
+        resolve
+    ))
 
 
 def _get_project_settings(
@@ -1034,28 +1153,42 @@ def _get_project_settings(
             " Call `get_default_project_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_project_settings(False)
+    studio_values = get_studio_project_settings_overrides()
     project_overrides = get_project_settings_overrides(
         project_name
     )
 
-    result = apply_overrides(studio_overrides, project_overrides)
-
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
-
     # Apply local settings
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    local_settings = None
     if not exclude_locals:
         local_settings = get_local_settings()
-        apply_local_settings_on_project_settings(
-            result, local_settings, project_name
-        )
 
-    return result
+    def resolve():
+        result = _get_default_settings_section(PROJECT_SETTINGS_KEY)
+        if studio_values:
+            result = merge_overrides(result, studio_values)
+
+        if project_overrides:
+            result = merge_overrides(result, project_overrides)
+
+        # Clear overrides metadata from settings
+        if clear_metadata:
+            clear_metadata_from_settings(result)
+
+        if local_settings is not None:
+            apply_local_settings_on_project_settings(
+                result, local_settings, project_name
+            )
+        return result
+
+    return copy.deepcopy(_get_memoized_settings(
+        (PROJECT_SETTINGS_KEY, project_name, clear_metadata, exclude_locals),
+        [studio_values, project_overrides, local_settings],
+        resolve
+    ))
 
 
 def get_current_project_settings():
@@ -1122,23 +1255,193 @@ def _get_general_environments():
 
 
 def get_general_environments():
+    snapshot_settings = _get_snapshot_settings(SYSTEM_SETTINGS_KEY)
+    if snapshot_settings is not None:
+        return snapshot_settings["general"]["environment"]
+
     if not AYON_SERVER_ENABLED:
         return _get_general_environments()
     value = get_system_settings()
     return value["general"]["environment"]
 
 
+def _clear_metadata_from_args(args, kwargs):
+    if args:
+        return args[0]
+    return kwargs.get("clear_metadata", True)
+
+
 def get_system_settings(*args, **kwargs):
+    if _clear_metadata_from_args(args, kwargs):
+        snapshot_settings = _get_snapshot_settings(SYSTEM_SETTINGS_KEY)
+        if snapshot_settings is not None:
+            return snapshot_settings
+
     if not AYON_SERVER_ENABLED:
         return _get_system_settings(*args, **kwargs)
 
-    default_settings = get_default_settings()[SYSTEM_SETTINGS_KEY]
+    default_settings = _get_default_settings_section(SYSTEM_SETTINGS_KEY)
     return get_ayon_system_settings(default_settings)
 
 
 def get_project_settings(project_name, *args, **kwargs):
+    if project_name and _clear_metadata_from_args(args, kwargs):
+        snapshot_settings = _get_snapshot_settings(
+            PROJECT_SETTINGS_KEY, project_name
+        )
+        if snapshot_settings is not None:
+            return snapshot_settings
+
     if not AYON_SERVER_ENABLED:
         return _get_project_settings(project_name, *args, **kwargs)
 
-    default_settings = get_default_settings()[PROJECT_SETTINGS_KEY]
+    default_settings = _get_default_settings_section(PROJECT_SETTINGS_KEY)
     return get_ayon_project_settings(default_settings, project_name)
+
+
+def create_settings_snapshot(project_name, filepath):
+    """Resolve settings of project and store them to snapshot file.
+
+    Processes which load the snapshot, e.g. publish jobs on farm, don't
+    have to query settings from database or server. Settings are resolved
+    without local settings of current machine.
+
+    Args:
+        project_name (str): Name of project.
+        filepath (str): Path to output file. Content is gzip compressed
+            json.
+
+    Returns:
+        dict[str, Any]: Snapshot data.
+    """
+    anatomy_settings = None
+    if not AYON_SERVER_ENABLED:
+        anatomy_settings = get_anatomy_settings(
+            project_name, exclude_locals=True
+        )
+
+    snapshot = {
+        "version": SETTINGS_SNAPSHOT_VERSION,
+        "ayon": AYON_SERVER_ENABLED,
+        "created": time.time(),
+        "project_name": project_name,
+        SYSTEM_SETTINGS_KEY: get_system_settings(exclude_locals=True),
+        PROJECT_SETTINGS_KEY: get_project_settings(
+            project_name, exclude_locals=True
+        ),
+        PROJECT_ANATOMY_KEY: anatomy_settings,
+    }
+
+    dirpath = os.path.dirname(filepath)
+    if dirpath and not os.path.exists(dirpath):
+        os.makedirs(dirpath)
+
+    content = json.dumps(snapshot, separators=(",", ":"), default=str)
+    with gzip.open(filepath, "wb") as stream:
+        stream.write(content.encode("utf-8"))
+    return snapshot
+
+
+def load_settings_snapshot(filepath):
+    """Use settings from snapshot file instead of querying them.
+
+    Path to the snapshot is also set to environment variable so
+    subprocesses use it too.
+
+    Args:
+        filepath (str): Path to snapshot created with
+            'create_settings_snapshot'.
+
+    Returns:
+        bool: Snapshot was loaded and is used.
+    """
+    global _SETTINGS_SNAPSHOT
+
+    snapshot = _read_settings_snapshot(filepath)
+    if snapshot is None:
+        return False
+
+    _SETTINGS_SNAPSHOT = (filepath, snapshot)
+    os.environ[SETTINGS_SNAPSHOT_ENV_KEY] = filepath
+    return True
+
+
+def clear_settings_snapshot():
+    """Stop using settings snapshot."""
+    global _SETTINGS_SNAPSHOT
+
+    _SETTINGS_SNAPSHOT = None
+    os.environ.pop(SETTINGS_SNAPSHOT_ENV_KEY, None)
+
+
+def _read_settings_snapshot(filepath):
+    try:
+        with gzip.open(filepath, "rb") as stream:
+            snapshot = json.loads(stream.read().decode("utf-8"))
+
+    # 'JSON_EXC' and decode errors are subclasses of 'ValueError'
+    except (IOError, OSError, ValueError):
+        log.warning(
+            "Failed to read settings snapshot \"{}\".".format(filepath),
+            exc_info=True
+        )
+        return None
+
+    version = snapshot.get("version")
+    if version != SETTINGS_SNAPSHOT_VERSION:
+        log.warning((
+            "Settings snapshot \"{}\" has unsupported version {}."
+        ).format(filepath, version))
+        return None
+
+    if snapshot.get("ayon") != AYON_SERVER_ENABLED:
+        log.warning((
+            "Settings snapshot \"{}\" was created for different mode."
+        ).format(filepath))
+        return None
+    return snapshot
+
+
+def get_settings_snapshot():
+    """Settings snapshot used by current process.
+
+    Snapshot is loaded from path in 'OPENPYPE_SETTINGS_SNAPSHOT' environment
+    variable on first call.
+
+    Returns:
+        Union[dict[str, Any], None]: Snapshot data or None if snapshot is
+            not used.
+    """
+    global _SETTINGS_SNAPSHOT
+
+    filepath = os.environ.get(SETTINGS_SNAPSHOT_ENV_KEY)
+    if not filepath:
+        return None
+
+    if _SETTINGS_SNAPSHOT is None or _SETTINGS_SNAPSHOT[0] != filepath:
+        _SETTINGS_SNAPSHOT = (filepath, _read_settings_snapshot(filepath))
+    return _SETTINGS_SNAPSHOT[1]
+
+
+def _get_snapshot_settings(key, project_name=None):
+    """Copy of settings from snapshot.
+
+    Args:
+        key (str): Settings type key e.g. 'system_settings'.
+        project_name (Optional[str]): Project name for project settings.
+
+    Returns:
+        Union[dict[str, Any], None]: Settings or None if snapshot is not
+            used or does not contain the settings.
+    """
+    snapshot = get_settings_snapshot()
+    if not snapshot:
+        return None
+
+    if project_name and snapshot["project_name"] != project_name:
+        return None
+
+    value = snapshot.get(key)
+    if value is None:
+        return None
+    return copy.deepcopy(value)
@@ -146,6 +146,10 @@ class ProductsModel:
     """
 
     lifetime = 60  # In seconds (minute by default)
+    # Maximum number of folders with cached products
+    max_cached_folders = 1000
+    # Maximum number of versions with cached representations
+    max_cached_versions = 5000
 
     def __init__(self, controller):
         self._controller = controller
@@ -160,9 +164,18 @@ class ProductsModel:
         self._product_type_items_cache = NestedCacheItem(
             levels=1, default_factory=list, lifetime=self.lifetime)
         self._product_items_cache = NestedCacheItem(
-            levels=2, default_factory=dict, lifetime=self.lifetime)
+            levels=2,
+            default_factory=dict,
+            lifetime=self.lifetime,
+            max_items=self.max_cached_folders,
+            eviction_callback=self._on_product_items_evict
+        )
         self._repre_items_cache = NestedCacheItem(
-            levels=2, default_factory=dict, lifetime=self.lifetime)
+            levels=2,
+            default_factory=dict,
+            lifetime=self.lifetime,
+            max_items=self.max_cached_versions
+        )
 
     def reset(self):
         """Reset model with all cached data."""
@@ -547,6 +560,10 @@ class ProductsModel:
             version_items.update(product_item.version_items)
         return version_items
 
+    def _on_product_items_evict(self, keys, _product_items):
+        project_name, folder_id = keys
+        self._clear_product_version_items(project_name, [folder_id])
+
     def _clear_product_version_items(self, project_name, folder_ids):
         """Clear product and version items from memory.
 
@@ -1,16 +1,169 @@
+import sys
 import time
+import threading
 import collections
 
-InitInfo = collections.namedtuple(
-    "InitInfo",
-    ["default_factory", "lifetime"]
-)
+
+class InitInfo:
+    """Init info shared by all children of nested cache item."""
+
+    def __init__(self, default_factory, lifetime, store):
+        self.default_factory = default_factory
+        self.lifetime = lifetime
+        self.store = store
 
 
 def _default_factory_func():
     return None
 
 
+def estimate_size(value):
+    """Estimate size of value in memory.
+
+    Containers and attributes of objects are walked recursively, values
+    referenced multiple times are counted only once.
+
+    Args:
+        value (Any): Value to estimate size of.
+
+    Returns:
+        int: Estimated size in bytes.
+    """
+
+    size = 0
+    seen = set()
+    queue = collections.deque([value])
+    while queue:
+        item = queue.popleft()
+        item_id = id(item)
+        if item_id in seen:
+            continue
+        seen.add(item_id)
+        size += sys.getsizeof(item)
+        if isinstance(item, (str, bytes, int, float, bool)) or item is None:
+            continue
+
+        if isinstance(item, dict):
+            queue.extend(item.keys())
+            queue.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            queue.extend(item)
+        elif hasattr(item, "__dict__"):
+            queue.append(item.__dict__)
+    return size
+
+
+class CacheStore:
+    """Usage tracking of cache items with limits of count and size.
+
+    Store is shared by all children of 'NestedCacheItem'. When number of
+    items or their estimated size exceed limits, least recently used items
+    are removed. Items used during last 'protect_time' seconds are never
+    removed, so items used in one operation are still available even if
+    limits are exceeded for a moment.
+
+    Args:
+        max_items (Optional[int]): Maximum number of cache items.
+        max_bytes (Optional[int]): Maximum estimated size of cached data
+            in bytes.
+        eviction_callback (Optional[Callable[[tuple, Any], None]]): Called
+            with keys of removed item and its data when item is removed
+            because of limits.
+    """
+
+    protect_time = 1.0
+
+    def __init__(self, max_items=None, max_bytes=None, eviction_callback=None):
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._eviction_callback = eviction_callback
+        self._lock = threading.RLock()
+        # Cache item -> [parent, keys, size, last used time]
+        self._items = collections.OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def add_item(self, item, parent, keys):
+        with self._lock:
+            self._items[item] = [parent, keys, 0, time.time()]
+            self._enforce_limits()
+
+    def touch(self, item):
+        with self._lock:
+            info = self._items.get(item)
+            if info is not None:
+                info[3] = time.time()
+                self._items.move_to_end(item)
+
+    def record_access(self, valid):
+        with self._lock:
+            if valid:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def item_updated(self, item):
+        with self._lock:
+            info = self._items.get(item)
+            if info is None:
+                return
+            if self._max_bytes is not None:
+                size = estimate_size(item.get_data())
+                self._bytes += size - info[2]
+                info[2] = size
+            info[3] = time.time()
+            self._items.move_to_end(item)
+            self._enforce_limits()
+
+    def remove_item(self, item):
+        with self._lock:
+            info = self._items.pop(item, None)
+            if info is not None:
+                self._bytes -= info[2]
+
+    def _is_over_limit(self):
+        if (
+            self._max_items is not None
+            and len(self._items) > self._max_items
+        ):
+            return True
+        return self._max_bytes is not None and self._bytes > self._max_bytes
+
+    def _enforce_limits(self):
+        protect_from = time.time() - self.protect_time
+        while self._items and self._is_over_limit():
+            item, info = next(iter(self._items.items()))
+            if info[3] > protect_from:
+                break
+            parent, keys, size, _ = info
+            self._items.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+            parent._remove_evicted(keys[-1], item)
+            if self._eviction_callback is not None:
+                self._eviction_callback(keys, item.get_data())
+
+    def get_stats(self):
+        """Usage statistics of cache.
+
+        Returns:
+            dict[str, int]: Number of hits, misses and evictions, number of
+                items and their estimated size in bytes (only if size
+                is limited).
+        """
+
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "items": len(self._items),
+                "bytes": self._bytes,
+            }
+
+
 class CacheItem:
     """Simple cache item with lifetime and default value.
 
@@ -20,7 +173,7 @@ class CacheItem:
         lifetime (Optional[int]): Lifetime of the cache data in seconds.
     """
 
-    def __init__(self, default_factory=None, lifetime=None):
+    def __init__(self, default_factory=None, lifetime=None, _store=None):
         if lifetime is None:
             lifetime = 120
         self._lifetime = lifetime
@@ -29,6 +182,7 @@ class CacheItem:
             default_factory = _default_factory_func
         self._default_factory = default_factory
         self._data = default_factory()
+        self._store = _store
 
     @property
     def is_valid(self):
@@ -38,9 +192,14 @@ class CacheItem:
             bool: True if cache is valid, False otherwise.
         """
 
+        valid = self._is_valid()
+        if self._store is not None:
+            self._store.record_access(valid)
+        return valid
+
+    def _is_valid(self):
         if self._last_update is None:
             return False
-
         return (time.time() - self._last_update) < self._lifetime
 
     def set_lifetime(self, lifetime):
@@ -75,6 +234,8 @@ class CacheItem:
     def update_data(self, data):
         self._data = data
         self._last_update = time.time()
+        if self._store is not None:
+            self._store.item_updated(self)
 
 
 class NestedCacheItem:
@@ -95,25 +256,49 @@ class NestedCacheItem:
         >>> cache["a"]["b"].is_valid
         False
 
+    Number of cache items on the last level can be limited with 'max_items'
+    and 'max_bytes'. Least recently used items are removed when limits are
+    exceeded, see 'CacheStore'.
+
     Args:
         levels (int): Number of nested levels where read cache is stored.
         default_factory (Optional[callable]): Function that returns default
             value used on init and on reset.
         lifetime (Optional[int]): Lifetime of the cache data in seconds.
+        max_items (Optional[int]): Maximum number of cache items.
+        max_bytes (Optional[int]): Maximum estimated size of cached data
+            in bytes.
+        eviction_callback (Optional[Callable[[tuple, Any], None]]): Called
+            with keys of removed item and its data when item is removed
+            because of limits.
         _init_info (Optional[InitInfo]): Private argument. Init info for
             nested cache where created from parent item.
+        _keys (Optional[tuple]): Private argument. Keys of parent items.
     """
 
     def __init__(
-        self, levels=1, default_factory=None, lifetime=None, _init_info=None
+        self,
+        levels=1,
+        default_factory=None,
+        lifetime=None,
+        max_items=None,
+        max_bytes=None,
+        eviction_callback=None,
+        _init_info=None,
+        _keys=None
     ):
         if levels < 1:
             raise ValueError("Nested levels must be greater than 0")
         self._data_by_key = {}
         if _init_info is None:
-            _init_info = InitInfo(default_factory, lifetime)
+            _init_info = InitInfo(
+                default_factory,
+                lifetime,
+                CacheStore(max_items, max_bytes, eviction_callback)
+            )
         self._init_info = _init_info
         self._levels = levels
+        self._keys = _keys or tuple()
 
     def __getitem__(self, key):
         """Get cached data.
@@ -125,21 +310,42 @@ class NestedCacheItem:
             Union[NestedCacheItem, CacheItem]: Cache item.
         """
 
+        store = self._init_info.store
         cache = self._data_by_key.get(key)
-        if cache is None:
-            if self._levels > 1:
-                cache = NestedCacheItem(
-                    levels=self._levels - 1,
-                    _init_info=self._init_info
-                )
-            else:
-                cache = CacheItem(
-                    self._init_info.default_factory,
-                    self._init_info.lifetime
-                )
-            self._data_by_key[key] = cache
+        if cache is not None:
+            if self._levels == 1:
+                store.touch(cache)
+            return cache
+
+        if self._levels > 1:
+            cache = NestedCacheItem(
+                levels=self._levels - 1,
+                _init_info=self._init_info,
+                _keys=self._keys + (key, )
+            )
+        else:
+            cache = CacheItem(
+                self._init_info.default_factory,
+                self._init_info.lifetime,
+                _store=store
+            )
+        self._data_by_key[key] = cache
+        if self._levels == 1:
+            store.add_item(cache, self, self._keys + (key, ))
         return cache
 
+    def _remove_evicted(self, key, cache):
+        if self._data_by_key.get(key) is cache:
+            self._data_by_key.pop(key)
+
+    def _remove_from_store(self, cache):
+        store = self._init_info.store
+        if self._levels > 1:
+            for child in cache._data_by_key.values():
+                cache._remove_from_store(child)
+        else:
+            store.remove_item(cache)
+
     def __setitem__(self, key, value):
         """Update cached data.
 
@@ -183,7 +389,9 @@ class NestedCacheItem:
             key (str): Key of the cache item.
         """
 
-        self._data_by_key.pop(key, None)
+        cache = self._data_by_key.pop(key, None)
+        if cache is not None:
+            self._remove_from_store(cache)
 
     def clear_invalid(self):
         """Clear all invalid cache items.
@@ -201,9 +409,10 @@ class NestedCacheItem:
                     changed[key] = output
                 if not cache.cached_count():
                     self._data_by_key.pop(key)
-            elif not cache.is_valid:
+            elif not cache._is_valid():
                 changed[key] = cache.get_data()
                 self._data_by_key.pop(key)
+                self._remove_from_store(cache)
         return changed
 
     def reset(self):
@@ -213,8 +422,20 @@ class NestedCacheItem:
             To clear only invalid cache items use 'clear_invalid'.
         """
 
+        for cache in self._data_by_key.values():
+            self._remove_from_store(cache)
         self._data_by_key = {}
 
+    def get_stats(self):
+        """Usage statistics of cache shared with all nested levels.
+
+        Returns:
+            dict[str, int]: Number of hits, misses and evictions, number of
+                items and their estimated size in bytes.
+        """
+
+        return self._init_info.store.get_stats()
+
     def set_lifetime(self, lifetime):
         """Change lifetime of all children cache items.
 
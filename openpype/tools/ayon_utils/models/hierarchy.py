@@ -223,17 +223,37 @@ class HierarchyModel(object):
     folder or project. Tasks can have as parent only folder.
     """
     lifetime = 60  # A minute
+    # Maximum number of projects with cached folders
+    max_cached_projects = 10
+    # Maximum number of cached folders and tasks entities
+    max_cached_entities = 20000
 
     def __init__(self, controller):
         self._folders_items = NestedCacheItem(
-            levels=1, default_factory=dict, lifetime=self.lifetime)
+            levels=1,
+            default_factory=dict,
+            lifetime=self.lifetime,
+            max_items=self.max_cached_projects
+        )
         self._folders_by_id = NestedCacheItem(
-            levels=2, default_factory=dict, lifetime=self.lifetime)
+            levels=2,
+            default_factory=dict,
+            lifetime=self.lifetime,
+            max_items=self.max_cached_entities
+        )
 
         self._task_items = NestedCacheItem(
-            levels=2, default_factory=dict, lifetime=self.lifetime)
+            levels=2,
+            default_factory=dict,
+            lifetime=self.lifetime,
+            max_items=self.max_cached_entities
+        )
         self._tasks_by_id = NestedCacheItem(
-            levels=2, default_factory=dict, lifetime=self.lifetime)
+            levels=2,
+            default_factory=dict,
+            lifetime=self.lifetime,
+            max_items=self.max_cached_entities
+        )
 
         self._folders_refreshing = set()
         self._tasks_refreshing = set()
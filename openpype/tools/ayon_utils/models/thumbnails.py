@@ -1,5 +1,3 @@
-import collections
-
 import ayon_api
 
 from openpype.client.server.thumbnails import AYONThumbnailCache
@@ -9,17 +7,31 @@ from .cache import NestedCacheItem
 
 class ThumbnailsModel:
     entity_cache_lifetime = 240  # In seconds
+    # Thumbnail paths don't change, they are kept until removed by limit
+    paths_cache_lifetime = 24 * 60 * 60
+    # Maximum number of cached thumbnail ids and paths
+    max_cached_items = 10000
 
     def __init__(self):
         self._thumbnail_cache = AYONThumbnailCache()
-        self._paths_cache = collections.defaultdict(dict)
+        self._paths_cache = NestedCacheItem(
+            levels=2,
+            lifetime=self.paths_cache_lifetime,
+            max_items=self.max_cached_items
+        )
         self._folders_cache = NestedCacheItem(
-            levels=2, lifetime=self.entity_cache_lifetime)
+            levels=2,
+            lifetime=self.entity_cache_lifetime,
+            max_items=self.max_cached_items
+        )
         self._versions_cache = NestedCacheItem(
-            levels=2, lifetime=self.entity_cache_lifetime)
+            levels=2,
+            lifetime=self.entity_cache_lifetime,
+            max_items=self.max_cached_items
+        )
 
     def reset(self):
-        self._paths_cache = collections.defaultdict(dict)
+        self._paths_cache.reset()
         self._folders_cache.reset()
         self._versions_cache.reset()
 
@@ -62,15 +74,15 @@ class ThumbnailsModel:
         if not thumbnail_id:
             return None
 
-        project_cache = self._paths_cache[project_name]
-        if thumbnail_id in project_cache:
-            return project_cache[thumbnail_id]
+        cache = self._paths_cache[project_name][thumbnail_id]
+        if cache.is_valid:
+            return cache.get_data()
 
         filepath = self._thumbnail_cache.get_thumbnail_filepath(
             project_name, thumbnail_id
         )
         if filepath is not None:
-            project_cache[thumbnail_id] = filepath
+            cache.update_data(filepath)
             return filepath
 
         # 'ayon_api' had a bug, public function
@@ -88,7 +100,7 @@ class ThumbnailsModel:
                 result.content,
                 result.content_type
             )
-        project_cache[thumbnail_id] = filepath
+        cache.update_data(filepath)
         return filepath
 
     def _query_folder_thumbnail_ids(self, project_name, folder_ids):
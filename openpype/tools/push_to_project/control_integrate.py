@@ -19,6 +19,7 @@ from openpype.client import (
     get_last_version_by_subset_id,
     get_version_by_name,
     get_representations,
+    expand_file_infos,
 )
 from openpype.client.operations import (
     OperationsSession,
@@ -444,7 +445,7 @@ class ProjectPushRepreItem:
             .replace(udim_placeholder, "(?P<udim>[0-9]+)")
         )
         src_basename_regex = re.compile("^{}$".format(src_basename))
-        for file_info in self._repre_doc["files"]:
+        for file_info in expand_file_infos(self._repre_doc["files"]):
             filepath_template = self._clean_path(file_info["path"])
             filepath = self._clean_path(
                 filepath_template.format(root=self._roots)
@@ -486,7 +487,7 @@ class ProjectPushRepreItem:
                                                     fill_repre_context)
         repre_path = self._clean_path(repre_path)
         src_dirpath = os.path.dirname(repre_path)
-        for file_info in self._repre_doc["files"]:
+        for file_info in expand_file_infos(self._repre_doc["files"]):
             filepath_template = self._clean_path(file_info["path"])
             filepath = self._clean_path(
                 filepath_template.format(root=self._roots))
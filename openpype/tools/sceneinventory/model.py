@@ -7,19 +7,13 @@ from qtpy import QtCore, QtGui
 import qtawesome
 
 from openpype.host import ILoadHost
-from openpype.client import (
-    get_asset_by_id,
-    get_subset_by_id,
-    get_version_by_id,
-    get_last_version_by_subset_id,
-    get_representation_by_id,
-)
 from openpype.pipeline import (
     get_current_project_name,
     schema,
     HeroVersionType,
     registered_host,
 )
+from openpype.pipeline.load import RepresentationContextResolver
 from openpype.style import get_default_entity_icon_color
 from openpype.tools.utils.models import TreeModel, Item
 from openpype.modules import ModulesManager
@@ -331,42 +325,42 @@ class InventoryModel(TreeModel):
         for item in items:
             grouped[item["representation"]]["items"].append(item)
 
+        # Query parents of all representations at once
+        resolver = RepresentationContextResolver(project_name)
+        contexts_by_repre_id = resolver.resolve(grouped.keys())
+
         # Add to model
         not_found = defaultdict(list)
         not_found_ids = []
         for repre_id, group_dict in sorted(grouped.items()):
             group_items = group_dict["items"]
-            # Get parenthood per group
-            representation = get_representation_by_id(
-                project_name, repre_id
-            )
+            context = contexts_by_repre_id.get(str(repre_id)) or {}
+            representation = context.get("representation")
             if not representation:
                 not_found["representation"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
-            version = get_version_by_id(
-                project_name, representation["parent"]
-            )
+            version = context["version"]
             if not version:
                 not_found["version"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
             elif version["type"] == "hero_version":
-                _version = get_version_by_id(
-                    project_name, version["version_id"]
-                )
+                _version = context["hero_source_version"]
+                # Don't change cached document of resolver
+                version = dict(version)
                 version["name"] = HeroVersionType(_version["name"])
                 version["data"] = _version["data"]
 
-            subset = get_subset_by_id(project_name, version["parent"])
+            subset = context["subset"]
             if not subset:
                 not_found["subset"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
-            asset = get_asset_by_id(project_name, subset["parent"])
+            asset = context["asset"]
             if not asset:
                 not_found["asset"].extend(group_items)
                 not_found_ids.append(repre_id)
@@ -376,7 +370,8 @@ class InventoryModel(TreeModel):
                 "representation": representation,
                 "version": version,
                 "subset": subset,
-                "asset": asset
+                "asset": asset,
+                "highest_version": context["last_version"]
             })
 
         for id in not_found_ids:
@@ -427,9 +422,7 @@ class InventoryModel(TreeModel):
 
             # Store the highest available version so the model can know
             # whether current version is currently up-to-date.
-            highest_version = get_last_version_by_subset_id(
-                project_name, version["parent"]
-            )
+            highest_version = grouped[repre_id]["highest_version"]
 
             # create the group header
             group_node = Item()
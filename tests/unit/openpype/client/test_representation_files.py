@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Test suite for compact sequence file infos of representations."""
+from openpype.client.representation_files import (
+    compact_file_infos,
+    expand_file_infos,
+    get_file_info_paths,
+    get_file_infos_count,
+    set_file_info_path,
+)
+
+SITES = [{"name": "studio"}]
+
+
+def _create_file_infos(frames):
+    return [
+        {
+            "_id": frame,
+            "path": "{{root[work]}}/demo/v001/render.{:04d}.exr".format(frame),
+            "size": 10,
+            "hash": "hash_{}".format(frame),
+            "sites": SITES,
+        }
+        for frame in frames
+    ]
+
+
+def test_compact_and_expand():
+    frames = [1, 2, 3, 5, 6]
+    file_infos = _create_file_infos(frames)
+    resource = {
+        "_id": "resource",
+        "path": "{root[work]}/demo/v001/resources/texture.png",
+        "size": 5,
+        "hash": "hash_texture",
+        "sites": SITES,
+    }
+    file_infos.append(resource)
+
+    compacted = compact_file_infos(file_infos)
+
+    assert len(compacted) == 2
+    sequence_info, resource_info = compacted
+    assert resource_info is resource
+    assert sequence_info["_id"] == 1
+    assert sequence_info["size"] == 50
+    assert sequence_info["sequence"]["frameStart"] == 1
+    assert sequence_info["sequence"]["frameEnd"] == 6
+    assert sequence_info["sequence"]["missingFrames"] == [4]
+
+    expanded = expand_file_infos(compacted)
+    assert [item["path"] for item in expanded] == [
+        item["path"] for item in file_infos
+    ]
+    assert sum(item["size"] for item in expanded) == 55
+    assert get_file_infos_count(compacted) == len(file_infos)
+    assert get_file_infos_count(expanded) == len(file_infos)
+
+
+def test_compact_min_frames():
+    file_infos = _create_file_infos(range(1, 4))
+
+    assert compact_file_infos(file_infos, min_frames=4) == file_infos
+
+
+def test_set_file_info_path():
+    sequence_info = compact_file_infos(_create_file_infos(range(1, 4)))[0]
+
+    set_file_info_path(
+        sequence_info, "{root[work]}/demo/hero/render_hero.0001.exr"
+    )
+
+    assert get_file_info_paths(sequence_info) == [
+        "{root[work]}/demo/hero/render_hero.0001.exr",
+        "{root[work]}/demo/hero/render_hero.0002.exr",
+        "{root[work]}/demo/hero/render_hero.0003.exr",
+    ]
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""Test suite for concurrent texture processing of Maya look extractor.
+
+Maya is not available in tests so its modules are replaced with mocks and
+'maketx' with stand-in executable which only copies the file.
+"""
+import os
+import sys
+import time
+import textwrap
+import importlib
+from unittest import mock
+
+import pytest
+
+MAKETX_SCRIPT = textwrap.dedent("""
+    import sys
+    import time
+    import shutil
+
+    args = sys.argv[1:]
+    source = args[args.index("--checknan") + 1]
+    destination = args[args.index("-o") + 1]
+    time.sleep({sleep})
+    shutil.copyfile(source, destination)
+""")
+SLEEP = 0.5
+
+
+@pytest.fixture
+def extract_look(monkeypatch):
+    for module_name in (
+        "maya",
+        "maya.cmds",
+        "openpype.hosts.maya.api",
+        "openpype.hosts.maya.api.lib",
+    ):
+        monkeypatch.setitem(sys.modules, module_name, mock.MagicMock())
+    module_name = "openpype.hosts.maya.plugins.publish.extract_look"
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    return importlib.import_module(module_name)
+
+
+def _create_textures(dirpath, count):
+    filepaths = []
+    for idx in range(count):
+        filepath = os.path.join(dirpath, "texture_{}.png".format(idx))
+        with open(filepath, "w") as stream:
+            stream.write("texture {}".format(idx))
+        filepaths.append(filepath)
+    return filepaths
+
+
+def test_process_resources_concurrently(extract_look, monkeypatch, tmpdir):
+    maketx_path = str(tmpdir.join("maketx.py"))
+    with open(maketx_path, "w") as stream:
+        stream.write(MAKETX_SCRIPT.format(sleep=SLEEP))
+    monkeypatch.setattr(
+        extract_look,
+        "get_oiio_tool_args",
+        lambda tool_name: [sys.executable, maketx_path]
+    )
+
+    source_dir = tmpdir.mkdir("source")
+    filepaths = _create_textures(str(source_dir), 4)
+    # Resources sharing textures
+    resources = [
+        {
+            "node": "file{}".format(idx),
+            "attribute": "file{}.fileTextureName".format(idx),
+            "source": filepath,
+            "files": [filepath],
+            "color_space": "sRGB",
+        }
+        for idx, filepath in enumerate(filepaths + filepaths[:2])
+    ]
+    instance = mock.MagicMock()
+    instance.data = {
+        "resources": resources,
+        "resourcesDir": str(tmpdir.join("publish", "resources")),
+    }
+    extract_look.lib.get_color_management_preferences.return_value = {
+        "enabled": False
+    }
+
+    plugin = extract_look.ExtractLook()
+    plugin.texture_processing_max_workers = 4
+    staging_dir = str(tmpdir.mkdir("staging"))
+    start = time.time()
+    result = plugin.process_resources(
+        instance, staging_dir, [extract_look.MakeTX()]
+    )
+    duration = time.time() - start
+
+    # Textures were converted at the same time
+    assert duration < SLEEP * len(filepaths)
+    transfers = result["fileTransfers"]
+    assert len(transfers) == len(filepaths)
+    for filepath, (source, destination) in zip(filepaths, transfers):
+        basename = os.path.splitext(os.path.basename(filepath))[0]
+        assert source == os.path.join(
+            staging_dir, "resources", basename + ".tx"
+        )
+        assert os.path.exists(source)
+        assert destination == os.path.join(
+            instance.data["resourcesDir"], basename + ".tx"
+        )
+    assert len(result["fileHashes"]) == len(filepaths)
+    for resource in resources:
+        assert resource["result_color_space"] == "linear"
+
+
+def test_process_textures_with_same_hash(extract_look, monkeypatch, tmpdir):
+    processed = []
+
+    class Processor(extract_look.TextureProcessor):
+        extension = ".tx"
+
+        def process(self, source, colorspace, color_management, staging_dir):
+            processed.append(source)
+            return extract_look.TextureResult(
+                path=source,
+                colorspace=colorspace,
+                file_hash=extract_look.source_hash(source),
+                transfer_mode=extract_look.COPY
+            )
+
+    filepaths = (
+        _create_textures(str(tmpdir.mkdir("first")), 2)
+        + _create_textures(str(tmpdir.mkdir("second")), 1)
+    )
+    for filepath in filepaths:
+        os.utime(filepath, (1000, 1000))
+    file_colorspaces = {filepath: "sRGB" for filepath in filepaths}
+
+    plugin = extract_look.ExtractLook()
+    results = plugin._process_textures(
+        file_colorspaces,
+        processors=[Processor()],
+        staging_dir=str(tmpdir),
+        force_copy=True,
+        color_management={"enabled": False}
+    )
+
+    # Copy of texture in second folder was not processed again
+    assert sorted(processed) == sorted(filepaths[:2])
+    assert results[filepaths[2]] is results[filepaths[0]]
+
+
+def test_existing_hashes_are_queried_once(extract_look, monkeypatch, tmpdir):
+    filepaths = _create_textures(str(tmpdir), 3)
+    published_path = filepaths[0]
+    queries = []
+
+    def find_paths_by_hashes(texture_hashes):
+        queries.append(texture_hashes)
+        first_hash = extract_look.source_hash(filepaths[0])
+        return {
+            texture_hash: (
+                [published_path] if texture_hash == first_hash else []
+            )
+            for texture_hash in texture_hashes
+        }
+
+    monkeypatch.setattr(
+        extract_look, "find_paths_by_hashes", find_paths_by_hashes
+    )
+    monkeypatch.setattr(
+        extract_look,
+        "find_paths_by_hash",
+        mock.Mock(side_effect=AssertionError("Hash queried separately"))
+    )
+
+    plugin = extract_look.ExtractLook()
+    results = plugin._process_textures(
+        {filepath: "sRGB" for filepath in filepaths},
+        processors=[],
+        staging_dir=str(tmpdir),
+        force_copy=False,
+        color_management={"enabled": False}
+    )
+
+    assert len(queries) == 1
+    assert results[filepaths[0]].transfer_mode == extract_look.HARDLINK
+    for filepath in filepaths[1:]:
+        assert results[filepath].transfer_mode == extract_look.COPY
+        assert results[filepath].path == filepath
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Test suite for FileTransaction."""
+import os
+
+from openpype.lib import file_transaction
+from openpype.lib.file_transaction import FileTransaction
+
+
+def _create_sequence(dirpath, count=20):
+    filepaths = []
+    os.makedirs(dirpath)
+    for frame in range(count):
+        filepath = os.path.join(dirpath, "render.{:04d}.exr".format(frame))
+        with open(filepath, "wb") as stream:
+            stream.write(os.urandom(1024 + frame))
+        filepaths.append(filepath)
+    return filepaths
+
+
+def _read(filepath):
+    with open(filepath, "rb") as stream:
+        return stream.read()
+
+
+def test_concurrent_transfer(tmp_path):
+    src_dir = str(tmp_path / "src")
+    dst_dir = str(tmp_path / "dst")
+    filepaths = _create_sequence(src_dir)
+
+    progress = []
+    transaction = FileTransaction(
+        max_workers=4,
+        batch_size=3,
+        buffer_size=512,
+        progress_callback=lambda *args: progress.append(args)
+    )
+    for filepath in filepaths:
+        dst = os.path.join(dst_dir, os.path.basename(filepath))
+        transaction.add(filepath, dst)
+    transaction.process()
+    transaction.finalize()
+
+    assert len(transaction.transferred) == len(filepaths)
+    assert len(progress) == len(filepaths)
+    assert progress[-1][0] == progress[-1][1] == len(filepaths)
+    for filepath in filepaths:
+        dst = os.path.join(dst_dir, os.path.basename(filepath))
+        assert _read(dst) == _read(filepath), "Content does not match"
+
+
+def test_concurrent_transfer_rollback(tmp_path):
+    src_dir = str(tmp_path / "src")
+    dst_dir = str(tmp_path / "dst")
+    filepaths = _create_sequence(src_dir)
+    os.makedirs(dst_dir)
+    existing = os.path.join(dst_dir, os.path.basename(filepaths[0]))
+    with open(existing, "wb") as stream:
+        stream.write(b"original")
+
+    transaction = FileTransaction(max_workers=4, batch_size=2)
+    for filepath in filepaths:
+        dst = os.path.join(dst_dir, os.path.basename(filepath))
+        transaction.add(filepath, dst)
+    transaction.process()
+
+    assert transaction.backups == [existing + ".bak"]
+    transaction.rollback()
+
+    assert os.listdir(dst_dir) == [os.path.basename(existing)]
+    assert _read(existing) == b"original"
+
+
+def test_dedup_skip_identical(tmp_path):
+    src_dir = str(tmp_path / "src")
+    dst_dir = str(tmp_path / "dst")
+    filepaths = _create_sequence(src_dir, 5)
+
+    for _ in range(2):
+        transaction = FileTransaction(dedup=True, compare_hash=True)
+        for filepath in filepaths:
+            dst = os.path.join(dst_dir, os.path.basename(filepath))
+            transaction.add(filepath, dst)
+        transaction.process()
+        transaction.finalize()
+
+    # Second transaction should not transfer anything
+    assert transaction.transferred == []
+    assert transaction.backups == []
+    assert len(transaction.skipped) == len(filepaths)
+    assert transaction.bytes_saved == sum(
+        os.path.getsize(filepath) for filepath in filepaths
+    )
+
+
+def test_dedup_hardlink_candidates(tmp_path):
+    src_dir = str(tmp_path / "src")
+    filepaths = _create_sequence(src_dir, 3)
+    v001_dir = str(tmp_path / "v001")
+    v002_dir = str(tmp_path / "v002")
+
+    transaction = FileTransaction(dedup=True)
+    for filepath in filepaths:
+        dst = os.path.join(v001_dir, os.path.basename(filepath))
+        transaction.add(filepath, dst)
+    transaction.process()
+    transaction.finalize()
+
+    transaction = FileTransaction(dedup=True)
+    transaction.add_dedup_candidates(
+        os.path.join(v001_dir, filename) for filename in os.listdir(v001_dir)
+    )
+    for filepath in filepaths:
+        dst = os.path.join(v002_dir, os.path.basename(filepath))
+        transaction.add(filepath, dst)
+    transaction.process()
+    transaction.finalize()
+
+    assert len(transaction.transferred) == len(filepaths)
+    for filepath in filepaths:
+        filename = os.path.basename(filepath)
+        v001_stat = os.stat(os.path.join(v001_dir, filename))
+        v002_stat = os.stat(os.path.join(v002_dir, filename))
+        assert v001_stat.st_ino == v002_stat.st_ino, "File is not hardlink"
+
+
+def test_dedup_hardlink_requires_same_content(tmp_path):
+    """Frames with same size and modification time are not hardlinked."""
+    src_dir = str(tmp_path / "src")
+    v001_dir = str(tmp_path / "v001")
+    v002_dir = str(tmp_path / "v002")
+    os.makedirs(src_dir)
+    filepaths = []
+    for frame in range(3):
+        filepath = os.path.join(src_dir, "render.{:04d}.exr".format(frame))
+        with open(filepath, "wb") as stream:
+            stream.write(bytes([frame]) * 1024)
+        os.utime(filepath, (1000000000, 1000000000))
+        filepaths.append(filepath)
+
+    for dirpath in (v001_dir, v002_dir):
+        transaction = FileTransaction(dedup=True)
+        if dirpath == v002_dir:
+            transaction.add_dedup_candidates(
+                os.path.join(v001_dir, filename)
+                for filename in os.listdir(v001_dir)
+            )
+        for filepath in filepaths:
+            dst = os.path.join(dirpath, os.path.basename(filepath))
+            transaction.add(filepath, dst)
+        transaction.process()
+        transaction.finalize()
+
+    for filepath in filepaths:
+        filename = os.path.basename(filepath)
+        v001_path = os.path.join(v001_dir, filename)
+        v002_path = os.path.join(v002_dir, filename)
+        assert _read(v002_path) == _read(filepath)
+        assert os.stat(v001_path).st_ino == os.stat(v002_path).st_ino
+
+
+def test_transfer_without_futures(tmp_path, monkeypatch):
+    # Python 2 hosts don't have 'concurrent.futures'
+    monkeypatch.setattr(file_transaction, "ThreadPoolExecutor", None)
+    src_dir = str(tmp_path / "src")
+    dst_dir = str(tmp_path / "dst")
+    filepaths = _create_sequence(src_dir, count=5)
+
+    transaction = FileTransaction(max_workers=4)
+    for filepath in filepaths:
+        dst = os.path.join(dst_dir, os.path.basename(filepath))
+        transaction.add(filepath, dst)
+    transaction.process()
+    transaction.finalize()
+
+    assert len(transaction.transferred) == len(filepaths)
+    for filepath in filepaths:
+        dst = os.path.join(dst_dir, os.path.basename(filepath))
+        assert _read(dst) == _read(filepath), "Content does not match"
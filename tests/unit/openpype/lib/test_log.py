@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Test suite for queued logging to mongo."""
+import logging
+
+from openpype.lib.log import Logger, MongoQueueHandler
+
+
+class FakeCollection:
+    def __init__(self):
+        self.calls = []
+
+    def insert_many(self, documents, ordered=True):
+        self.calls.append(list(documents))
+
+
+def _create_logger(handler):
+    logger = logging.getLogger("test_mongo_queue_handler")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.handlers = [handler]
+    return logger
+
+
+def test_mongo_queue_handler_batches(monkeypatch):
+    monkeypatch.setattr(Logger, "process_data", {})
+    collection = FakeCollection()
+    handler = MongoQueueHandler(collection)
+    handler.batch_size = 4
+    logger = _create_logger(handler)
+
+    for idx in range(10):
+        logger.info("Copying file %s", idx)
+
+    handler.close()
+    messages = [
+        document["message"]
+        for documents in collection.calls
+        for document in documents
+    ]
+    assert messages == ["Copying file {}".format(idx) for idx in range(10)]
+    assert all(len(documents) <= 4 for documents in collection.calls)
+    assert handler.inserted_count == 10
+
+
+def test_mongo_queue_handler_drops(monkeypatch):
+    monkeypatch.setattr(Logger, "process_data", {})
+    collection = FakeCollection()
+    handler = MongoQueueHandler(collection)
+    handler.max_queue_size = 3
+    handler.flush_interval = 60
+    logger = _create_logger(handler)
+
+    for idx in range(5):
+        logger.info("Message %s", idx)
+
+    handler.close()
+    assert handler.dropped_count == 2
+    messages = [document["message"] for document in collection.calls[0]]
+    assert messages[:3] == ["Message 0", "Message 1", "Message 2"]
+    assert "Dropped 2 log records" in messages[-1]
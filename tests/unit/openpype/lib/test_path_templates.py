@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Test suite for path templates formatting."""
+import json
+
+import pytest
+
+from openpype.lib.path_templates import (
+    StringTemplate,
+    TemplatesDict,
+    TemplateUnsolved,
+)
+
+
+def test_parsed_template_is_shared():
+    template = "{root}/{project[name]}<_{variant}>/v{version:0>3}"
+    first = StringTemplate(template)
+    second = StringTemplate(template)
+
+    assert first._parts is second._parts
+    assert second.format({
+        "root": "/mnt",
+        "project": {"name": "demo"},
+        "version": 1
+    }) == "/mnt/demo/v001"
+
+
+def test_format_frames():
+    template = StringTemplate("{folder}/render.{frame:0>4}.{ext}")
+    data = {"folder": "/tmp", "ext": "exr"}
+
+    results = template.format_frames(data, range(1001, 1004))
+
+    assert results == [
+        "/tmp/render.1001.exr",
+        "/tmp/render.1002.exr",
+        "/tmp/render.1003.exr",
+    ]
+    assert "frame" not in data
+    assert results[0].used_values["frame"] == "1001"
+
+    with pytest.raises(TemplateUnsolved):
+        template.format_many([{"folder": "/tmp"}], strict=True)
+
+
+def test_format_result_access():
+    templates = TemplatesDict({
+        "work": {"folder": "{project}/work", "file": "{project}.ma"},
+        "publish": {"folder": "{project}/publish"},
+        "frame_padding": 4,
+    })
+
+    result = templates.format({"project": "demo"})
+
+    expected_work = {"folder": "demo/work", "file": "demo.ma"}
+    # All access paths of dictionary return solved values
+    assert result["work"] == expected_work
+    assert dict(result)["work"] == expected_work
+    assert {**result}["work"] == expected_work
+    assert result.copy()["publish"] == {"folder": "demo/publish"}
+    assert json.loads(json.dumps(result))["work"] == expected_work
+    assert result["work"].pop("file") == "demo.ma"
+    assert result["frame_padding"] == 4
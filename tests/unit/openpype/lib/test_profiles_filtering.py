@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""Test suite for profiles matcher.
+
+Benchmark comparing 'ProfilesMatcher' with 'filter_profiles' on studio like
+configuration of 200 profiles is not part of the tests. Run this file with
+python to see timings.
+"""
+import time
+import random
+
+from openpype.lib.profiles_filtering import (
+    filter_profiles,
+    ProfilesMatcher,
+)
+
+HOSTS = [
+    "maya", "nuke", "houdini", "blender", "hiero", "resolve",
+    "traypublisher", "aftereffects", "photoshop", "max",
+]
+FAMILIES = [
+    "render", "review", "model", "rig", "look", "animation", "camera",
+    "pointcache", "plate", "prerender", "workfile", "image", "layout",
+]
+TASK_TYPES = [
+    "Modeling", "Rigging", "Lookdev", "Animation", "Lighting",
+    "Compositing", "Layout", "FX", "Edit",
+]
+TASK_NAMES = [
+    "modeling", "rigging", "lookdev", "animation", "lighting",
+    "compositing", "layout", "fx", "edit", "comp_main", "light_key",
+]
+SUBSETS = [
+    "renderMain", "renderBeauty", "reviewMain", "modelMain", "rigMain",
+    "lookMain", "animationMain", "plateMain", "workfileMain",
+]
+
+
+def _create_profiles(count=200, seed=0):
+    rng = random.Random(seed)
+
+    def _sample(values, max_count):
+        return rng.sample(values, rng.randint(1, max_count))
+
+    profiles = []
+    for idx in range(count):
+        profile = {"name": "profile_{}".format(idx)}
+        if rng.random() < 0.8:
+            profile["hosts"] = _sample(HOSTS, 3)
+        if rng.random() < 0.9:
+            profile["families"] = _sample(FAMILIES, 4)
+        if rng.random() < 0.5:
+            profile["task_types"] = _sample(TASK_TYPES, 3)
+        if rng.random() < 0.3:
+            task_names = _sample(TASK_NAMES, 2)
+            # Some studios use regexes to match groups of tasks
+            if rng.random() < 0.5:
+                task_names.append(rng.choice(["comp.*", "light_.*", ".*fx"]))
+            profile["task_names"] = task_names
+        if rng.random() < 0.2:
+            profile["subsets"] = rng.choice([
+                ["*"], [rng.choice(SUBSETS)], ["render.*", "review.*"]
+            ])
+        profiles.append(profile)
+    return profiles
+
+
+def _create_queries(count=2000, seed=1):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        queries.append({
+            "hosts": rng.choice(HOSTS),
+            "families": rng.choice(FAMILIES),
+            "task_names": rng.choice(TASK_NAMES + [None]),
+            "task_types": rng.choice(TASK_TYPES + [None]),
+            "subsets": rng.choice(SUBSETS),
+        })
+    return queries
+
+
+def test_matcher_exclusion():
+    profiles = [
+        {"hosts": [], "families": ["render"], "value": 1},
+        {"hosts": ["nuke"], "families": [], "value": 2},
+        {"hosts": ["nuke"], "families": ["render", "review"], "value": 3},
+        {"hosts": ["nu.*"], "families": ["render"], "value": 4},
+        {"hosts": ["maya"], "families": ["*"], "value": 5},
+    ]
+    matcher = ProfilesMatcher(profiles)
+
+    assert matcher.match(
+        {"hosts": "nuke", "families": "render"}
+    )["value"] == 3
+    assert matcher.match(
+        {"hosts": "nuke", "families": "plate"}
+    )["value"] == 2
+    assert matcher.match(
+        {"hosts": "houdini", "families": "render"}
+    )["value"] == 1
+    assert matcher.match(
+        {"hosts": "maya", "families": "review"}
+    )["value"] == 5
+    assert matcher.match({"hosts": "houdini", "families": "plate"}) is None
+    # Keys order decides between profiles with same score
+    assert matcher.match(
+        {"hosts": "maya", "families": "render"},
+        keys_order=["families"]
+    )["value"] == 1
+
+
+def test_matcher_same_as_filter_profiles():
+    profiles = _create_profiles()
+    matcher = ProfilesMatcher(profiles)
+    for key_values in _create_queries(500):
+        expected = filter_profiles(profiles, key_values)
+        assert matcher.match(key_values) is expected
+
+
+def benchmark_matcher():
+    profiles = _create_profiles()
+    # Publishing repeats the same few contexts for every instance
+    #   and representation
+    queries = _create_queries(50) * 40
+
+    start = time.perf_counter()
+    for key_values in queries:
+        filter_profiles(profiles, key_values)
+    filter_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = ProfilesMatcher(profiles)
+    for key_values in queries:
+        matcher.match(key_values)
+    matcher_duration = time.perf_counter() - start
+
+    print((
+        "{} queries on {} profiles:"
+        " filter_profiles {:.3f}s | ProfilesMatcher {:.3f}s ({:.1f}x)"
+    ).format(
+        len(queries),
+        len(profiles),
+        filter_duration,
+        matcher_duration,
+        filter_duration / max(matcher_duration, 1e-9)
+    ))
+
+
+if __name__ == "__main__":
+    benchmark_matcher()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cached import of python files."""
+from openpype.lib.python_module_tools import (
+    clear_cached_modules,
+    import_filepath_cached,
+    modules_from_path,
+)
+
+
+def test_import_filepath_cached(tmp_path):
+    filepath = tmp_path / "plugin.py"
+    filepath.write_text("VALUE = 1\n")
+
+    module = import_filepath_cached(str(filepath))
+    assert module.VALUE == 1
+    assert import_filepath_cached(str(filepath)) is module
+
+    # Changed file is executed again
+    filepath.write_text("VALUE = 22\n")
+    changed_module = import_filepath_cached(str(filepath))
+    assert changed_module is not module
+    assert changed_module.VALUE == 22
+
+    clear_cached_modules(str(filepath))
+    assert import_filepath_cached(str(filepath)) is not changed_module
+
+
+def test_modules_from_path_cache(tmp_path):
+    (tmp_path / "first.py").write_text("VALUE = 1\n")
+    (tmp_path / "crashed.py").write_text("raise ValueError()\n")
+
+    modules, crashed = modules_from_path(str(tmp_path), use_cache=True)
+    cached_modules, cached_crashed = modules_from_path(
+        str(tmp_path), use_cache=True
+    )
+    assert len(crashed) == len(cached_crashed) == 1
+    assert modules[0][1] is cached_modules[0][1]
+
+    new_modules, _ = modules_from_path(str(tmp_path))
+    assert new_modules[0][1] is not modules[0][1]
+    clear_cached_modules()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Test suite for batched oiiotool conversions."""
+import os
+
+from openpype.lib import transcoding
+
+
+def _patch_oiio(monkeypatch, commands):
+    monkeypatch.setattr(
+        transcoding,
+        "get_oiio_tool_args",
+        lambda tool_name, *args: [tool_name] + list(args)
+    )
+    monkeypatch.setattr(
+        transcoding,
+        "get_oiio_info_for_input",
+        lambda *args, **kwargs: {
+            "channelnames": ["R", "G", "B"],
+            "attribs": {"compression": "dwaa"},
+        }
+    )
+    monkeypatch.setattr(
+        transcoding,
+        "run_subprocess",
+        lambda cmd, **kwargs: commands.append(cmd)
+    )
+
+
+def test_first_frame_path():
+    assert transcoding._get_oiio_first_frame_path(
+        os.path.join("renders", "beauty.1001-1100#.exr")
+    ) == os.path.join("renders", "beauty.1001.exr")
+    assert transcoding._get_oiio_first_frame_path(
+        "beauty.1-10@@@.exr"
+    ) == "beauty.001.exr"
+    assert transcoding._get_oiio_first_frame_path(
+        "beauty.1001.exr"
+    ) == "beauty.1001.exr"
+
+
+def test_convert_sequence_in_chunks(monkeypatch):
+    commands = []
+    _patch_oiio(monkeypatch, commands)
+
+    frames = [frame for frame in range(1001, 1046) if frame != 1010]
+    input_paths = [
+        os.path.join("src", "beauty.{}.exr".format(frame))
+        for frame in frames
+    ]
+    input_paths.append(os.path.join("src", "single.exr"))
+
+    transcoding.convert_input_paths_for_ffmpeg(
+        input_paths, "dst", max_workers=2
+    )
+
+    assert len(commands) == 3
+    framespecs = sorted(
+        cmd[cmd.index("--frames") + 1]
+        for cmd in commands
+        if "--frames" in cmd
+    )
+    assert framespecs == ["1001-1009,1011-1023", "1024-1045"]
+    for cmd in commands[:2]:
+        assert cmd[-1] == os.path.join("dst", "beauty.%d.exr")
+    assert commands[2][-1] == os.path.join("dst", "single.exr")
@@ -0,0 +1,82 @@
+"""Test file for Deadline webservice client against local http server."""
+import json
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from openpype.modules.deadline.deadline_client import DeadlineClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, data):
+        content = json.dumps(data).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append(("GET", self.path))
+        self._send(["none", "local"])
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length))
+        with self.server.lock:
+            self.server.requests.append(("POST", self.path))
+            job_id = "job_{}".format(payload["JobInfo"]["Name"])
+        self._send({"_id": job_id})
+
+
+@pytest.fixture
+def webservice():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.requests = []
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_pools_are_cached(webservice):
+    url = "http://127.0.0.1:{}".format(webservice.server_port)
+    client = DeadlineClient(url)
+
+    assert client.get_pools() == ["none", "local"]
+    assert client.get_pools() == ["none", "local"]
+    assert client.get_pools(use_cache=False) == ["none", "local"]
+    assert webservice.requests == [
+        ("GET", "/api/pools?NamesOnly=true"),
+        ("GET", "/api/pools?NamesOnly=true"),
+    ]
+    client.close()
+
+
+def test_submit_jobs(webservice):
+    url = "http://127.0.0.1:{}/".format(webservice.server_port)
+    client = DeadlineClient(url)
+    payloads = [
+        {"JobInfo": {"Name": str(idx)}, "PluginInfo": {}, "AuxFiles": []}
+        for idx in range(12)
+    ]
+
+    responses = client.submit_jobs(payloads, max_workers=4)
+
+    assert [response.json()["_id"] for response in responses] == [
+        "job_{}".format(idx) for idx in range(12)
+    ]
+    assert webservice.requests.count(("POST", "/api/jobs")) == 12
+    client.close()
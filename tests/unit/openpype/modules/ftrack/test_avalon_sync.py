@@ -0,0 +1,173 @@
+"""Test file for incremental synchronization helpers of avalon sync."""
+import datetime
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("ftrack_api")
+# Ftrack lib imports event handlers from modules loaded by OpenPype
+pytest.importorskip("openpype_modules")
+
+from bson.objectid import ObjectId  # noqa: E402
+
+from openpype.modules.ftrack.lib import avalon_sync  # noqa: E402
+
+
+class FakeCollection(object):
+    """Collection recording write operations."""
+
+    def __init__(self, docs=None):
+        self.docs = docs or []
+        self.bulk_writes = []
+        self.find_filters = []
+
+    def bulk_write(self, operations):
+        self.bulk_writes.append(list(operations))
+
+    def find(self, filter, projection=None):
+        self.find_filters.append(filter)
+        return iter(self.docs)
+
+
+def _entity(parent_id, children=None):
+    return {"parent_id": parent_id, "children": children or []}
+
+
+def _update_event(entity_id, parent_id=None):
+    return {"data": {"entities": [
+        {"entityId": entity_id, "parentId": parent_id}
+    ]}}
+
+
+@pytest.fixture
+def factory():
+    factory = avalon_sync.SyncEntitiesFactory(mock.Mock(), mock.Mock())
+    factory.ft_project_id = "project"
+    factory.entities_dict = {
+        "project": {
+            "name": "Project",
+            "parent_id": None,
+            "children": ["sq01", "assets"]
+        },
+        "sq01": _entity("project", ["sh010", "sh020"]),
+        "sh010": _entity("sq01"),
+        "sh020": _entity("sq01"),
+        "assets": _entity("project", ["char"]),
+        "char": _entity("assets"),
+    }
+    factory.sync_scope = None
+    factory.session = mock.Mock()
+    factory.all_filtered_entities = {}
+    factory.avalon_project_id = ObjectId()
+    factory.dbcon = FakeCollection()
+    return factory
+
+
+def test_update_entities_in_batches(factory):
+    factory.write_batch_size = 2
+    factory.updates = {
+        str(ObjectId()): {"data": {"fps": idx}}
+        for idx in range(5)
+    }
+
+    factory.update_entities()
+
+    batch_sizes = [len(batch) for batch in factory.dbcon.bulk_writes]
+    assert batch_sizes == [2, 2, 1]
+
+
+@pytest.fixture
+def synced_factory(factory, monkeypatch):
+    """Factory with all entities except 'char' synchronized before."""
+    monkeypatch.setattr(
+        factory, "_get_last_sync",
+        lambda: datetime.datetime.utcnow() - datetime.timedelta(hours=1)
+    )
+    monkeypatch.setattr(
+        avalon_sync, "get_assets",
+        lambda project_name, fields=None: [
+            {"data": {"ftrackId": ftrack_id}}
+            for ftrack_id in ("sq01", "sh010", "sh020", "assets")
+        ]
+    )
+    return factory
+
+
+def test_sync_scope_changed_entities(synced_factory, monkeypatch):
+    events = FakeCollection([
+        # Change of task is change of its parent
+        _update_event("task", "sh020"),
+        _update_event("removed")
+    ])
+    monkeypatch.setattr(
+        synced_factory, "_get_events_collection", lambda: events
+    )
+
+    assert synced_factory.get_sync_scope() == {"project", "sh020", "char"}
+    assert events.find_filters[0]["topic"] == "ftrack.update"
+
+
+def test_sync_scope_contains_children(synced_factory, monkeypatch):
+    events = FakeCollection([_update_event("sq01")])
+    monkeypatch.setattr(
+        synced_factory, "_get_events_collection", lambda: events
+    )
+
+    assert synced_factory.get_sync_scope() == {
+        "project", "sq01", "sh010", "sh020", "char"
+    }
+
+
+def test_sync_scope_full(synced_factory, monkeypatch):
+    events = FakeCollection([_update_event("project")])
+    monkeypatch.setattr(
+        synced_factory, "_get_events_collection", lambda: events
+    )
+    assert synced_factory.get_sync_scope() is None
+
+    # Stored events older than last synchronization may be already removed
+    last_sync = (
+        datetime.datetime.utcnow()
+        - synced_factory.stored_events_max_age
+        - datetime.timedelta(hours=1)
+    )
+    monkeypatch.setattr(synced_factory, "_get_last_sync", lambda: last_sync)
+    events.docs = []
+    assert synced_factory.get_sync_scope() is None
+
+    monkeypatch.setattr(synced_factory, "_get_last_sync", lambda: None)
+    assert synced_factory.get_sync_scope() is None
+
+
+def test_query_scoped_attributes(factory, monkeypatch):
+    queried = []
+
+    def query_custom_attributes(session, conf_ids, entity_ids, only_set):
+        queried.append((set(conf_ids), set(entity_ids)))
+        return []
+
+    monkeypatch.setattr(
+        avalon_sync, "query_custom_attributes", query_custom_attributes
+    )
+    attribute_key_by_id = {"1": "fps", "2": "avalon_mongo_id"}
+    sync_ids = list(factory.entities_dict.keys())
+    factory.sync_scope = {"project", "sh020"}
+
+    factory._query_scoped_attributes(attribute_key_by_id, sync_ids)
+    assert queried == [
+        ({"2"}, set(sync_ids)),
+        ({"1"}, {"project", "sh020"}),
+    ]
+
+    # Hierarchical values are inherited from parents
+    del queried[:]
+    factory._query_scoped_attributes(attribute_key_by_id, sync_ids, True)
+    assert queried == [
+        ({"2"}, set(sync_ids)),
+        ({"1"}, {"project", "sq01", "sh020"}),
+    ]
+
+    del queried[:]
+    factory.sync_scope = None
+    factory._query_scoped_attributes(attribute_key_by_id, sync_ids)
+    assert queried == [({"1", "2"}, set(sync_ids))]
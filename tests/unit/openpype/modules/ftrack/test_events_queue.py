@@ -0,0 +1,153 @@
+"""Test file for batched processing of stored ftrack events."""
+import datetime
+
+import pytest
+
+from openpype.modules.ftrack.ftrack_server.events_queue import (
+    StoredEventsQueue
+)
+
+mongomock = pytest.importorskip("mongomock")
+
+
+class CountingCollection(object):
+    """Collection wrapper counting write operations."""
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.writes = []
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if name in ("update_one", "update_many", "delete_many"):
+            def wrapper(*args, **kwargs):
+                self.writes.append(name)
+                return attr(*args, **kwargs)
+            return wrapper
+        return attr
+
+
+@pytest.fixture
+def dbcon():
+    collection = mongomock.MongoClient()["openpype"]["ftrack_events"]
+    return CountingCollection(collection)
+
+
+def _store_event(dbcon, topic, entity_id, stored, changes=None, **kwargs):
+    event_doc = {
+        "topic": topic,
+        "source": {"user": {"id": "user"}},
+        "data": {
+            "entities": [{
+                "entityId": entity_id,
+                "action": "update",
+                "changes": changes or {"statusid": {"new": "done"}},
+            }]
+        },
+        "pype_data": {"stored": stored, "is_processed": False},
+    }
+    event_doc["pype_data"].update(kwargs)
+    return dbcon.insert_one(event_doc).inserted_id
+
+
+def test_mark_processed_in_batches(dbcon):
+    now = datetime.datetime.utcnow()
+    for idx in range(10):
+        _store_event(
+            dbcon, "ftrack.update", "entity_{}".format(idx),
+            now + datetime.timedelta(seconds=idx)
+        )
+    events_queue = StoredEventsQueue(dbcon)
+    events_queue.batch_size = 4
+    events_queue.flush_interval = 60
+
+    processed = []
+    while True:
+        event_docs = events_queue.load_events()
+        if not event_docs:
+            break
+        for event_doc in event_docs:
+            processed.append(event_doc["data"]["entities"][0]["entityId"])
+            events_queue.mark_processed(event_doc["_id"])
+
+    assert processed == ["entity_{}".format(idx) for idx in range(10)]
+    assert dbcon.count_documents({"pype_data.is_processed": False}) == 0
+    # Less writes than events
+    assert dbcon.writes.count("update_many") == 3
+    assert "update_one" not in dbcon.writes
+    # Old events are pruned only once in interval
+    assert dbcon.writes.count("delete_many") == 1
+    assert events_queue.processed_count == 10
+
+
+def test_coalesce_redundant_events(dbcon):
+    now = datetime.datetime.utcnow()
+    _store_event(dbcon, "ftrack.update", "shot", now)
+    _store_event(
+        dbcon, "ftrack.update", "shot", now + datetime.timedelta(seconds=1)
+    )
+    # Different changes of the same entity are not redundant
+    _store_event(
+        dbcon, "ftrack.update", "shot", now + datetime.timedelta(seconds=2),
+        changes={"statusid": {"new": "wip"}}
+    )
+    # Out of coalesce window
+    _store_event(
+        dbcon, "ftrack.update", "shot", now + datetime.timedelta(seconds=60)
+    )
+    # Actions are never coalesced
+    _store_event(dbcon, "ftrack.action.launch", "asset", now)
+    _store_event(dbcon, "ftrack.action.launch", "asset", now)
+
+    events_queue = StoredEventsQueue(dbcon)
+    event_docs = events_queue.load_events()
+
+    assert len(event_docs) == 5
+    assert events_queue.coalesced_count == 1
+
+    for event_doc in event_docs:
+        events_queue.mark_processed(event_doc["_id"])
+    events_queue.flush()
+    assert dbcon.count_documents({"pype_data.is_processed": False}) == 0
+
+
+def test_coalesce_only_consecutive_duplicates(dbcon):
+    now = datetime.datetime.utcnow()
+    changes = [
+        {"statusid": {"old": "a", "new": "b"}},
+        {"statusid": {"old": "b", "new": "a"}},
+        {"statusid": {"old": "a", "new": "b"}},
+    ]
+    for idx, entity_changes in enumerate(changes):
+        _store_event(
+            dbcon, "ftrack.update", "shot",
+            now + datetime.timedelta(seconds=idx),
+            changes=entity_changes
+        )
+
+    events_queue = StoredEventsQueue(dbcon)
+    event_docs = events_queue.load_events()
+
+    assert [
+        event_doc["data"]["entities"][0]["changes"]
+        for event_doc in event_docs
+    ] == changes
+    assert events_queue.coalesced_count == 0
+
+
+def test_prune_and_queue_lag(dbcon):
+    now = datetime.datetime.utcnow()
+    _store_event(
+        dbcon, "ftrack.update", "old", now - datetime.timedelta(days=5),
+        is_processed=True
+    )
+    _store_event(
+        dbcon, "ftrack.update", "late", now - datetime.timedelta(minutes=2)
+    )
+
+    events_queue = StoredEventsQueue(dbcon)
+    event_docs = events_queue.load_events()
+
+    assert len(event_docs) == 1
+    assert dbcon.count_documents({}) == 1
+    assert events_queue.queue_lag >= 120
@@ -0,0 +1,96 @@
+"""Test file for job queue scheduling and persistence."""
+import datetime
+
+from openpype.modules.job_queue.job_server.jobs import JobQueue
+from openpype.modules.job_queue.job_server.storage import JobsStorage
+
+
+class FakeWorker:
+    def __init__(self, worker_id, host_name):
+        self.id = worker_id
+        self.host_name = host_name
+        self.current_job = None
+
+    def is_idle(self):
+        return self.current_job is None
+
+    def job_assigned(self):
+        return self.current_job is not None
+
+    def set_current_job(self, job):
+        if job is self.current_job:
+            return
+        self.current_job = job
+        if job is not None:
+            job.set_worker(self)
+
+
+def test_priority_and_host_limit():
+    job_queue = JobQueue(host_limits={"tvpaint": 1})
+    low = job_queue.create_job("tvpaint", {}, priority=10)
+    high = job_queue.create_job("tvpaint", {}, priority=90)
+    normal = job_queue.create_job("tvpaint", {})
+    workers = [FakeWorker(idx, "tvpaint") for idx in range(2)]
+    for worker in workers:
+        job_queue.add_worker(worker)
+
+    job_queue.assign_jobs()
+
+    assert workers[0].current_job is high
+    assert workers[1].current_job is None
+
+    job_queue.set_job_done(high.id)
+    job_queue.assign_jobs()
+    assert normal in [worker.current_job for worker in workers]
+    assert job_queue.get_metrics()["hosts"]["tvpaint"]["queued"] == 1
+    assert not low.done
+
+
+def test_wait_for_worker_timeout():
+    job_queue = JobQueue()
+    job = job_queue.create_job("tvpaint", {})
+
+    job_queue.assign_jobs()
+    assert not job.done
+
+    job._queued_time -= datetime.timedelta(
+        seconds=job_queue.worker_wait_timeout + 1
+    )
+    job_queue.assign_jobs()
+    assert job.status()["state"] == "error"
+
+
+def test_jobs_are_restored(tmp_path):
+    database_path = str(tmp_path / "jobs.db")
+    job_queue = JobQueue(JobsStorage(database_path))
+    done_job = job_queue.create_job("tvpaint", {"value": 1})
+    started_job = job_queue.create_job("tvpaint", {"value": 2}, priority=60)
+    job_queue.set_job_done(done_job.id, data={"result": True})
+    job_queue.set_job_started(started_job)
+
+    restored_queue = JobQueue(JobsStorage(database_path))
+    worker = FakeWorker("worker", "tvpaint")
+    restored_queue.add_worker(worker)
+    restored_queue.assign_jobs()
+
+    assert restored_queue.get_job_status(done_job.id)["result"] == {
+        "result": True
+    }
+    assert worker.current_job.id == started_job.id
+    assert worker.current_job.data == {"value": 2}
+    assert worker.current_job.priority == 60
+
+
+def test_restored_jobs_wait_for_worker(tmp_path):
+    database_path = str(tmp_path / "jobs.db")
+    job_queue = JobQueue(JobsStorage(database_path))
+    job = job_queue.create_job("tvpaint", {})
+    job._created_time -= datetime.timedelta(
+        seconds=job_queue.worker_wait_timeout + 1
+    )
+    job_queue._store_job(job)
+
+    restored_queue = JobQueue(JobsStorage(database_path))
+    restored_queue.assign_jobs()
+
+    assert restored_queue.get_job_status(job.id)["state"] == "waiting"
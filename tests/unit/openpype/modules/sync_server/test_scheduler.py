@@ -0,0 +1,80 @@
+"""Test file for Sync Server scheduler, tests order and limits of jobs."""
+import asyncio
+
+from openpype.modules.sync_server.scheduler import SyncJob, SyncScheduler
+
+
+class FakeModule:
+    def __init__(self):
+        self.updates = []
+
+    def update_db_many(self, project_name, items):
+        self.updates.append((project_name, items))
+
+
+def _run_jobs(scheduler, jobs):
+    async def run():
+        task = asyncio.ensure_future(scheduler.run())
+        for job in jobs:
+            scheduler.add_job(job)
+        while scheduler.queued_count or scheduler.running_count:
+            await asyncio.sleep(0.01)
+        scheduler.stop()
+        await task
+
+    asyncio.run(run())
+
+
+def _create_job(processed, project_name, idx, priority, provider="gdrive"):
+    async def func():
+        processed.append((project_name, idx))
+        await asyncio.sleep(0.01)
+        if idx < 0:
+            raise ValueError("Failed")
+        return "file_id_{}".format(idx)
+
+    return SyncJob(
+        project_name,
+        provider,
+        priority,
+        func,
+        {"_id": idx, "path": "{}/{}".format(project_name, idx)},
+        {"_id": project_name},
+        "studio"
+    )
+
+
+def test_priority_and_project_interleave():
+    processed = []
+    module = FakeModule()
+    scheduler = SyncScheduler(module, 1, flush_interval=0.05)
+    jobs = [_create_job(processed, "A", idx, idx) for idx in range(3)]
+    jobs.extend(_create_job(processed, "B", idx, 0) for idx in range(3))
+    _run_jobs(scheduler, jobs)
+
+    assert processed == [
+        ("A", 2), ("B", 0), ("A", 1), ("B", 1), ("A", 0), ("B", 2)
+    ]
+    updated = [
+        item[1]["_id"]
+        for _, items in module.updates
+        for item in items
+    ]
+    assert len(updated) == len(jobs), "Not all results were written"
+
+
+def test_duplicated_job_and_error():
+    processed = []
+    module = FakeModule()
+    scheduler = SyncScheduler(module, 3, {"gdrive": 1}, flush_interval=0.05)
+    _run_jobs(scheduler, [
+        _create_job(processed, "A", -1, 0),
+        _create_job(processed, "A", -1, 0),
+    ])
+
+    assert processed == [("A", -1)]
+    items = [item for _, items in module.updates for item in items]
+    assert len(items) == 1
+    new_file_id, _, _, _, error = items[0]
+    assert new_file_id is None
+    assert error == "Failed"
@@ -0,0 +1,122 @@
+"""Test file for incremental query of representations to synchronize."""
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.modules.sync_server.sync_server_module import SyncServerModule
+
+mongomock = pytest.importorskip("mongomock")
+
+PROJECT_NAME = "test_project"
+
+
+class FakeConnection(object):
+    """Connection to project collection which runs only '$match' stage.
+
+    Aggregation stages after '$match' only group files of representation
+    and sort them by priority, which is not tested here.
+    """
+
+    def __init__(self, collection):
+        self.Session = {}
+        self._collection = collection
+
+    def aggregate(self, pipeline):
+        match = pipeline[0]["$match"]
+        return list(self._collection.find(match).sort("_id", 1))
+
+
+@pytest.fixture
+def collection():
+    return mongomock.MongoClient()["avalon"][PROJECT_NAME]
+
+
+@pytest.fixture
+def sync_server(collection, monkeypatch):
+    sync_server = SyncServerModule.__new__(SyncServerModule)
+    sync_server.log = logging.getLogger("test_sync_representations")
+    sync_server._connection = FakeConnection(collection)
+    sync_server._sync_repres_state = {}
+    monkeypatch.setattr(
+        sync_server, "_get_retries_arr", lambda project_name: [0, 1, None]
+    )
+    monkeypatch.setattr(
+        sync_server, "get_full_scan_interval", lambda project_name: 600
+    )
+    return sync_server
+
+
+def _insert_repre(collection, synced=False, created=None, modified=None):
+    remote_site = {"name": "remote"}
+    if synced:
+        remote_site["created_dt"] = datetime.utcnow()
+    repre_doc = {
+        "type": "representation",
+        "files": [{
+            "path": "{root[work]}/file.exr",
+            "sites": [
+                {"name": "studio", "created_dt": datetime.utcnow()},
+                remote_site,
+            ]
+        }]
+    }
+    if created is not None:
+        repre_doc["_id"] = ObjectId.from_datetime(created)
+    if modified is not None:
+        repre_doc["sync_modified_dt"] = modified
+    return collection.insert_one(repre_doc).inserted_id
+
+
+def _get_ids(sync_server):
+    return [
+        repre["_id"]
+        for repre in sync_server.get_sync_representations(
+            PROJECT_NAME, "studio", "remote", incremental=True
+        )
+    ]
+
+
+def _get_state(sync_server):
+    return sync_server._sync_repres_state[(PROJECT_NAME, "studio", "remote")]
+
+
+def test_incremental_query(sync_server, collection):
+    day_ago = datetime.utcnow() - timedelta(days=1)
+    pending_id = _insert_repre(collection, created=day_ago)
+    _insert_repre(collection, synced=True)
+
+    # First query is full scan
+    assert _get_ids(sync_server) == [pending_id]
+
+    # Old representation which was not modified is not found
+    old_id = _insert_repre(
+        collection, created=day_ago + timedelta(seconds=1)
+    )
+    new_id = _insert_repre(collection)
+    modified_id = _insert_repre(
+        collection,
+        created=day_ago + timedelta(seconds=2),
+        modified=datetime.utcnow()
+    )
+
+    # Not synchronized representation from last query is carried over
+    assert sorted(_get_ids(sync_server)) == sorted(
+        [pending_id, new_id, modified_id]
+    )
+
+    # Watermark moved so only pending representations are queried
+    collection.delete_one({"_id": pending_id})
+    state = _get_state(sync_server)
+    state["watermark"] += timedelta(
+        seconds=SyncServerModule.SYNC_MODIFIED_MARGIN_SEC + 1
+    )
+    assert sorted(_get_ids(sync_server)) == sorted([new_id, modified_id])
+
+    # Full scan after interval finds all representations
+    state = _get_state(sync_server)
+    state["full_scan_time"] -= 600
+    assert sorted(_get_ids(sync_server)) == sorted(
+        [old_id, new_id, modified_id]
+    )
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Test suite for lazy and parallel addons loading."""
+import sys
+import time
+import threading
+
+from openpype.modules import base
+
+
+class _Addon(object):
+    name = "addon"
+
+    def __init__(self, manager, settings):
+        time.sleep(0.05)
+        self.thread = threading.current_thread()
+        self.settings = settings
+
+
+class _BrokenAddon(object):
+    def __init__(self, manager, settings):
+        raise RuntimeError("Broken addon")
+
+
+def test_lazy_module(tmp_path, monkeypatch):
+    package_dir = tmp_path / "lazy_addon_pkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text(
+        "import sys\n"
+        "sys.modules['lazy_addon_executed'] = sys\n"
+        "VALUE = 1\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    module = base._import_lazy_module("lazy_addon_pkg")
+    try:
+        assert base._is_lazy_module(module)
+        assert "lazy_addon_executed" not in sys.modules
+
+        assert module.VALUE == 1
+        assert not base._is_lazy_module(module)
+        assert "lazy_addon_executed" in sys.modules
+    finally:
+        sys.modules.pop("lazy_addon_pkg", None)
+        sys.modules.pop("lazy_addon_executed", None)
+
+
+def test_initialize_addons_in_threads():
+    manager = base.ModulesManager.__new__(base.ModulesManager)
+    manager.initialize_max_workers = 4
+
+    items = [(_Addon, idx) for idx in range(8)]
+    items.insert(3, (_BrokenAddon, None))
+
+    start = time.time()
+    results = manager._initialize_addons(items)
+    duration = time.time() - start
+
+    assert len(results) == len(items)
+    broken, _, exc_info = results.pop(3)
+    assert broken is None
+    assert exc_info[0] is RuntimeError
+    assert [addon.settings for addon, _, _ in results] == list(range(8))
+    assert len({addon.thread for addon, _, _ in results}) > 1
+    assert all(duration >= 0.05 for _, duration, _ in results)
+    # Sequential initialization would take at least 0.4s
+    assert duration < 0.35
+
+
+def test_initialize_addons_without_futures(monkeypatch):
+    # Python 2 hosts don't have 'concurrent.futures'
+    monkeypatch.setattr(base, "ThreadPoolExecutor", None)
+    manager = base.ModulesManager.__new__(base.ModulesManager)
+    manager.initialize_max_workers = 4
+
+    results = manager._initialize_addons(
+        [(_Addon, idx) for idx in range(3)]
+    )
+
+    assert [addon.settings for addon, _, _ in results] == list(range(3))
+    assert {addon.thread for addon, _, _ in results} == {
+        threading.current_thread()
+    }
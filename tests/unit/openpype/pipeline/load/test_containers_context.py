@@ -0,0 +1,98 @@
+"""Test file for batched resolving of containers context."""
+import collections
+
+from openpype.pipeline.load import utils as load_utils
+
+
+def _patch_client(monkeypatch, calls):
+    docs = {
+        "representation": [
+            {"_id": "repre_old", "parent": "version_1"},
+            {"_id": "repre_new", "parent": "version_2"},
+            {"_id": "repre_hero", "parent": "hero"},
+        ],
+        "version": [
+            {"_id": "version_1", "parent": "subset", "type": "version"},
+            {"_id": "version_2", "parent": "subset", "type": "version"},
+            {
+                "_id": "hero",
+                "parent": "subset",
+                "type": "hero_version",
+                "version_id": "version_2"
+            },
+        ],
+        "subset": [{"_id": "subset", "parent": "asset"}],
+        "asset": [{"_id": "asset"}],
+    }
+
+    def create_query(entity_type, ids_key):
+        def query(project_name, **kwargs):
+            calls[entity_type] += 1
+            ids = set(kwargs[ids_key])
+            return [doc for doc in docs[entity_type] if doc["_id"] in ids]
+        return query
+
+    def get_last_versions(project_name, subset_ids, **kwargs):
+        calls["last_version"] += 1
+        return {"subset": {"_id": "version_2", "parent": "subset"}}
+
+    monkeypatch.setattr(
+        load_utils, "get_representations",
+        create_query("representation", "representation_ids")
+    )
+    monkeypatch.setattr(
+        load_utils, "get_versions", create_query("version", "version_ids")
+    )
+    monkeypatch.setattr(
+        load_utils, "get_subsets", create_query("subset", "subset_ids")
+    )
+    monkeypatch.setattr(
+        load_utils, "get_assets", create_query("asset", "asset_ids")
+    )
+    monkeypatch.setattr(load_utils, "get_last_versions", get_last_versions)
+
+
+def test_filter_containers(monkeypatch):
+    calls = collections.Counter()
+    _patch_client(monkeypatch, calls)
+    containers = [
+        {"objectName": "old_{}".format(idx), "representation": "repre_old"}
+        for idx in range(100)
+    ]
+    containers.extend([
+        {"objectName": "new", "representation": "repre_new"},
+        {"objectName": "hero", "representation": "repre_hero"},
+        {"objectName": "missing", "representation": "repre_missing"},
+        {"objectName": "invalid", "representation": None},
+    ])
+
+    result = load_utils.filter_containers(containers, "demo")
+
+    assert len(result.outdated) == 100
+    assert [c["objectName"] for c in result.latest] == ["new", "hero"]
+    assert [c["objectName"] for c in result.not_found] == ["missing"]
+    assert [c["objectName"] for c in result.invalid] == ["invalid"]
+    # Source version of hero version was already queried
+    assert calls == {
+        "representation": 1,
+        "version": 1,
+        "subset": 1,
+        "asset": 1,
+        "last_version": 1,
+    }
+
+
+def test_resolver_cache(monkeypatch):
+    calls = collections.Counter()
+    _patch_client(monkeypatch, calls)
+    resolver = load_utils.RepresentationContextResolver("demo")
+
+    contexts = resolver.resolve(["repre_hero"])
+    assert contexts["repre_hero"]["hero_source_version"]["_id"] == "version_2"
+    assert contexts["repre_hero"]["asset"]["_id"] == "asset"
+
+    contexts = resolver.resolve(["repre_hero", "repre_old"])
+    assert contexts["repre_old"]["last_version"]["_id"] == "version_2"
+    assert calls["representation"] == 2
+    assert calls["subset"] == 1
+    assert calls["asset"] == 1
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Test suite for lookup of roots in paths."""
+import pytest
+
+from openpype.pipeline.anatomy import Roots, RootItem
+
+ROOTS_DATA = {
+    "work": {
+        "windows": "P:/projects/work",
+        "linux": "/mnt/share/projects/work",
+        "darwin": "/Volumes/projects/work",
+    },
+    "publish": {
+        "windows": "P:\\projects\\",
+        "linux": "/mnt/share/projects",
+        "darwin": "",
+    },
+}
+
+
+class _FakeAnatomy(object):
+    project_name = "demo"
+
+    def __getitem__(self, key):
+        return {"roots": ROOTS_DATA}[key]
+
+
+def _linear_find(roots, path):
+    for root_item in roots.values():
+        success, result = root_item.find_root_template_from_path(path)
+        if success:
+            return success, result
+    return False, path
+
+
+@pytest.mark.parametrize("path", [
+    "P:/projects/work/demo/sh010/file.exr",
+    "p:\\Projects\\Work\\demo\\sh010\\file.exr",
+    "P:/projects/publish/demo/v001/file.exr",
+    "/mnt/share/projects/work/demo/file.exr",
+    "/mnt/share/projects/publish/demo/file.exr",
+    "/mnt/share/Projects/work/demo/file.exr",
+    "/Volumes/projects/work/file.exr",
+    "/Volumes/projects/other/file.exr",
+    "/mnt/share/projects",
+    "/mnt",
+    "",
+])
+def test_find_root_template_same_as_root_items(path):
+    roots = Roots(_FakeAnatomy())
+
+    expected = _linear_find(roots.roots, path)
+    assert roots.find_root_template_from_path(path) == expected
+    assert roots.find_root_templates_from_paths([path]) == [expected]
+
+
+def test_find_root_templates_from_paths():
+    roots = Roots(_FakeAnatomy())
+    paths = [
+        "P:/projects/work/demo/file.{:04d}.exr".format(frame)
+        for frame in range(1001, 1101)
+    ]
+    paths.append("/tmp/file.exr")
+
+    results = roots.find_root_templates_from_paths(paths)
+
+    assert len(results) == len(paths)
+    assert results[0] == (True, "{root[work]}/demo/file.1001.exr")
+    assert results[-1] == (False, "/tmp/file.exr")
+
+
+def test_single_root():
+    root_item = RootItem({"windows": "C:/projects", "linux": "/projects"})
+    roots = Roots(_FakeAnatomy())
+    roots._roots = root_item
+    roots.loaded_project = "demo"
+
+    assert roots.find_root_templates_from_paths(["/projects/a.exr"]) == [
+        (True, "{root}/a.exr")
+    ]
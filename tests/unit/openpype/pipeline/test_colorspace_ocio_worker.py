@@ -0,0 +1,171 @@
+"""Test OCIO worker process protocol and cache of its results.
+
+Worker process is replaced with stand-in 'serve' script which answers
+requests the same way as 'ocio_wrapper.py serve' without PyOpenColorIO.
+"""
+import os
+import sys
+import textwrap
+
+import pytest
+
+from openpype.pipeline import colorspace
+
+
+SERVE_SCRIPT = textwrap.dedent("""
+    import os
+    import sys
+    import json
+
+    PREFIX = {prefix!r}
+
+    # Output of process bootstrap must be ignored by client
+    sys.stdout.write("Bootstrap output\\n")
+    sys.stdout.flush()
+    for line in sys.stdin:
+        request = json.loads(line)
+        method = request["method"]
+        params = request["params"]
+        if method == "test.exit":
+            sys.exit(1)
+
+        response = {{"id": request["id"]}}
+        if method == "test.pid":
+            response["result"] = os.getpid()
+        elif method == "test.echo":
+            response["result"] = params
+        else:
+            response["error"] = "Unknown method {{}}".format(method)
+        sys.stdout.write(PREFIX + json.dumps(response) + "\\n")
+        sys.stdout.flush()
+""")
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    script_path = tmp_path / "serve.py"
+    script_path.write_text(SERVE_SCRIPT.format(
+        prefix=colorspace._OCIOWorker.response_prefix
+    ))
+    monkeypatch.setattr(
+        colorspace, "get_openpype_execute_args",
+        lambda *args: [sys.executable, str(script_path)]
+    )
+    monkeypatch.setattr(
+        colorspace, "clean_envs_for_openpype_process", dict
+    )
+    monkeypatch.setattr(colorspace, "is_running_from_build", lambda: False)
+
+    worker = colorspace._OCIOWorker()
+    yield worker
+    worker.stop()
+
+
+@pytest.fixture
+def results_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "temp"
+    cache_dir.mkdir()
+    monkeypatch.setattr(
+        colorspace.tempfile, "gettempdir", lambda: str(cache_dir)
+    )
+    monkeypatch.setattr(colorspace._OCIOResultsCache, "_data_by_key", {})
+    return colorspace._OCIOResultsCache
+
+
+def test_worker_requests(worker):
+    params = {"config_path": "/configs/config.ocio", "values": [1, 2]}
+    assert worker.request("test.echo", **params) == params
+
+    pid = worker.request("test.pid")
+    # Same process answers following requests
+    assert worker.request("test.pid") == pid
+
+    with pytest.raises(RuntimeError, match="Unknown method"):
+        worker.request("test.unknown")
+    assert worker.is_running()
+
+
+def test_worker_restart(worker):
+    pid = worker.request("test.pid")
+
+    with pytest.raises(colorspace.OCIOWorkerError):
+        worker.request("test.exit")
+    assert not worker.is_running()
+
+    # Worker is started again on next request
+    assert worker.request("test.pid") != pid
+
+
+def test_worker_not_available(worker, monkeypatch):
+    monkeypatch.setattr(
+        colorspace, "get_openpype_execute_args",
+        lambda *args: [os.path.join("not", "existing", "executable")]
+    )
+    with pytest.raises(colorspace.OCIOWorkerError):
+        worker.request("test.pid")
+
+
+def test_results_cache(tmp_path, results_cache):
+    config_path = tmp_path / "config.ocio"
+    config_path.write_text("ocio_profile_version: 2\n")
+    config_path = str(config_path)
+
+    results_cache.set(config_path, {"key": ["sRGB"]})
+    assert results_cache.get(config_path, ["key", "missing"]) == {
+        "key": ["sRGB"]
+    }
+
+    # Results are stored on disk
+    results_cache._data_by_key.clear()
+    assert results_cache.get(config_path, ["key"]) == {"key": ["sRGB"]}
+
+    # Config with different path does not share results
+    other_path = tmp_path / "other.ocio"
+    other_path.write_text("ocio_profile_version: 2\n")
+    assert results_cache.get(str(other_path), ["key"]) == {}
+
+    # Modified config invalidates results
+    stat = os.stat(config_path)
+    os.utime(config_path, (stat.st_atime, stat.st_mtime + 10))
+    assert results_cache.get(config_path, ["key"]) == {}
+
+    # Results are not cached for not existing config
+    missing_path = str(tmp_path / "missing.ocio")
+    results_cache.set(missing_path, {"key": ["sRGB"]})
+    assert results_cache.get(missing_path, ["key"]) == {}
+
+
+def test_batch_results_not_cached(tmp_path, results_cache, monkeypatch):
+    config_path = tmp_path / "config.ocio"
+    config_path.write_text("ocio_profile_version: 2\n")
+    config_path = str(config_path)
+
+    class Worker(object):
+        requests = []
+
+        def request(self, method, **params):
+            self.requests.append(method)
+            return ["sRGB" for _ in params["filepaths"]]
+
+    monkeypatch.setattr(
+        colorspace._OCIOWorker, "get_worker", classmethod(lambda cls: Worker())
+    )
+    monkeypatch.setattr(
+        results_cache, "set",
+        classmethod(lambda cls, *args: pytest.fail("Results were cached"))
+    )
+
+    filepaths = ["/render/shot.{:04}.exr".format(i) for i in range(3)]
+    for _ in range(2):
+        result = colorspace._get_wrapped_with_subprocess_batch(
+            "colorspace", "get_file_rule", "get_file_rules",
+            "filepath", filepaths, config_path=config_path
+        )
+        assert result == ["sRGB"] * 3
+
+    # All values are queried in single request each time
+    assert Worker.requests == ["colorspace.get_file_rules"] * 2
+    assert colorspace._get_wrapped_with_subprocess_batch(
+        "colorspace", "get_file_rule", "get_file_rules",
+        "filepath", [], config_path=config_path
+    ) == []
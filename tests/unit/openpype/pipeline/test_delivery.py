@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Test suite for concurrent and resumable delivery job."""
+import os
+import collections
+
+from openpype.pipeline import delivery
+from openpype.pipeline.delivery import DeliveryJob
+
+
+def _create_sources(tmpdir, count):
+    src_dir = tmpdir.mkdir("src")
+    paths = []
+    for idx in range(count):
+        path = str(src_dir.join("file_{}.txt".format(idx)))
+        with open(path, "w") as stream:
+            stream.write("content {}".format(idx) * (idx + 1))
+        paths.append(path)
+    return paths
+
+
+def _create_job(tmpdir, src_paths):
+    dst_dir = str(tmpdir.join("dst"))
+    manifest_path = os.path.join(dst_dir, DeliveryJob.manifest_filename)
+    job = DeliveryJob(manifest_path, max_workers=4)
+    for src_path in src_paths:
+        job.add_transfer(
+            src_path, os.path.join(dst_dir, "sub", os.path.basename(src_path))
+        )
+    return job, manifest_path
+
+
+def test_deliver_and_resume(tmpdir, monkeypatch):
+    src_paths = _create_sources(tmpdir, 10)
+    job, manifest_path = _create_job(tmpdir, src_paths)
+    reported = []
+
+    progress = job.process(progress_callback=lambda p: reported.append(
+        p.files_finished
+    ))
+
+    assert progress.files_done == 10
+    assert progress.ratio == 1.0
+    assert reported[-1] == 10
+    assert os.path.exists(manifest_path)
+    for src_path, dst_path in job.transfers:
+        with open(src_path) as src, open(dst_path) as dst:
+            assert src.read() == dst.read()
+
+    # Change one source, only that file is delivered again
+    changed_path = src_paths[3]
+    os.utime(changed_path, (1000, 1000))
+    transferred = []
+    orig_transfer_file = delivery._transfer_file
+
+    def transfer_file(src_path, dst_path):
+        transferred.append(src_path)
+        orig_transfer_file(src_path, dst_path)
+
+    monkeypatch.setattr(delivery, "_transfer_file", transfer_file)
+
+    job, _ = _create_job(tmpdir, src_paths)
+    progress = job.process()
+
+    assert transferred == [changed_path]
+    assert progress.files_skipped == 9
+    assert progress.files_done == 1
+
+
+def test_failed_files_are_reported(tmpdir, monkeypatch):
+    src_paths = _create_sources(tmpdir, 4)
+    failing_path = src_paths[1]
+    orig_transfer_file = delivery._transfer_file
+
+    def transfer_file(src_path, dst_path):
+        if src_path == failing_path:
+            raise OSError("Disk is full")
+        orig_transfer_file(src_path, dst_path)
+
+    monkeypatch.setattr(delivery, "_transfer_file", transfer_file)
+    job, _ = _create_job(tmpdir, src_paths + [str(tmpdir.join("missing"))])
+    report_items = collections.defaultdict(list)
+
+    progress = job.process(report_items)
+
+    assert progress.files_done == 3
+    assert progress.files_failed == 1
+    assert len(report_items["Failed to deliver files"]) == 1
+    assert len(report_items["Source file was not found"]) == 1
+
+    # Failed file is delivered on next run
+    monkeypatch.setattr(delivery, "_transfer_file", orig_transfer_file)
+    job, _ = _create_job(tmpdir, src_paths)
+    progress = job.process()
+
+    assert progress.files_done == 1
+    assert progress.files_skipped == 3
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""Test suite for discovery of plugins from registered paths."""
+from openpype.pipeline.plugin_discover import PluginDiscoverContext
+from openpype.lib.python_module_tools import clear_cached_modules
+
+
+class DiscoverBase(object):
+    enabled = True
+
+
+def _discover_twice(tmp_path, **kwargs):
+    (tmp_path / "plugin.py").write_text((
+        "from {} import DiscoverBase\n"
+        "class Plugin(DiscoverBase):\n"
+        "    pass\n"
+    ).format(__name__))
+
+    context = PluginDiscoverContext(**kwargs)
+    context.register_plugin_path(DiscoverBase, str(tmp_path))
+    plugin = context.discover(DiscoverBase)[0]
+    # Change class attribute the same way as 'apply_settings' does
+    plugin.enabled = False
+    return plugin, context.discover(DiscoverBase)[0]
+
+
+def test_discover_returns_new_classes(tmp_path):
+    plugin, rediscovered = _discover_twice(tmp_path)
+
+    assert rediscovered is not plugin
+    assert rediscovered.enabled is True
+
+
+def test_discover_with_cache(tmp_path):
+    plugin, rediscovered = _discover_twice(tmp_path, use_cache=True)
+    clear_cached_modules()
+
+    assert rediscovered is plugin
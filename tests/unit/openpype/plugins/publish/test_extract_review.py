@@ -1,3 +1,4 @@
+from openpype.plugins.publish import extract_review
 from openpype.plugins.publish.extract_review import ExtractReview
 
 
@@ -27,3 +28,43 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+def test_run_ffmpeg_jobs_share_input(monkeypatch):
+    """Outputs with same input are rendered by single ffmpeg command."""
+    class FakeInstance:
+        def __init__(self):
+            self.data = {}
+
+    commands = []
+    monkeypatch.setattr(
+        extract_review,
+        "run_subprocess",
+        lambda cmd, **kwargs: commands.append(cmd)
+    )
+
+    def create_job(output_name, input_args):
+        return {
+            "ffmpeg_args": ["ffmpeg"] + input_args + ["-y", output_name],
+            "input_args": input_args,
+            "output_name": output_name,
+            "output_ext": "mov",
+        }
+
+    plugin = ExtractReview()
+    plugin.ffmpeg_share_input = True
+    plugin.ffmpeg_max_workers = 2
+    instance = FakeInstance()
+    plugin._run_ffmpeg_jobs(instance, [
+        create_job("h264", ["-i", "input.mov"]),
+        create_job("prores", ["-i", "input.mov"]),
+        create_job("proxy", ["-ss", "1", "-i", "input.mov"]),
+    ])
+
+    assert sorted(commands) == [
+        "ffmpeg -i input.mov -y h264 -y prores",
+        "ffmpeg -ss 1 -i input.mov -y proxy",
+    ]
+    assert set(instance.data["reviewOutputTimings"]) == {
+        "h264_mov", "prores_mov", "proxy_mov"
+    }
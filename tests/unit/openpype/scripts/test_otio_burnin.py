@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Test suite for in-process rendering of burnins."""
+import os
+import sys
+import logging
+import subprocess
+
+import pytest
+
+from openpype.scripts import otio_burnin
+
+FFPROBE_DATA = {
+    "streams": [{
+        "codec_type": "video",
+        "codec_name": "h264",
+        "width": 1920,
+        "height": 1080,
+        "r_frame_rate": "25/1",
+        "start_time": "0",
+        "duration": "4",
+        "pix_fmt": "yuv420p",
+    }],
+    "format": {},
+}
+
+
+@pytest.fixture
+def rendered(monkeypatch):
+    rendered = {"probed": [], "commands": [], "loggers": []}
+
+    def get_ffprobe_data(source):
+        rendered["probed"].append(source)
+        return FFPROBE_DATA
+
+    def run_command(command, output, logger=None):
+        rendered["commands"].append(command)
+        rendered["loggers"].append(logger)
+        for path in output.split(", "):
+            open(path, "w").close()
+
+    monkeypatch.setattr(otio_burnin, "_get_ffprobe_data", get_ffprobe_data)
+    monkeypatch.setattr(otio_burnin, "_run_command", run_command)
+    monkeypatch.setattr(otio_burnin, "_FFPROBE_DATA_CACHE", {})
+    return rendered
+
+
+def _create_burnin_data(tmpdir, output_name, values):
+    input_path = str(tmpdir.join("input.mov"))
+    font_path = str(tmpdir.join("font.ttf"))
+    for path in (input_path, font_path):
+        if not os.path.exists(path):
+            open(path, "w").close()
+    return {
+        "input": input_path,
+        "output": str(tmpdir.join(output_name)),
+        "burnin_data": {
+            "frame_start": 1001,
+            "frame_end": 1100,
+            "shot": "sh010",
+        },
+        "options": {
+            "font": font_path,
+            "font_size": 42,
+            "font_color": "#FFFFFF",
+        },
+        "values": values,
+        "full_input_path": input_path,
+        "first_frame": None,
+        "ffmpeg_cmd": "",
+    }
+
+
+def test_outputs_share_ffmpeg_pass(rendered, tmpdir):
+    burnins_data = [
+        _create_burnin_data(tmpdir, "output_a.mov", {"top_left": "{shot}"}),
+        _create_burnin_data(
+            tmpdir, "output_b.mov", {"bottom_right": "{current_frame}"}
+        ),
+    ]
+
+    otio_burnin.render_burnins_from_data(burnins_data)
+
+    assert len(rendered["commands"]) == 1
+    command = rendered["commands"][0]
+    assert command.count("-i ") == 1
+    for burnin_data in burnins_data:
+        assert '"{}"'.format(burnin_data["output"]) in command
+        assert os.path.exists(burnin_data["output"])
+    # Input was probed only once
+    assert len(rendered["probed"]) == 1
+    # Source data were not modified
+    assert "resolution_width" not in burnins_data[0]["burnin_data"]
+
+
+def test_per_frame_text_rendered_separately(rendered, tmpdir):
+    burnins_data = [
+        _create_burnin_data(tmpdir, "output_a.mov", {"top_left": "{shot}"}),
+        _create_burnin_data(
+            tmpdir, "output_b.mov", {"top_left": "{custom[frames]}"}
+        ),
+    ]
+    burnins_data[1]["burnin_data"]["custom"] = {"frames": ["a", "b", "c"]}
+
+    otio_burnin.render_burnins_from_data(burnins_data)
+
+    assert len(rendered["commands"]) == 2
+    assert len(rendered["probed"]) == 1
+
+
+def test_output_logged_to_logger(rendered, tmpdir):
+    burnins_data = [
+        _create_burnin_data(tmpdir, "output_a.mov", {"top_left": "{shot}"}),
+        _create_burnin_data(
+            tmpdir, "output_b.mov", {"top_left": "{custom[frames]}"}
+        ),
+    ]
+    burnins_data[1]["burnin_data"]["custom"] = {"frames": ["a", "b", "c"]}
+    logger = logging.getLogger("test_otio_burnin")
+
+    otio_burnin.render_burnins_from_data(burnins_data, logger=logger)
+
+    assert rendered["loggers"] == [logger, logger]
+
+
+def test_failed_command_output(caplog):
+    command = subprocess.list2cmdline([
+        sys.executable,
+        "-c",
+        "import sys; print('frame=1'); sys.stderr.write('Invalid data')"
+        "; sys.exit(1)"
+    ])
+    logger = logging.getLogger("test_otio_burnin")
+
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        with pytest.raises(RuntimeError) as exc_info:
+            otio_burnin._run_command(command, "output.mov", logger)
+
+    assert "Invalid data" in str(exc_info.value)
+    assert "frame=1" in caplog.text
+    assert "Invalid data" in caplog.text
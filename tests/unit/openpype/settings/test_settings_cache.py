@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Test suite for memoization of resolved settings."""
+import pytest
+
+from openpype.settings import lib
+from openpype.settings.constants import (
+    M_OVERRIDDEN_KEY,
+    SYSTEM_SETTINGS_KEY,
+    PROJECT_SETTINGS_KEY,
+)
+
+
+@pytest.fixture
+def sources(monkeypatch):
+    """Overrides and local settings used to resolve settings."""
+    sources = {
+        "defaults": {
+            SYSTEM_SETTINGS_KEY: {"general": {"studio_name": "default"}},
+            PROJECT_SETTINGS_KEY: {
+                "global": {
+                    "fps": 25,
+                    "tags": ["a"],
+                    "sync_server": {"config": {}},
+                },
+                "maya": {"enabled": True},
+            },
+        },
+        "studio": {"global": {"fps": 30}},
+        "project": {
+            "maya": {M_OVERRIDDEN_KEY: ["enabled"], "enabled": False}
+        },
+        "local": {},
+        "resolved": [],
+    }
+
+    def get_default_settings_section(key):
+        sources["resolved"].append(key)
+        return lib.copy.deepcopy(sources["defaults"][key])
+
+    # Overrides are returned as new copies on each call as settings
+    #   handler does
+    monkeypatch.setattr(
+        lib, "_get_default_settings_section", get_default_settings_section
+    )
+    monkeypatch.setattr(
+        lib, "get_studio_system_settings_overrides",
+        lambda: {"general": {"studio_name": "studio"}}
+    )
+    monkeypatch.setattr(
+        lib, "get_studio_project_settings_overrides",
+        lambda: lib.copy.deepcopy(sources["studio"])
+    )
+    monkeypatch.setattr(
+        lib, "get_project_settings_overrides",
+        lambda project_name: lib.copy.deepcopy(sources["project"])
+    )
+    monkeypatch.setattr(
+        lib, "get_local_settings",
+        lambda: lib.copy.deepcopy(sources["local"])
+    )
+    monkeypatch.setattr(lib, "_RESOLVED_SETTINGS_CACHE", {})
+    return sources
+
+
+def test_settings_are_resolved_once(sources):
+    project_settings = lib._get_project_settings("demo")
+    assert project_settings["global"]["fps"] == 30
+    assert project_settings["maya"] == {"enabled": False}
+
+    assert lib._get_project_settings("demo") == project_settings
+    assert lib._get_system_settings()["general"]["studio_name"] == "studio"
+    lib._get_system_settings()
+    assert sources["resolved"] == [PROJECT_SETTINGS_KEY, SYSTEM_SETTINGS_KEY]
+
+    # Other project has own cache
+    lib._get_project_settings("other")
+    assert sources["resolved"][-1] == PROJECT_SETTINGS_KEY
+    assert len(sources["resolved"]) == 3
+
+
+def test_settings_cache_invalidation(sources):
+    lib._get_project_settings("demo")
+
+    sources["studio"]["global"]["fps"] = 24
+    assert lib._get_project_settings("demo")["global"]["fps"] == 24
+
+    sources["project"]["maya"]["enabled"] = True
+    assert lib._get_project_settings("demo")["maya"]["enabled"] is True
+
+    sources["local"] = {"projects": {"demo": {"active_site": "local"}}}
+    project_settings = lib._get_project_settings("demo")
+    assert len(sources["resolved"]) == 4
+    assert project_settings["global"]["sync_server"]["config"] == {
+        "active_site": "local"
+    }
+
+    lib._get_project_settings("demo")
+    assert len(sources["resolved"]) == 4
+
+
+def test_returned_settings_are_copies(sources):
+    project_settings = lib._get_project_settings("demo")
+    project_settings["global"]["fps"] = 1
+    project_settings["global"]["tags"].append("b")
+    project_settings.pop("maya")
+
+    project_settings = lib._get_project_settings("demo")
+    assert project_settings["global"]["fps"] == 30
+    assert project_settings["global"]["tags"] == ["a"]
+    assert project_settings["maya"] == {"enabled": False}
+    assert len(sources["resolved"]) == 1
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Test suite for settings snapshot files."""
+import gzip
+import json
+
+import pytest
+
+from openpype.settings import lib
+from openpype.settings.constants import SETTINGS_SNAPSHOT_ENV_KEY
+
+
+@pytest.fixture
+def queried(monkeypatch):
+    queried = []
+
+    def _get_system_settings(*args, **kwargs):
+        queried.append("system")
+        return {"general": {"environment": {"KEY": "value"}}}
+
+    def _get_project_settings(project_name, *args, **kwargs):
+        queried.append(project_name)
+        return {"global": {"project": project_name}}
+
+    def get_anatomy_settings(project_name, *args, **kwargs):
+        return {"roots": {"work": {"linux": "/mnt/work"}}}
+
+    monkeypatch.setattr(lib, "AYON_SERVER_ENABLED", False)
+    monkeypatch.setattr(lib, "_get_system_settings", _get_system_settings)
+    monkeypatch.setattr(lib, "_get_project_settings", _get_project_settings)
+    monkeypatch.setattr(lib, "get_anatomy_settings", get_anatomy_settings)
+    monkeypatch.setattr(lib, "_SETTINGS_SNAPSHOT", None)
+    monkeypatch.delenv(SETTINGS_SNAPSHOT_ENV_KEY, raising=False)
+    return queried
+
+
+def test_snapshot_settings(tmp_path, queried):
+    filepath = str(tmp_path / "render_settings.json.gz")
+    lib.create_settings_snapshot("demo", filepath)
+    assert queried == ["system", "demo"]
+
+    assert lib.load_settings_snapshot(filepath)
+    del queried[:]
+
+    project_settings = lib.get_project_settings("demo")
+    assert project_settings == {"global": {"project": "demo"}}
+    # Returned values are copies
+    project_settings["global"]["project"] = "changed"
+    assert lib.get_project_settings("demo")["global"]["project"] == "demo"
+
+    assert lib.get_system_settings()["general"]["environment"] == {
+        "KEY": "value"
+    }
+    assert lib.get_general_environments() == {"KEY": "value"}
+    assert queried == []
+
+    # Other projects and settings with metadata are still queried
+    lib.get_project_settings("other")
+    lib.get_system_settings(clear_metadata=False)
+    assert queried == ["other", "system"]
+
+
+def test_snapshot_from_environment(tmp_path, queried, monkeypatch):
+    filepath = str(tmp_path / "render_settings.json.gz")
+    lib.create_settings_snapshot("demo", filepath)
+    del queried[:]
+
+    monkeypatch.setenv(SETTINGS_SNAPSHOT_ENV_KEY, filepath)
+    lib.get_project_settings("demo")
+    assert queried == []
+
+
+def test_snapshot_unsupported_version(tmp_path, queried):
+    filepath = str(tmp_path / "render_settings.json.gz")
+    with gzip.open(filepath, "wb") as stream:
+        stream.write(json.dumps({"version": 0}).encode("utf-8"))
+
+    assert not lib.load_settings_snapshot(filepath)
+    lib.get_project_settings("demo")
+    assert queried == ["demo"]
+
+
+def test_snapshot_from_rootless_path(tmp_path, queried, monkeypatch):
+    from openpype import pipeline
+    from openpype.pype_commands import PypeCommands
+
+    filepath = str(tmp_path / "render_settings.json.gz")
+    lib.create_settings_snapshot("demo", filepath)
+    del queried[:]
+
+    class Anatomy(object):
+        def __init__(self, project_name):
+            self.roots = {"work": str(tmp_path)}
+
+        def fill_root(self, template_path):
+            return template_path.format(root=self.roots)
+
+    monkeypatch.setattr(pipeline, "Anatomy", Anatomy, raising=False)
+    monkeypatch.setenv("AVALON_PROJECT", "demo")
+    rootless_path = "{root[work]}/render_settings.json.gz"
+
+    snapshot_path = PypeCommands._fill_settings_snapshot_root(rootless_path)
+
+    assert snapshot_path == filepath
+    assert lib.load_settings_snapshot(snapshot_path)
+    lib.get_project_settings("demo")
+    assert queried == []
@@ -0,0 +1,57 @@
+"""Test file for limits of nested cache items."""
+from openpype.tools.ayon_utils.models.cache import (
+    CacheStore,
+    NestedCacheItem,
+    estimate_size,
+)
+
+
+def test_max_items_eviction(monkeypatch):
+    monkeypatch.setattr(CacheStore, "protect_time", 0)
+    evicted = []
+    cache = NestedCacheItem(
+        levels=2,
+        max_items=2,
+        eviction_callback=lambda keys, data: evicted.append((keys, data))
+    )
+    cache["project"]["a"] = 1
+    cache["project"]["b"] = 2
+    # Use 'a' so 'b' is least recently used
+    assert cache["project"]["a"].is_valid
+    cache["project"]["c"] = 3
+
+    assert evicted == [(("project", "b"), 2)]
+    assert cache["project"].cached_count() == 2
+    assert not cache["project"]["b"].is_valid
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 2
+    assert stats["items"] == 2
+
+
+def test_recently_used_items_are_protected():
+    cache = NestedCacheItem(levels=1, max_items=2)
+    for key in range(5):
+        cache[key] = key
+
+    assert cache.cached_count() == 5
+    assert all(cache[key].get_data() == key for key in range(5))
+
+
+def test_max_bytes_and_reset(monkeypatch):
+    monkeypatch.setattr(CacheStore, "protect_time", 0)
+    value_size = estimate_size("x" * 1000)
+    cache = NestedCacheItem(levels=1, max_bytes=value_size * 2)
+    cache["a"] = "x" * 1000
+    cache["b"] = "y" * 1000
+    cache["c"] = "z" * 1000
+
+    assert cache.cached_count() == 2
+    assert not cache["a"].is_valid
+    assert cache.get_stats()["bytes"] == value_size * 2
+
+    cache.reset()
+    assert cache.get_stats()["items"] == 0
+    assert cache.get_stats()["bytes"] == 0